@@ -6,11 +6,15 @@ the discovered real API endpoints rather than HTML parsing.
 
 The service handles:
 - Authentication via web login
-- Session management with cookies
+- Session management with cookies over a pooled async HTTP client
 - API calls to real data endpoints
 - Rate limiting and error handling
 - Data extraction and parsing
 
+Dependencies are listed in ``skuvault_web_service_requirements.txt``;
+``ijson`` is required for ``stream_session_directions`` to stream (without
+it the method falls back to a buffered request).
+
 Example:
     ```python
     from jerky_data_hub.services.skuvault_web_service import SkuVaultWebService
@@ -26,18 +30,60 @@ Example:
 """
 
 import asyncio
+import copy
+import email.utils
+import functools
+import gzip
+import hashlib
 import json
+import os
+import random
+import socket
+import sqlite3
+import threading
 import time
+import urllib.request
 import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+import weakref
+import zlib
+from collections import Counter, OrderedDict, deque
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from enum import Enum
+from typing import (Any, AsyncIterator, Awaitable, Callable, Deque, Dict,
+                    Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING,
+                    Union)
 
 if TYPE_CHECKING:
     from jerky_data_hub.models.skuvault.sessions import SessionOrder
+    from jerky_data_hub.services.marketplace_id_parser import MarketplaceIdParser
 
-import requests
+import httpcore
+import httpx
 from bs4 import BeautifulSoup
 
+try:
+    import h2  # noqa: F401  # Enables HTTP/2 support in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:
+    redis_asyncio = None
+
 from jerky_data_hub.models.logging import (
     ErrorContext,
     ErrorDetail,
@@ -46,6 +92,7 @@ from jerky_data_hub.models.logging import (
     ServiceDetails
 )
 from jerky_data_hub.models.skuvault.directions import (DirectionsResponse,
+                                                       HistoryItem, Order,
                                                        ParsedDirection)
 from jerky_data_hub.models.skuvault.sessions import (ParsedSession,
                                                      SessionOrder,
@@ -58,66 +105,328 @@ from jerky_data_hub.services.token_cache_service import TokenCacheService
 
 
 class DirectionsCache:
-    """In-memory cache for directions responses by picklist ID.
+    """In-memory LRU cache for directions responses by picklist ID.
+
+    Each entry holds the raw response body and, once it has been parsed,
+    the parsed directions and history, so a cache hit costs a dictionary
+    lookup rather than a re-parse. Entries are kept in recency order, so
+    lookups, inserts and evictions are all O(1).
 
-    This cache stores parsed directions and history data to avoid
-    redundant API calls for the same picklist ID within a session.
+    The TTL of an entry depends on the state of its session as last seen by
+    ``observe_state``: closed sessions never change, so they can be kept
+    indefinitely, while active sessions expire quickly. An entry is dropped
+    as soon as its session is seen in a different state.
+
+    Besides the entry count, the cache can be bounded by an approximate byte
+    budget. Raw bodies can optionally be zlib-compressed at rest.
 
     Attributes:
-        _cache: Dictionary mapping picklist_id to cached data
+        _cache: Ordered mapping of picklist_id to cached entry, least
+            recently used first
         _max_size: Maximum number of cached items
-        _ttl_seconds: Time-to-live for cached items in seconds
+        _max_bytes: Approximate memory budget in bytes, or None for no limit
+        _ttl_seconds: Default time-to-live for cached items in seconds
+        _state_ttls: Per-session-state TTL overrides; None never expires
+        _session_states: Last observed session state per picklist ID
     """
 
-    def __init__(self, max_size: int = 100, ttl_seconds: int = 3600):
+    # Approximate in-memory size of one ParsedDirection or HistoryItem
+    PARSED_RECORD_BYTES = 1500
+
+    # Number of picklists whose fetch counts are tracked
+    MAX_TRACKED_FETCHES = 1000
+
+    def __init__(
+        self,
+        max_size: int = 100,
+        ttl_seconds: int = 3600,
+        state_ttls: Optional[Dict[SessionState, Optional[float]]] = None,
+        max_bytes: Optional[int] = None,
+        compress: bool = False,
+        compression_level: int = 1,
+    ):
         """Initialize the directions cache.
 
         Args:
             max_size: Maximum number of cached items (default: 100)
             ttl_seconds: Time-to-live for cached items in seconds (default: 1 hour)
+            state_ttls: TTL overrides by session state; a value of None means
+                entries in that state never expire
+            max_bytes: Approximate memory budget for all entries, or None
+            compress: Whether to keep raw bodies zlib-compressed at rest
+            compression_level: zlib level used when compressing (1-9)
         """
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self._max_size = max_size
+        self._max_bytes = max_bytes
         self._ttl_seconds = ttl_seconds
-
-    def get(self, picklist_id: str) -> Optional[Dict[str, Any]]:
-        """Get cached directions data for a picklist ID.
+        self._state_ttls: Dict[SessionState, Optional[float]] = dict(state_ttls or {})
+        self._session_states: "OrderedDict[str, SessionState]" = OrderedDict()
+        self._max_tracked_states = max_size * 10
+
+        self._compress = compress
+        self._compression_level = compression_level
+        self._bytes_used = 0
+        self._raw_bytes = 0
+        self._stored_bytes = 0
+        self._rejected_oversized = 0
+
+        # Telemetry
+        self._hits = 0
+        self._parsed_hits = 0
+        self._misses = 0
+        self._evictions: Counter = Counter()
+        self._fetches = 0
+        self._refetches = 0
+        self._total_fetch_seconds = 0.0
+        self._parses = 0
+        self._total_parse_seconds = 0.0
+        self._fetch_counts: "OrderedDict[str, int]" = OrderedDict()
+
+    def __contains__(self, picklist_id: str) -> bool:
+        """Check for a live entry without counting a lookup or touching recency."""
+        cached_item = self._cache.get(picklist_id)
+        return cached_item is not None and not self._is_expired(cached_item, time.time())
+
+    def _get_ttl(self, state: Optional[SessionState]) -> Optional[float]:
+        """Get the TTL that applies to entries in a session state."""
+        if state is None:
+            return self._ttl_seconds
+        return self._state_ttls.get(state, self._ttl_seconds)
+
+    def get_ttl_for(self, picklist_id: str) -> Optional[float]:
+        """Get the TTL that applies to a picklist given its last seen session state.
 
         Args:
-            picklist_id: The picklist ID to retrieve
+            picklist_id: The picklist ID
 
         Returns:
-            Cached data if valid and not expired, None otherwise
+            TTL in seconds, or None if entries for it never expire
         """
-        if picklist_id not in self._cache:
-            return None
+        return self._get_ttl(self._session_states.get(picklist_id))
 
-        cached_item = self._cache[picklist_id]
-        current_time = time.time()
+    def _is_expired(self, cached_item: Dict[str, Any], current_time: float) -> bool:
+        """Check an entry against the TTL for its session state."""
+        ttl = self._get_ttl(cached_item["state"])
+        return ttl is not None and current_time - cached_item["timestamp"] > ttl
+
+    def _entry_size(self, cached_item: Dict[str, Any]) -> int:
+        """Approximate the memory held by an entry."""
+        size = len(cached_item["data"])
+        if cached_item["parsed"]:
+            directions, history = cached_item["parsed"]
+            size += (len(directions) + len(history)) * self.PARSED_RECORD_BYTES
+        return size
+
+    def _remove(self, picklist_id: str, reason: Optional[str] = None) -> None:
+        """Remove an entry and release its bytes.
+
+        Args:
+            picklist_id: The picklist ID to remove
+            reason: Eviction reason to count, or None for a replacement
+        """
+        cached_item = self._cache.pop(picklist_id, None)
+        if cached_item is not None:
+            if reason:
+                self._evictions[reason] += 1
+            self._bytes_used -= cached_item["size"]
+            self._raw_bytes -= cached_item["raw_size"]
+            self._stored_bytes -= len(cached_item["data"])
+
+    def _resize(self, picklist_id: str, cached_item: Dict[str, Any]) -> None:
+        """Re-account an entry's size and evict until the budgets are met."""
+        self._bytes_used -= cached_item["size"]
+        cached_item["size"] = self._entry_size(cached_item)
+        self._bytes_used += cached_item["size"]
+
+        if self._max_bytes is not None and cached_item["size"] > self._max_bytes:
+            # An entry larger than the whole budget keeps only its raw body,
+            # or is not kept at all if even that does not fit
+            self._rejected_oversized += 1
+            if cached_item["parsed"] and len(cached_item["data"]) <= self._max_bytes:
+                cached_item["parsed"] = None
+                self._resize(picklist_id, cached_item)
+            else:
+                self._remove(picklist_id, "oversized")
+            return
+
+        while len(self._cache) > self._max_size:
+            self._evict_oldest("size")
+        while self._max_bytes is not None and self._bytes_used > self._max_bytes:
+            self._evict_oldest("memory")
+
+    def _get_entry(self, picklist_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a live entry and mark it as most recently used."""
+        cached_item = self._cache.get(picklist_id)
+        if cached_item is None:
+            return None
 
         # Check if item has expired
-        if current_time - cached_item["timestamp"] > self._ttl_seconds:
+        if self._is_expired(cached_item, time.time()):
             # Remove expired item
-            del self._cache[picklist_id]
+            self._remove(picklist_id, "expired")
+            return None
+
+        self._cache.move_to_end(picklist_id)
+        return cached_item
+
+    def get(self, picklist_id: str) -> Optional[bytes]:
+        """Get the cached raw directions response for a picklist ID.
+
+        Args:
+            picklist_id: The picklist ID to retrieve
+
+        Returns:
+            Cached response body if valid and not expired, None otherwise
+        """
+        cached_item = self._get_entry(picklist_id)
+        if cached_item is None:
+            self._misses += 1
             return None
+        self._hits += 1
+        return self._decode(cached_item)
 
+    def _decode(self, cached_item: Dict[str, Any]) -> bytes:
+        """Get an entry's raw body, decompressing it if needed."""
+        if cached_item["compressed"]:
+            return zlib.decompress(cached_item["data"])
         return cached_item["data"]
 
-    def set(self, picklist_id: str, data: Dict[str, Any]) -> None:
-        """Cache directions data for a picklist ID.
+    def lookup(
+        self, picklist_id: str
+    ) -> Optional[Tuple[bytes, Optional[Tuple[List[ParsedDirection], List[HistoryItem]]]]]:
+        """Look up an entry, preferring its parse result.
 
         Args:
-            picklist_id: The picklist ID to cache
-            data: The directions data to cache
+            picklist_id: The picklist ID to retrieve
+
+        Returns:
+            Tuple of (raw body, parse result or None) if the entry is live,
+            None otherwise. The raw body is empty when a parse result exists,
+            so hits on parsed entries never decompress.
+        """
+        cached_item = self._get_entry(picklist_id)
+        if cached_item is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        if cached_item["parsed"] is not None:
+            self._parsed_hits += 1
+            return b"", cached_item["parsed"]
+        return self._decode(cached_item), None
+
+    def record_fetch(self, picklist_id: str, latency_seconds: float) -> None:
+        """Record a fetch caused by a cache miss.
+
+        Args:
+            picklist_id: The picklist that was fetched
+            latency_seconds: How long the fetch took
+        """
+        self._fetches += 1
+        self._total_fetch_seconds += latency_seconds
+
+        count = self._fetch_counts.pop(picklist_id, 0)
+        if count:
+            self._refetches += 1
+        self._fetch_counts[picklist_id] = count + 1
+        if len(self._fetch_counts) > self.MAX_TRACKED_FETCHES:
+            self._fetch_counts.popitem(last=False)
+
+    def record_parse(self, latency_seconds: float) -> None:
+        """Record how long parsing one response took.
+
+        Args:
+            latency_seconds: Parse duration
         """
-        # Implement LRU eviction if cache is full
-        if len(self._cache) >= self._max_size:
-            self._evict_oldest()
+        self._parses += 1
+        self._total_parse_seconds += latency_seconds
+
+    def set(
+        self,
+        picklist_id: str,
+        data: bytes,
+        parsed: Optional[Tuple[List[ParsedDirection], List[HistoryItem]]] = None,
+    ) -> None:
+        """Cache the directions response for a picklist ID.
 
-        self._cache[picklist_id] = {
-            "data": data,
+        Args:
+            picklist_id: The picklist ID to cache
+            data: The raw directions response body
+            parsed: Optional (directions, history) parsed from ``data``
+        """
+        self._remove(picklist_id)
+
+        stored = zlib.compress(data, self._compression_level) if self._compress else data
+        cached_item = {
+            "data": stored,
+            "compressed": self._compress,
+            "raw_size": len(data),
+            "size": 0,
+            "parsed": parsed,
+            "state": self._session_states.get(picklist_id),
             "timestamp": time.time(),
         }
+        self._cache[picklist_id] = cached_item
+        self._raw_bytes += len(data)
+        self._stored_bytes += len(stored)
+        self._resize(picklist_id, cached_item)
+
+    def set_parsed(
+        self,
+        picklist_id: str,
+        parsed: Tuple[List[ParsedDirection], List[HistoryItem]],
+    ) -> None:
+        """Attach a parse result to an existing entry.
+
+        The entry's age is left unchanged, so parsing does not extend its TTL.
+
+        Args:
+            picklist_id: The picklist ID the result belongs to
+            parsed: Tuple of (directions, history)
+        """
+        cached_item = self._cache.get(picklist_id)
+        if cached_item is not None:
+            cached_item["parsed"] = parsed
+            self._resize(picklist_id, cached_item)
+
+    def observe_state(self, picklist_id: str, state: SessionState) -> bool:
+        """Record the current state of a picklist's session.
+
+        Args:
+            picklist_id: The session's picklist ID
+            state: The session state just seen in a sessions response
+
+        Returns:
+            True if a cached entry was invalidated because the state changed
+        """
+        self._session_states[picklist_id] = state
+        self._session_states.move_to_end(picklist_id)
+        if len(self._session_states) > self._max_tracked_states:
+            self._session_states.popitem(last=False)
+
+        cached_item = self._cache.get(picklist_id)
+        if cached_item is None:
+            return False
+
+        if cached_item["state"] is not None and cached_item["state"] != state:
+            self._remove(picklist_id, "state_change")
+            return True
+
+        cached_item["state"] = state
+        return False
+
+    def set_ttl(self, ttl_seconds: Optional[float], state: Optional[SessionState] = None) -> None:
+        """Change a TTL; the new value applies to existing entries as well.
+
+        Args:
+            ttl_seconds: New TTL in seconds, or None to never expire (state TTLs only)
+            state: Session state to change the TTL for, or None for the default
+        """
+        if state is None:
+            self._ttl_seconds = ttl_seconds
+        else:
+            self._state_ttls[state] = ttl_seconds
 
     def invalidate(self, picklist_id: str) -> None:
         """Invalidate cached data for a specific picklist ID.
@@ -125,20 +434,71 @@ class DirectionsCache:
         Args:
             picklist_id: The picklist ID to invalidate
         """
-        if picklist_id in self._cache:
-            del self._cache[picklist_id]
+        self._remove(picklist_id, "invalidated")
+
+    def export_entries(self) -> List[Dict[str, Any]]:
+        """Export live entries for a warm-restart snapshot.
+
+        Parse results are not exported; they are rebuilt on the first hit.
+
+        Returns:
+            Entries from least to most recently used, each with the
+            picklist ID, raw body, wall-clock timestamp and session state
+        """
+        current_time = time.time()
+        return [
+            {
+                "picklist_id": picklist_id,
+                "data": (
+                    zlib.decompress(item["data"]) if item["compressed"] else item["data"]
+                ),
+                "timestamp": item["timestamp"],
+                "state": item["state"],
+            }
+            for picklist_id, item in self._cache.items()
+            if not self._is_expired(item, current_time)
+        ]
+
+    def import_entries(self, entries: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """Load entries exported by ``export_entries``, keeping their age.
+
+        Args:
+            entries: Exported entries, least recently used first
+
+        Returns:
+            Tuple of (entries loaded, expired entries dropped)
+        """
+        current_time = time.time()
+        loaded = dropped = 0
+
+        for entry in entries:
+            picklist_id = entry["picklist_id"]
+            if entry["state"] is not None:
+                self._session_states[picklist_id] = entry["state"]
+            probe = {"state": entry["state"], "timestamp": entry["timestamp"]}
+            if self._is_expired(probe, current_time):
+                dropped += 1
+                continue
+
+            self.set(picklist_id, entry["data"])
+            cached_item = self._cache.get(picklist_id)
+            if cached_item is not None:
+                cached_item["timestamp"] = entry["timestamp"]
+                loaded += 1
+
+        return loaded, dropped
 
     def clear(self) -> None:
         """Clear all cached data."""
         self._cache.clear()
+        self._bytes_used = 0
+        self._raw_bytes = 0
+        self._stored_bytes = 0
 
-    def _evict_oldest(self) -> None:
-        """Evict the oldest cached item based on timestamp."""
-        if not self._cache:
-            return
-
-        oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k]["timestamp"])
-        del self._cache[oldest_key]
+    def _evict_oldest(self, reason: str) -> None:
+        """Evict the least recently used cached item."""
+        if self._cache:
+            self._remove(next(iter(self._cache)), reason)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics for monitoring.
@@ -148,286 +508,3019 @@ class DirectionsCache:
         """
         current_time = time.time()
         expired_count = sum(
-            1
+            1 for item in self._cache.values() if self._is_expired(item, current_time)
+        )
+        items_by_state = Counter(
+            item["state"].value if item["state"] else "unknown"
             for item in self._cache.values()
-            if current_time - item["timestamp"] > self._ttl_seconds
         )
 
         return {
             "total_items": len(self._cache),
+            "parsed_items": sum(1 for item in self._cache.values() if item["parsed"]),
             "max_size": self._max_size,
             "expired_items": expired_count,
+            "items_by_state": dict(items_by_state),
+            "ttl_seconds": self._ttl_seconds,
+            "state_ttl_seconds": {
+                state.value: ttl for state, ttl in self._state_ttls.items()
+            },
             "utilization_percent": (len(self._cache) / self._max_size) * 100,
+            "bytes_used": self._bytes_used,
+            "max_bytes": self._max_bytes,
+            "bytes_utilization_percent": (
+                (self._bytes_used / self._max_bytes) * 100 if self._max_bytes else None
+            ),
+            "avg_entry_bytes": (
+                self._bytes_used / len(self._cache) if self._cache else 0
+            ),
+            "compressed": self._compress,
+            "raw_body_bytes": self._raw_bytes,
+            "stored_body_bytes": self._stored_bytes,
+            "compression_ratio": (
+                self._raw_bytes / self._stored_bytes if self._stored_bytes else None
+            ),
+            "rejected_oversized": self._rejected_oversized,
+            **self._get_telemetry(),
         }
 
+    def _get_telemetry(self) -> Dict[str, Any]:
+        """Get hit, eviction and fetch counters with a time-saved estimate."""
+        lookups = self._hits + self._misses
+        avg_fetch_seconds = (
+            self._total_fetch_seconds / self._fetches if self._fetches else 0.0
+        )
+        avg_parse_seconds = (
+            self._total_parse_seconds / self._parses if self._parses else 0.0
+        )
+        # Every hit saves a fetch; hits on parsed entries also save a parse
+        time_saved_seconds = (
+            self._hits * avg_fetch_seconds + self._parsed_hits * avg_parse_seconds
+        )
+        top_fetched = sorted(
+            self._fetch_counts.items(), key=lambda item: item[1], reverse=True
+        )[:10]
 
-class SkuVaultWebService:
-    """Service for SkuVault web interface integration using discovered API endpoints."""
-
-    def __init__(self):
-        """Initialize the web service."""
-        self.settings = Settings.get()
-        self.session = requests.Session()
-        self.logger = CloudLoggingService("skuvault.web")
-        self.is_authenticated = False
-        self.auth_token = None
+        return {
+            "hits": self._hits,
+            "parsed_hits": self._parsed_hits,
+            "misses": self._misses,
+            "hit_ratio": self._hits / lookups if lookups else 0.0,
+            "evictions": sum(self._evictions.values()),
+            "evictions_by_reason": dict(self._evictions),
+            "fetches": self._fetches,
+            "refetches": self._refetches,
+            "avg_fetch_latency_ms": avg_fetch_seconds * 1000,
+            "avg_parse_ms": avg_parse_seconds * 1000,
+            "estimated_time_saved_ms": time_saved_seconds * 1000,
+            "top_fetched_picklists": [
+                {"picklist_id": picklist_id, "fetches": count}
+                for picklist_id, count in top_fetched
+                if count > 1
+            ],
+        }
 
-        # Initialize token cache service
-        self.token_cache = TokenCacheService()
 
-        # Initialize directions cache
-        self.directions_cache = DirectionsCache(
-            max_size=self.settings.skuvault.scraping.cache.max_directions_cache_size,
-            ttl_seconds=self.settings.skuvault.scraping.cache.directions_cache_ttl_seconds,
-        )
+class SQLiteCacheBackend:
+    """Shared cache store in a local SQLite file.
 
-        # Initialize CORS preflight cache for efficiency
-        self.cors_preflight_cache = {}
-        self.cors_preflight_ttl = 300  # 5 minutes TTL for preflight responses
+    Every worker process on the host opens the same file, which makes it a
+    cross-process cache tier without running a server. Blocking SQLite calls
+    run in a worker thread so they do not stall the event loop.
+    """
 
-        # Configure session with base headers
-        self.session.headers.update(
-            {
-                "User-Agent": self.settings.skuvault.scraping.web.user_agent,
-                "Accept": "application/json, text/plain, */*",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Connection": "keep-alive",
-                "Sec-Fetch-Dest": "empty",
-                "Sec-Fetch-Mode": "cors",
-                "Sec-Fetch-Site": "same-site",
-            }
-        )
+    name = "sqlite"
 
-    def _get_all_session_states(self) -> List[str]:
-        """Get all valid session states for API requests.
+    def __init__(self, path: str):
+        """Open (and create if needed) the cache database.
 
-        Returns:
-            List of session state string values for API consumption
+        Args:
+            path: Path of the SQLite database file
         """
-        return [state.value for state in SessionState]
+        self.path = path
+        self._lock = threading.Lock()
+        self._sets_since_purge = 0
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS counters ("
+                "key TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            self._conn.commit()
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time()),
+            ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def _set(self, key: str, value: bytes, ttl_seconds: Optional[float]) -> None:
+        expires_at = time.time() + ttl_seconds if ttl_seconds is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+            self._sets_since_purge += 1
+            if self._sets_since_purge >= 100:
+                self._sets_since_purge = 0
+                self._conn.execute(
+                    "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                    (time.time(),),
+                )
+            self._conn.commit()
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def _get_counter(self, key: str) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM counters WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def _incr(self, key: str) -> int:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO counters (key, value) VALUES (?, 1) "
+                "ON CONFLICT(key) DO UPDATE SET value = value + 1",
+                (key,),
+            )
+            row = self._conn.execute(
+                "SELECT value FROM counters WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.commit()
+        return row[0]
+
+    def _acquire(self, key: str, owner: bytes, ttl_seconds: float) -> bool:
+        now = time.time()
+        with self._lock:
+            # Both statements run in one write transaction, so only one
+            # process can take an expired or missing lease
+            self._conn.execute(
+                "DELETE FROM cache WHERE key = ? AND expires_at IS NOT NULL AND expires_at <= ?",
+                (key, now),
+            )
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, owner, now + ttl_seconds),
+            )
+            self._conn.commit()
+        return cursor.rowcount == 1
 
-    def get_session_states_by_names(self, state_names: List[str]) -> List[str]:
-        """Get session state values by their names or values, with validation.
+    def _release(self, key: str, owner: bytes) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ? AND value = ?", (key, owner))
+            self._conn.commit()
 
-        This method accepts both enum names (e.g., "READY_TO_SHIP") and enum values (e.g., "readyToShip")
-        and converts them to the appropriate string values for API consumption.
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a live value, or None if missing or expired."""
+        return await asyncio.to_thread(self._get, key)
 
-        Args:
-            state_names: List of state names or values to convert to API values
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[float]) -> None:
+        """Store a value; a TTL of None never expires."""
+        await asyncio.to_thread(self._set, key, value, ttl_seconds)
 
-        Returns:
-            List of validated session state string values
+    async def delete(self, key: str) -> None:
+        """Delete a value if present."""
+        await asyncio.to_thread(self._delete, key)
 
-        Raises:
-            ValueError: If any state name or value is invalid
-        """
-        valid_states = []
-        for name in state_names:
-            try:
-                # First try to find state by name (case-insensitive)
-                state = next(
-                    (s for s in SessionState if s.name.lower() == name.lower()), None
-                )
+    async def get_counter(self, key: str) -> int:
+        """Read a counter, 0 if it was never incremented."""
+        return await asyncio.to_thread(self._get_counter, key)
 
-                # If not found by name, try to find by value (case-insensitive)
-                if not state:
-                    state = next(
-                        (s for s in SessionState if s.value.lower() == name.lower()), None
-                    )
+    async def incr(self, key: str) -> int:
+        """Atomically increment a counter and return its new value."""
+        return await asyncio.to_thread(self._incr, key)
 
-                if state:
-                    valid_states.append(state.value)
-                else:
-                    raise ValueError(f"Invalid session state: {name}")
-            except Exception as e:
-                raise ValueError(f"Invalid session state '{name}': {e}")
+    async def acquire(self, key: str, owner: bytes, ttl_seconds: float) -> bool:
+        """Take a lease unless another owner holds an unexpired one."""
+        return await asyncio.to_thread(self._acquire, key, owner, ttl_seconds)
 
-        return valid_states
+    async def release(self, key: str, owner: bytes) -> None:
+        """Release a lease if ``owner`` still holds it."""
+        await asyncio.to_thread(self._release, key, owner)
 
-    def validate_session_state(self, state_value: str) -> bool:
-        """Validate if a session state value is valid.
+    async def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
 
-        Args:
-            state_value: The state value to validate
 
-        Returns:
-            True if valid, False otherwise
-        """
-        try:
-            SessionState(state_value)
-            return True
-        except ValueError:
-            return False
+class RedisCacheBackend:
+    """Shared cache store on a Redis-protocol server (Redis, Valkey, KeyDB).
 
-    async def __aenter__(self):
-        """Async context manager entry."""
-        return self
+    Unlike the SQLite backend this also shares entries between hosts.
+    Requires the ``redis`` package.
+    """
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        self.logout()
+    name = "redis"
 
-    async def login(self) -> bool:
-        """Authenticate with SkuVault web interface.
+    # Deletes a lease only if it still belongs to the caller
+    _RELEASE_SCRIPT = (
+        "if redis.call('get', KEYS[1]) == ARGV[1] then "
+        "return redis.call('del', KEYS[1]) else return 0 end"
+    )
 
-        Returns:
-            True if login successful, False otherwise
+    def __init__(self, url: str):
+        """Create the client; connections are opened lazily.
+
+        Args:
+            url: Server URL, e.g. ``redis://localhost:6379/0``
+
+        Raises:
+            RuntimeError: If the redis package is not installed
         """
-        try:
-            # First check if we have a valid cached token
-            if await self.check_cached_token():
-                self.logger.info(
-                    LogContext(
-                        step="login",
-                        action="cached_token_used",
-                        details=ServiceDetails(
-                            status="success"
-                        ),
-                    )
-                )
-                return True
+        if redis_asyncio is None:
+            raise RuntimeError("The redis package is required for the redis cache backend")
+        self.url = url
+        self._client = redis_asyncio.Redis.from_url(url)
 
-            self.logger.info(
-                LogContext(
-                    step="login",
-                    action="start_login",
-                    details=ServiceDetails(
-                        status="starting"
-                    ),
-                )
-            )
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a live value, or None if missing or expired."""
+        return await self._client.get(key)
 
-            # Get login page to extract form data
-            login_response = await self._make_request(
-                "GET",
-                str(self.settings.skuvault.scraping.web.login_url),
-                "get_login_page",
-            )
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[float]) -> None:
+        """Store a value; a TTL of None never expires."""
+        px = max(1, int(ttl_seconds * 1000)) if ttl_seconds is not None else None
+        await self._client.set(key, value, px=px)
 
-            if not login_response:
-                self.logger.error(
-                    ErrorContext(
-                        error=ErrorDetail(
-                            type="RequestError",
-                            message="Failed to get login page",
-                            traceback="",
-                        ),
-                        details=ErrorDetails(
-                            step="login",
-                            action="get_login_page_failed",
-                            error_type="request_error"
-                        ),
-                    )
-                )
-                return False
+    async def delete(self, key: str) -> None:
+        """Delete a value if present."""
+        await self._client.delete(key)
 
-            # Parse login form
-            soup = BeautifulSoup(login_response.text, "lxml")
-            form = soup.find("form")
+    async def get_counter(self, key: str) -> int:
+        """Read a counter, 0 if it was never incremented."""
+        value = await self._client.get(key)
+        return int(value) if value is not None else 0
 
-            if not form:
-                self.logger.error(
-                    ErrorContext(
-                        error=ErrorDetail(
-                            type="ParseError",
-                            message="Login form not found on page",
-                            traceback="",
-                        ),
-                        details=ErrorDetails(
-                            step="login",
-                            action="form_not_found",
-                            error_type="parse_error"
-                        ),
-                    )
-                )
-                return False
+    async def incr(self, key: str) -> int:
+        """Atomically increment a counter and return its new value."""
+        return await self._client.incr(key)
 
-            self.logger.info(
-                LogContext(
-                    step="login",
-                    action="form_found",
-                    details=ServiceDetails(
-                        status="success"
-                    ),
-                )
-            )
+    async def acquire(self, key: str, owner: bytes, ttl_seconds: float) -> bool:
+        """Take a lease unless another owner holds an unexpired one."""
+        px = max(1, int(ttl_seconds * 1000))
+        return bool(await self._client.set(key, owner, nx=True, px=px))
 
-            # Prepare login data
-            login_data = {
-                "Email": self.settings.skuvault.scraping.web.username,
-                "Password": self.settings.skuvault.scraping.web.password,
-            }
+    async def release(self, key: str, owner: bytes) -> None:
+        """Release a lease if ``owner`` still holds it."""
+        await self._client.eval(self._RELEASE_SCRIPT, 1, key, owner)
 
-            # Submit login form
-            login_response = await self._make_request(
-                "POST",
-                str(self.settings.skuvault.scraping.web.login_url),
-                "submit_login",
-                data=login_data,
-            )
+    async def close(self) -> None:
+        """Close the client's connections."""
+        await self._client.aclose()
 
-            if not login_response:
-                return False
 
-            # Check if login was successful
-            success = self._is_login_successful(login_response)
+class LeaseUnavailableError(Exception):
+    """Raised when the shared cache store cannot be asked for a lease."""
 
-            if success:
-                self.is_authenticated = True
-                self._extract_auth_token()
 
-                # Store token in cache if extraction was successful
-                if self.auth_token:
-                    await self._store_token_in_cache()
+class SharedCache:
+    """Cross-process cache tier for directions and sessions responses.
 
-                self.logger.info(
+    Sits behind each worker's in-memory ``DirectionsCache``: a local miss is
+    looked up here before calling SkuVault, and every fetch is written
+    through, so N workers fetch a picklist once instead of N times. Keys carry
+    a per-namespace version; bumping it invalidates every entry in the
+    namespace for all workers at once. Each value records the process that
+    wrote it so cross-worker hits can be counted. The store also provides
+    named leases, used to let one worker log in on behalf of all of them.
+    """
+
+    DIRECTIONS = "directions"
+    SESSIONS = "sessions"
+
+    def __init__(
+        self,
+        backend: Any,
+        prefix: str = "skuvault_web",
+        version_check_interval: float = 1.0,
+    ):
+        """Initialize the shared cache.
+
+        Args:
+            backend: ``SQLiteCacheBackend`` or ``RedisCacheBackend``
+            prefix: Key prefix, so several services can share one store
+            version_check_interval: Seconds a namespace version is trusted
+                locally before it is re-read from the store
+        """
+        self.backend = backend
+        self.prefix = prefix
+        self.version_check_interval = version_check_interval
+        self._pid = os.getpid()
+        self._versions: Dict[str, Tuple[int, float]] = {}
+
+        self._lookups: Counter = Counter()
+        self._hits: Counter = Counter()
+        self._cross_worker_hits: Counter = Counter()
+        self._writes: Counter = Counter()
+        self._errors = 0
+        self._leases_acquired = 0
+        self._leases_contended = 0
+
+    async def _get_version(self, namespace: str) -> int:
+        """Get a namespace's version, re-reading it at most once per interval."""
+        cached = self._versions.get(namespace)
+        now = time.monotonic()
+        if cached and now - cached[1] < self.version_check_interval:
+            return cached[0]
+
+        version = await self.backend.get_counter(f"{self.prefix}:{namespace}:version")
+        self._versions[namespace] = (version, now)
+        return version
+
+    async def _key(self, namespace: str, key: str) -> str:
+        version = await self._get_version(namespace)
+        return f"{self.prefix}:{namespace}:v{version}:{key}"
+
+    async def get(self, namespace: str, key: str) -> Optional[bytes]:
+        """Look up a value written by any worker.
+
+        Store errors are counted and treated as misses, so an unavailable
+        store degrades to per-worker caching.
+
+        Args:
+            namespace: ``SharedCache.DIRECTIONS`` or ``SharedCache.SESSIONS``
+            key: Entry key within the namespace
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        self._lookups[namespace] += 1
+        try:
+            packed = await self.backend.get(await self._key(namespace, key))
+        except Exception:
+            self._errors += 1
+            return None
+        if packed is None:
+            return None
+
+        writer, _, value = packed.partition(b"\n")
+        self._hits[namespace] += 1
+        if writer != str(self._pid).encode():
+            self._cross_worker_hits[namespace] += 1
+        return value
+
+    async def set(
+        self, namespace: str, key: str, value: bytes, ttl_seconds: Optional[float]
+    ) -> None:
+        """Write a value through to the shared store.
+
+        Args:
+            namespace: ``SharedCache.DIRECTIONS`` or ``SharedCache.SESSIONS``
+            key: Entry key within the namespace
+            value: Value to store
+            ttl_seconds: Time-to-live, or None to keep until invalidated
+        """
+        try:
+            await self.backend.set(
+                await self._key(namespace, key),
+                str(self._pid).encode() + b"\n" + value,
+                ttl_seconds,
+            )
+            self._writes[namespace] += 1
+        except Exception:
+            self._errors += 1
+
+    async def invalidate(self, namespace: str, key: Optional[str] = None) -> None:
+        """Invalidate one entry, or every entry in a namespace for all workers.
+
+        Args:
+            namespace: ``SharedCache.DIRECTIONS`` or ``SharedCache.SESSIONS``
+            key: Entry key to delete, or None to bump the namespace version
+        """
+        try:
+            if key is not None:
+                await self.backend.delete(await self._key(namespace, key))
+            else:
+                version = await self.backend.incr(f"{self.prefix}:{namespace}:version")
+                self._versions[namespace] = (version, time.monotonic())
+        except Exception:
+            self._errors += 1
+
+    async def acquire_lease(self, name: str, ttl_seconds: float) -> Optional[str]:
+        """Try to take a named lease shared by all workers.
+
+        The lease expires after ``ttl_seconds`` so a worker that dies while
+        holding it cannot block the others.
+
+        Args:
+            name: Lease name (e.g. "login")
+            ttl_seconds: How long the lease is held unless released
+
+        Returns:
+            Owner token to pass to ``release_lease``, or None if another
+            worker holds the lease
+
+        Raises:
+            LeaseUnavailableError: If the store could not be reached, so
+                nobody can be known to hold the lease
+        """
+        owner = f"{self._pid}:{uuid.uuid4().hex}"
+        try:
+            acquired = await self.backend.acquire(
+                f"{self.prefix}:lease:{name}", owner.encode(), ttl_seconds
+            )
+        except Exception as e:
+            self._errors += 1
+            raise LeaseUnavailableError(f"{type(e).__name__}: {e}") from e
+
+        if not acquired:
+            self._leases_contended += 1
+            return None
+        self._leases_acquired += 1
+        return owner
+
+    async def release_lease(self, name: str, owner: str) -> None:
+        """Release a lease taken with ``acquire_lease``.
+
+        Args:
+            name: Lease name
+            owner: Owner token returned by ``acquire_lease``
+        """
+        try:
+            await self.backend.release(f"{self.prefix}:lease:{name}", owner.encode())
+        except Exception:
+            self._errors += 1
+
+    async def close(self) -> None:
+        """Close the backend."""
+        await self.backend.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit rates for this worker's lookups.
+
+        Returns:
+            Per-namespace lookups, hits, hit rate and cross-worker hit rate
+            (hits on entries written by another process)
+        """
+        namespaces = {}
+        for namespace in (self.DIRECTIONS, self.SESSIONS):
+            lookups = self._lookups[namespace]
+            namespaces[namespace] = {
+                "lookups": lookups,
+                "hits": self._hits[namespace],
+                "cross_worker_hits": self._cross_worker_hits[namespace],
+                "writes": self._writes[namespace],
+                "hit_rate": self._hits[namespace] / lookups if lookups else 0.0,
+                "cross_worker_hit_rate": (
+                    self._cross_worker_hits[namespace] / lookups if lookups else 0.0
+                ),
+                "version": self._versions.get(namespace, (0, 0))[0],
+            }
+
+        return {
+            "backend": self.backend.name,
+            "pid": self._pid,
+            "errors": self._errors,
+            "namespaces": namespaces,
+            "leases_acquired": self._leases_acquired,
+            "leases_contended": self._leases_contended,
+        }
+
+
+class RequestPriority(Enum):
+    """Scheduling lanes for outgoing SkuVault requests.
+
+    Interactive lookups (a packer waiting on an order) overtake normal
+    traffic, which in turn overtakes bulk background sweeps.
+    """
+
+    INTERACTIVE = "interactive"
+    NORMAL = "normal"
+    BULK = "bulk"
+
+
+# Share of the rate-limit budget each lane gets when all lanes are busy
+PRIORITY_WEIGHTS: Dict[RequestPriority, int] = {
+    RequestPriority.INTERACTIVE: 8,
+    RequestPriority.NORMAL: 3,
+    RequestPriority.BULK: 1,
+}
+
+
+class TokenBucketRateLimiter:
+    """Token-bucket rate limiter with a concurrency cap and priority lanes.
+
+    Tokens refill at ``requests_per_second`` up to ``burst``, so an idle
+    account sends immediately while sustained traffic is smoothed to the
+    configured rate. At most ``max_in_flight`` requests run at once.
+
+    When requests have to wait, they queue per ``RequestPriority`` lane and
+    are granted by weighted fair sharing (stride scheduling) using
+    ``PRIORITY_WEIGHTS``: a busy interactive lane gets most of the budget,
+    but a bulk lane is never starved.
+
+    Attributes:
+        name: Endpoint family this limiter applies to
+        _rate: Token refill rate per second (0 disables rate limiting)
+        _burst: Maximum number of tokens that can accumulate
+        _max_in_flight: Maximum number of concurrent requests
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_second: float,
+        burst: int = 5,
+        max_in_flight: int = 10,
+    ):
+        """Initialize the rate limiter.
+
+        Args:
+            name: Endpoint family name (e.g. "sessions", "directions", "login")
+            requests_per_second: Sustained request budget (0 for unlimited)
+            burst: Number of requests allowed back-to-back after idling
+            max_in_flight: Maximum number of concurrent requests
+        """
+        self.name = name
+        self._rate = float(requests_per_second)
+        self._burst = max(1, int(burst))
+        self._max_in_flight = max(1, int(max_in_flight))
+        self._tokens = float(self._burst)
+        self._last_refill = time.monotonic()
+        self._in_flight = 0
+
+        # Waiting requests per lane, and the stride-scheduling pass values
+        self._waiters: Dict[RequestPriority, Deque["asyncio.Future[None]"]] = {
+            priority: deque() for priority in RequestPriority
+        }
+        self._lane_pass: Dict[RequestPriority, float] = {
+            priority: 0.0 for priority in RequestPriority
+        }
+        self._virtual_time = 0.0
+        self._slot_freed = asyncio.Event()
+        self._dispatcher: Optional["asyncio.Task[None]"] = None
+
+        # Wait-time metrics, overall and per lane
+        self._acquired_count = 0
+        self._throttled_count = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        self._lane_stats: Dict[RequestPriority, Dict[str, float]] = {
+            priority: {"acquired": 0, "total_wait_seconds": 0.0, "max_wait_seconds": 0.0}
+            for priority in RequestPriority
+        }
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._last_refill) * self._rate
+        )
+        self._last_refill = now
+
+    def _has_waiters(self) -> bool:
+        """Whether any lane has queued requests."""
+        return any(self._waiters.values())
+
+    def _try_take(self) -> bool:
+        """Take a token and an in-flight slot if both are available."""
+        if self._in_flight >= self._max_in_flight:
+            return False
+        if self._rate > 0:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+        self._in_flight += 1
+        return True
+
+    def _next_lane(self) -> Optional[RequestPriority]:
+        """Pick the non-empty lane with the lowest pass value."""
+        for queue in self._waiters.values():
+            while queue and queue[0].done():
+                queue.popleft()
+
+        busy_lanes = [priority for priority, queue in self._waiters.items() if queue]
+        if not busy_lanes:
+            return None
+        return min(busy_lanes, key=lambda priority: self._lane_pass[priority])
+
+    async def _dispatch(self) -> None:
+        """Grant tokens and slots to queued requests in weighted fair order."""
+        try:
+            while True:
+                lane = self._next_lane()
+                if lane is None:
+                    return
+
+                if self._in_flight >= self._max_in_flight:
+                    self._slot_freed.clear()
+                    await self._slot_freed.wait()
+                    continue
+
+                if not self._try_take():
+                    await asyncio.sleep((1 - self._tokens) / self._rate)
+                    continue
+
+                self._virtual_time = self._lane_pass[lane]
+                self._lane_pass[lane] += 1.0 / PRIORITY_WEIGHTS[lane]
+                self._waiters[lane].popleft().set_result(None)
+        finally:
+            self._dispatcher = None
+
+    def _ensure_dispatcher(self) -> None:
+        """Start the dispatcher task if requests are queued and none runs."""
+        if self._dispatcher is None and self._has_waiters():
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+
+    async def acquire(
+        self, priority: RequestPriority = RequestPriority.NORMAL
+    ) -> float:
+        """Wait for an in-flight slot and a token.
+
+        Args:
+            priority: Lane to queue in if the request has to wait
+
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.monotonic()
+
+        if self._has_waiters() or not self._try_take():
+            queue = self._waiters[priority]
+            if not queue:
+                # A lane that was idle rejoins at the current virtual time
+                # instead of cashing in credit from the idle period
+                self._lane_pass[priority] = max(
+                    self._lane_pass[priority], self._virtual_time
+                )
+
+            waiter = asyncio.get_running_loop().create_future()
+            queue.append(waiter)
+            self._ensure_dispatcher()
+
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Granted just before cancellation; hand the slot back
+                    self.release()
+                raise
+
+        wait_seconds = time.monotonic() - start
+        self._acquired_count += 1
+        self._total_wait_seconds += wait_seconds
+        self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+        if wait_seconds > 0.001:
+            self._throttled_count += 1
+
+        lane_stats = self._lane_stats[priority]
+        lane_stats["acquired"] += 1
+        lane_stats["total_wait_seconds"] += wait_seconds
+        lane_stats["max_wait_seconds"] = max(lane_stats["max_wait_seconds"], wait_seconds)
+
+        return wait_seconds
+
+    def release(self) -> None:
+        """Release the in-flight slot taken by ``acquire``."""
+        self._in_flight -= 1
+        self._slot_freed.set()
+        self._ensure_dispatcher()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter statistics for monitoring.
+
+        Returns:
+            Dictionary containing configuration and wait-time metrics,
+            including queue depth and queue-wait time per priority lane
+        """
+        self._refill()
+        return {
+            "requests_per_second": self._rate,
+            "burst": self._burst,
+            "max_in_flight": self._max_in_flight,
+            "in_flight": self._in_flight,
+            "available_tokens": round(self._tokens, 2),
+            "acquired": self._acquired_count,
+            "throttled": self._throttled_count,
+            "avg_wait_ms": (
+                (self._total_wait_seconds / self._acquired_count) * 1000
+                if self._acquired_count
+                else 0.0
+            ),
+            "max_wait_ms": self._max_wait_seconds * 1000,
+            "lanes": {
+                priority.value: {
+                    "queued": len(self._waiters[priority]),
+                    "acquired": int(stats["acquired"]),
+                    "avg_wait_ms": (
+                        (stats["total_wait_seconds"] / stats["acquired"]) * 1000
+                        if stats["acquired"]
+                        else 0.0
+                    ),
+                    "max_wait_ms": stats["max_wait_seconds"] * 1000,
+                }
+                for priority, stats in self._lane_stats.items()
+            },
+        }
+
+
+class CachingDNSBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that caches DNS answers for a TTL.
+
+    Host names are resolved once per TTL with the event loop's resolver and
+    connections are opened to the cached addresses. TLS still verifies the
+    original host name, since the connection pool passes it separately for
+    SNI and certificate checks.
+
+    Attributes:
+        _backend: Backend that opens the actual connections
+        _ttl_seconds: How long a DNS answer is reused
+        _answers: Mapping of (host, port) to (addresses, expires_at)
+    """
+
+    def __init__(
+        self,
+        backend: httpcore.AsyncNetworkBackend,
+        ttl_seconds: float = 300.0,
+    ):
+        """Initialize the caching backend.
+
+        Args:
+            backend: Backend that opens the actual connections
+            ttl_seconds: How long a DNS answer is reused (default: 5 minutes)
+        """
+        self._backend = backend
+        self._ttl_seconds = ttl_seconds
+        self._answers: Dict[Tuple[str, int], Tuple[List[str], float]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    async def resolve(self, host: str, port: int) -> List[str]:
+        """Resolve a host name, using the cached answer while it is fresh.
+
+        Args:
+            host: Host name to resolve
+            port: Port the connection will use
+
+        Returns:
+            List of IP addresses
+        """
+        answer = self._answers.get((host, port))
+        if answer is not None and answer[1] > time.monotonic():
+            self._hits += 1
+            return answer[0]
+
+        self._misses += 1
+        addresses = await self.lookup(host, port)
+        self._answers[(host, port)] = (addresses, time.monotonic() + self._ttl_seconds)
+        return addresses
+
+    async def lookup(self, host: str, port: int) -> List[str]:
+        """Resolve a host name with the event loop's resolver, uncached.
+
+        Args:
+            host: Host name to resolve
+            port: Port the connection will use
+
+        Returns:
+            List of IP addresses
+        """
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )
+        return list(dict.fromkeys(info[4][0] for info in infos))
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Any] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        """Open a TCP connection to a cached address of ``host``."""
+        try:
+            addresses = await self.resolve(host, port)
+        except OSError:
+            # Let the underlying backend report the resolution failure
+            addresses = [host]
+
+        last_error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except httpcore.ConnectError as e:
+                last_error = e
+
+        # Every cached address failed; the answer may be stale
+        self._answers.pop((host, port), None)
+        raise last_error
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Any] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        """Open a Unix socket connection via the underlying backend."""
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        """Sleep via the underlying backend."""
+        await self._backend.sleep(seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get DNS cache statistics for monitoring.
+
+        Returns:
+            Dictionary containing cached hosts, hits and misses
+        """
+        now = time.monotonic()
+        return {
+            "ttl_seconds": self._ttl_seconds,
+            "cached_hosts": [
+                host for (host, _), (_, expires_at) in self._answers.items()
+                if expires_at > now
+            ],
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+
+# httpcore exceptions and the httpx exceptions callers expect, most specific first
+HTTPCORE_EXCEPTIONS: Tuple[Tuple[type, type], ...] = (
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+
+
+@contextmanager
+def map_httpcore_errors(request: httpx.Request) -> Iterator[None]:
+    """Re-raise httpcore errors as the matching httpx errors.
+
+    Args:
+        request: Request the errors belong to
+    """
+    try:
+        yield
+    except Exception as e:
+        for core_error, httpx_error in HTTPCORE_EXCEPTIONS:
+            if isinstance(e, core_error):
+                raise httpx_error(str(e), request=request) from e
+        raise
+
+
+class CachingDNSResponseStream(httpx.AsyncByteStream):
+    """Response body read from an httpcore stream, with httpx errors."""
+
+    def __init__(self, stream: Any, request: httpx.Request):
+        """Initialize the stream.
+
+        Args:
+            stream: httpcore response stream
+            request: Request the response belongs to
+        """
+        self._stream = stream
+        self._request = request
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Yield the body in chunks as they arrive."""
+        with map_httpcore_errors(self._request):
+            async for chunk in self._stream:
+                yield chunk
+
+    async def aclose(self) -> None:
+        """Release the connection back to the pool."""
+        if hasattr(self._stream, "aclose"):
+            await self._stream.aclose()
+
+
+class CachingDNSTransport(httpx.AsyncBaseTransport):
+    """HTTP transport whose connection pool resolves hosts through a DNS cache.
+
+    Owns an ``httpcore.AsyncConnectionPool`` built with the cache as its
+    ``network_backend``, which ``httpx.AsyncHTTPTransport`` has no option
+    for. Proxies are not supported; use ``httpx.AsyncHTTPTransport`` behind
+    one, since the proxy resolves host names anyway.
+    """
+
+    def __init__(
+        self,
+        dns_cache: CachingDNSBackend,
+        limits: httpx.Limits,
+        http2: bool = False,
+        verify: Any = True,
+        cert: Any = None,
+        trust_env: bool = True,
+    ):
+        """Initialize the transport.
+
+        Args:
+            dns_cache: Backend the pool opens connections through
+            limits: Connection pool limits
+            http2: Whether to offer HTTP/2 during the TLS handshake
+            verify: Certificate verification, as for ``httpx.create_ssl_context``
+            cert: Client certificate, as for ``httpx.create_ssl_context``
+            trust_env: Whether SSL settings may come from the environment
+        """
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(verify=verify, cert=cert, trust_env=trust_env),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=dns_cache,
+        )
+
+    @property
+    def pool(self) -> httpcore.AsyncConnectionPool:
+        """The underlying connection pool."""
+        return self._pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request through the pool.
+
+        Args:
+            request: Request to send
+
+        Returns:
+            Response whose body is streamed from the connection
+        """
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with map_httpcore_errors(request):
+            core_response = await self._pool.handle_async_request(core_request)
+
+        return httpx.Response(
+            status_code=core_response.status,
+            headers=core_response.headers,
+            stream=CachingDNSResponseStream(core_response.stream, request),
+            extensions=core_response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        """Close every pooled connection."""
+        await self._pool.aclose()
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker that fails fast while a host is down.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    rejects requests for ``reset_timeout_seconds``. It then half-opens and
+    lets a single probe request through; success closes it again, failure
+    re-opens it.
+
+    Attributes:
+        host: Host name this breaker guards
+        _failure_threshold: Consecutive failures that open the breaker
+        _reset_timeout_seconds: Time to stay open before probing
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+    ):
+        """Initialize the circuit breaker.
+
+        Args:
+            host: Host name this breaker guards
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout_seconds: Time to stay open before probing
+        """
+        self.host = host
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._times_opened = 0
+        self._rejected_count = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the breaker is currently rejecting requests."""
+        return self._state == self.OPEN and self.seconds_until_retry() > 0
+
+    def seconds_until_retry(self) -> float:
+        """Seconds left before an open breaker allows a probe request."""
+        if self._state != self.OPEN:
+            return 0.0
+        return max(
+            0.0, self._opened_at + self._reset_timeout_seconds - time.monotonic()
+        )
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent to the host.
+
+        Returns:
+            True if the request may proceed, False to fail fast
+        """
+        if self._state == self.OPEN:
+            if self.seconds_until_retry() > 0:
+                self._rejected_count += 1
+                return False
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+
+        if self._state == self.HALF_OPEN:
+            if self._probe_in_flight:
+                self._rejected_count += 1
+                return False
+            self._probe_in_flight = True
+
+        return True
+
+    def record_success(self) -> None:
+        """Record a successful request and close the breaker."""
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Release a half-open probe whose outcome says nothing about the host."""
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the breaker if needed."""
+        self._consecutive_failures += 1
+        if (
+            self._state == self.HALF_OPEN
+            or self._consecutive_failures >= self._failure_threshold
+        ):
+            if self._state != self.OPEN:
+                self._times_opened += 1
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get breaker statistics for monitoring.
+
+        Returns:
+            Dictionary containing breaker state and counters
+        """
+        return {
+            "state": self._state,
+            "consecutive_failures": self._consecutive_failures,
+            "times_opened": self._times_opened,
+            "rejected_requests": self._rejected_count,
+            "retry_in_seconds": round(self.seconds_until_retry(), 1),
+        }
+
+
+class RetryBudget:
+    """Process-wide cap on retries relative to recent request volume.
+
+    Retries are allowed while they stay below ``retry_ratio`` of the requests
+    sent in the sliding window, with a floor of ``min_retries_per_second`` so
+    low-traffic workers can still retry.
+
+    Attributes:
+        _retry_ratio: Maximum retries as a fraction of requests
+        _min_retries_per_second: Retries always allowed regardless of volume
+        _window_seconds: Length of the sliding window
+    """
+
+    def __init__(
+        self,
+        retry_ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        window_seconds: float = 10.0,
+    ):
+        """Initialize the retry budget.
+
+        Args:
+            retry_ratio: Maximum retries as a fraction of requests
+            min_retries_per_second: Retries always allowed regardless of volume
+            window_seconds: Length of the sliding window
+        """
+        self._retry_ratio = retry_ratio
+        self._min_retries_per_second = min_retries_per_second
+        self._window_seconds = window_seconds
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._denied_count = 0
+
+    def _trim(self, now: float) -> None:
+        """Drop timestamps that have left the sliding window."""
+        cutoff = now - self._window_seconds
+        while self._requests and self._requests[0] < cutoff:
+            self._requests.popleft()
+        while self._retries and self._retries[0] < cutoff:
+            self._retries.popleft()
+
+    def record_request(self) -> None:
+        """Record an outgoing request attempt."""
+        self._requests.append(time.monotonic())
+
+    def try_spend(self) -> bool:
+        """Try to take one retry from the budget.
+
+        Returns:
+            True if the retry is allowed, False if the budget is exhausted
+        """
+        now = time.monotonic()
+        self._trim(now)
+        allowed = max(
+            self._min_retries_per_second * self._window_seconds,
+            self._retry_ratio * len(self._requests),
+        )
+        if len(self._retries) >= allowed:
+            self._denied_count += 1
+            return False
+        self._retries.append(now)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get retry budget statistics for monitoring.
+
+        Returns:
+            Dictionary containing window counts and denied retries
+        """
+        self._trim(time.monotonic())
+        return {
+            "window_seconds": self._window_seconds,
+            "requests_in_window": len(self._requests),
+            "retries_in_window": len(self._retries),
+            "denied_retries": self._denied_count,
+        }
+
+
+class PreflightCache:
+    """Bounded LRU cache of CORS preflight results keyed by origin and path.
+
+    One instance is shared by every service in the process, so a preflight
+    sent by one worker coroutine serves all others until it expires.
+
+    Attributes:
+        _entries: Mapping of origin+path to (success, expires_at)
+        _max_entries: Maximum number of cached results
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """Initialize the preflight cache.
+
+        Args:
+            max_entries: Maximum number of cached results (default: 256)
+        """
+        self._entries: "OrderedDict[str, Tuple[bool, float]]" = OrderedDict()
+        self._max_entries = max_entries
+        self._hits = 0
+        self._misses = 0
+        self._skipped = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._preflights_sent = 0
+        self._total_latency_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[bool]:
+        """Get a cached preflight result.
+
+        Args:
+            key: Origin and path of the request
+
+        Returns:
+            Cached success flag, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+                self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry[0]
+
+    def set(
+        self, key: str, success: bool, ttl_seconds: float, latency_seconds: float
+    ) -> None:
+        """Cache a preflight result.
+
+        Args:
+            key: Origin and path of the request
+            success: Whether the preflight succeeded
+            ttl_seconds: How long the result stays valid
+            latency_seconds: Round-trip time of the preflight request
+        """
+        self._preflights_sent += 1
+        self._total_latency_seconds += latency_seconds
+
+        self._entries[key] = (success, time.monotonic() + ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def record_skip(self) -> None:
+        """Record a request that needed no preflight."""
+        self._skipped += 1
+
+    def purge_expired(self) -> int:
+        """Remove expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.monotonic()
+        expired_keys = [key for key, entry in self._entries.items() if entry[1] <= now]
+        for key in expired_keys:
+            del self._entries[key]
+        self._expirations += len(expired_keys)
+        return len(expired_keys)
+
+    def clear(self) -> None:
+        """Clear all cached results."""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics for monitoring.
+
+        Returns:
+            Dictionary containing counters and the estimated latency saved
+        """
+        avg_latency_ms = (
+            (self._total_latency_seconds / self._preflights_sent) * 1000
+            if self._preflights_sent
+            else 0.0
+        )
+        return {
+            "total_items": len(self._entries),
+            "max_size": self._max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": (
+                self._hits / (self._hits + self._misses)
+                if self._hits + self._misses
+                else 0.0
+            ),
+            "skipped": self._skipped,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "preflights_sent": self._preflights_sent,
+            "avg_preflight_latency_ms": avg_latency_ms,
+            "estimated_time_saved_ms": (self._hits + self._skipped) * avg_latency_ms,
+        }
+
+
+class NegativeCache:
+    """Bounded cache of keys known to have no results, with a short TTL.
+
+    Used to remember sale IDs whose session search came back empty, so
+    repeated lookups for orders that never enter a wave-picking session do
+    not reach SkuVault. Shared by every service in the process.
+
+    Attributes:
+        _entries: Mapping of key to monotonic expiry time, oldest first
+        _max_entries: Maximum number of remembered keys
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        """Initialize the negative cache.
+
+        Args:
+            max_entries: Maximum number of remembered keys (default: 4096)
+        """
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+        self._max_entries = max_entries
+        self._hits = 0
+        self._misses = 0
+        self._added = 0
+        self._invalidated = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def contains(self, key: str) -> bool:
+        """Check whether a key is known to have no results.
+
+        Args:
+            key: Key to check
+
+        Returns:
+            True if the key was recorded as empty and has not expired
+        """
+        expires_at = self._entries.get(key)
+        if expires_at is None or expires_at <= time.monotonic():
+            if expires_at is not None:
+                del self._entries[key]
+            self._misses += 1
+            return False
+
+        self._hits += 1
+        return True
+
+    def add(self, key: str, ttl_seconds: float) -> None:
+        """Record that a key has no results.
+
+        Args:
+            key: Key that came back empty
+            ttl_seconds: How long to trust the empty result
+        """
+        self._added += 1
+        self._entries[key] = time.monotonic() + ttl_seconds
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> bool:
+        """Forget a key because results for it now exist.
+
+        Args:
+            key: Key to forget
+
+        Returns:
+            True if the key was cached
+        """
+        if self._entries.pop(key, None) is None:
+            return False
+        self._invalidated += 1
+        return True
+
+    def clear(self) -> int:
+        """Forget every key.
+
+        Returns:
+            Number of keys removed
+        """
+        removed = len(self._entries)
+        self._entries.clear()
+        self._invalidated += removed
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics for monitoring.
+
+        Returns:
+            Dictionary containing counters; every hit is an upstream call saved
+        """
+        lookups = self._hits + self._misses
+        return {
+            "total_items": len(self._entries),
+            "max_size": self._max_entries,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": self._hits / lookups if lookups else 0.0,
+            "added": self._added,
+            "invalidated": self._invalidated,
+        }
+
+
+class SaleSessionIndex:
+    """In-memory index from sale ID to the wave-picking sessions containing it.
+
+    Built from data the service already pulls: each parsed directions
+    response maps its picklist's orders (sale IDs) to spot numbers, and each
+    sessions response supplies the session behind a picklist.
+
+    The index can only stand in for the API's sale ID search when it knows
+    every session: a complete sweep of the sessions list (all states, all
+    pages) must have been recorded within ``max_age_seconds``, and the
+    directions of every swept picklist must be indexed, within
+    ``max_age_seconds`` for sessions that are not closed. Otherwise lookups
+    return None and the caller falls back to the API.
+
+    Attributes:
+        _sales: Mapping of case-folded sale ID to {picklist_id: spot_number}
+        _picklist_sales: Case-folded sale IDs indexed per picklist, least
+            recent first
+        _indexed_at: Monotonic time each picklist's directions were indexed
+        _sessions: Latest session per picklist with the monotonic time it was seen
+        _sweep: Picklists of the last complete sessions sweep and when it started
+    """
+
+    def __init__(self, max_picklists: int = 5000, max_age_seconds: float = 120):
+        """Initialize the index.
+
+        Args:
+            max_picklists: Maximum number of indexed picklists (default: 5000)
+            max_age_seconds: How long session data is trusted (default: 120)
+        """
+        self._sales: Dict[str, Dict[str, int]] = {}
+        self._picklist_sales: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._indexed_at: Dict[str, float] = {}
+        self._sessions: "OrderedDict[str, Tuple[ParsedSession, float]]" = OrderedDict()
+        self._sweep: Optional[Tuple[frozenset, float]] = None
+        self._max_picklists = max_picklists
+        self._max_age_seconds = max_age_seconds
+        self._hits = 0
+        self._scans = 0
+        self._incomplete = 0
+
+    def remove_picklist(self, picklist_id: str) -> None:
+        """Remove a picklist's sales from the index, marking it not indexed."""
+        self._indexed_at.pop(picklist_id, None)
+        for sale_id in self._picklist_sales.pop(picklist_id, []):
+            picklists = self._sales.get(sale_id)
+            if picklists is not None:
+                picklists.pop(picklist_id, None)
+                if not picklists:
+                    del self._sales[sale_id]
+
+    def index_directions(self, picklist_id: str, spots: Dict[str, int]) -> None:
+        """Replace the sales indexed for a picklist.
+
+        Args:
+            picklist_id: The picklist the directions belong to
+            spots: Mapping of sale ID to spot number within the picklist
+        """
+        self.remove_picklist(picklist_id)
+        sale_ids = []
+        for sale_id, spot_number in spots.items():
+            key = sale_id.casefold()
+            self._sales.setdefault(key, {})[picklist_id] = spot_number
+            sale_ids.append(key)
+        self._picklist_sales[picklist_id] = sale_ids
+        self._indexed_at[picklist_id] = time.monotonic()
+
+        while len(self._picklist_sales) > self._max_picklists:
+            oldest = next(iter(self._picklist_sales))
+            self.remove_picklist(oldest)
+            self._sessions.pop(oldest, None)
+
+    def update_sessions(self, sessions: List[ParsedSession]) -> None:
+        """Record the latest session data for each session's picklist.
+
+        Args:
+            sessions: Sessions parsed from a sessions API response
+        """
+        now = time.monotonic()
+        for session in sessions:
+            if session.picklist_id:
+                self._sessions[session.picklist_id] = (session, now)
+                self._sessions.move_to_end(session.picklist_id)
+
+        while len(self._sessions) > self._max_picklists * 2:
+            self._sessions.popitem(last=False)
+
+    def record_sweep(self, picklist_ids: Iterable[str], started_at: float) -> None:
+        """Record a complete sweep of the sessions list.
+
+        Args:
+            picklist_ids: Picklist of every session in the sweep
+            started_at: Monotonic time the sweep started
+        """
+        self._sweep = (frozenset(picklist_ids), started_at)
+
+    def is_complete(self) -> bool:
+        """Check whether the index currently covers every session.
+
+        Returns:
+            True if a fresh complete sweep was recorded and the directions of
+            every swept picklist are indexed and fresh enough
+        """
+        if self._sweep is None:
+            return False
+
+        now = time.monotonic()
+        picklist_ids, started_at = self._sweep
+        if now - started_at > self._max_age_seconds:
+            return False
+
+        for picklist_id in picklist_ids:
+            indexed_at = self._indexed_at.get(picklist_id)
+            if indexed_at is None:
+                return False
+            entry = self._sessions.get(picklist_id)
+            if entry is None:
+                return False
+            if entry[0].status != SessionState.CLOSED and now - indexed_at > self._max_age_seconds:
+                return False
+        return True
+
+    def lookup(self, sale_id: str) -> Optional[List[Tuple[ParsedSession, int]]]:
+        """Find the sessions the API's sale ID search would return.
+
+        A full sale ID is answered from its exact (case-insensitive) entry.
+        Without an exact entry the indexed sales are scanned for IDs that
+        contain ``sale_id``, like the API's ``contains`` search. Only answers
+        while the index is complete.
+
+        Args:
+            sale_id: Sale ID, or part of one, to look up
+
+        Returns:
+            List of (session, spot_number) pairs, empty if no session holds
+            a matching sale, or None if the index is not complete
+        """
+        if not self.is_complete():
+            self._incomplete += 1
+            return None
+
+        needle = sale_id.casefold()
+        exact = self._sales.get(needle)
+        if exact is not None:
+            matches = [exact]
+        else:
+            self._scans += 1
+            matches = [
+                picklists for indexed_sale_id, picklists in self._sales.items()
+                if needle in indexed_sale_id
+            ]
+
+        found = []
+        for picklists in matches:
+            for picklist_id, spot_number in picklists.items():
+                # A picklist indexed after the sweep may lack session data
+                entry = self._sessions.get(picklist_id)
+                if entry is None:
+                    self._incomplete += 1
+                    return None
+                found.append((entry[0], spot_number))
+
+        self._hits += 1
+        return found
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics for monitoring.
+
+        Returns:
+            Dictionary containing index size and lookup counters
+        """
+        lookups = self._hits + self._incomplete
+        return {
+            "indexed_sales": len(self._sales),
+            "indexed_picklists": len(self._picklist_sales),
+            "known_sessions": len(self._sessions),
+            "swept_picklists": len(self._sweep[0]) if self._sweep else 0,
+            "complete": self.is_complete(),
+            "max_picklists": self._max_picklists,
+            "max_age_seconds": self._max_age_seconds,
+            "hits": self._hits,
+            "scans": self._scans,
+            "incomplete": self._incomplete,
+            "hit_ratio": self._hits / lookups if lookups else 0.0,
+        }
+
+
+class TokenMemo:
+    """In-memory copy of the validated SkuVault auth token and its lifetime.
+
+    Lets ``check_cached_token`` answer without a ``TokenCacheService`` round
+    trip and tells the refresh task when the token is due for renewal.
+    Shared by every service in the process.
+
+    Attributes:
+        token: Memoized token, or None
+        obtained_at: Wall-clock time the token was issued
+        expires_at: Wall-clock time the token expires
+        generation: Incremented every time a different token is memoized
+    """
+
+    def __init__(self):
+        """Initialize an empty token memo."""
+        self.token: Optional[str] = None
+        self.obtained_at = 0.0
+        self.expires_at = 0.0
+        self.generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._refresh_failures = 0
+
+    def get(self) -> Optional[str]:
+        """Get the memoized token if it has not expired.
+
+        Returns:
+            The token, or None if none is memoized or it has expired
+        """
+        if self.token is None or self.expires_at <= time.time():
+            self._misses += 1
+            return None
+        self._hits += 1
+        return self.token
+
+    def set(self, token: str, obtained_at: float, expires_at: float) -> None:
+        """Memoize a validated token.
+
+        Args:
+            token: The auth token
+            obtained_at: Wall-clock time the token was issued
+            expires_at: Wall-clock time the token expires
+        """
+        if token != self.token:
+            self.generation += 1
+        self.token = token
+        self.obtained_at = obtained_at
+        self.expires_at = expires_at
+
+    def clear(self) -> None:
+        """Forget the memoized token."""
+        if self.token is not None:
+            self.generation += 1
+        self.token = None
+        self.obtained_at = 0.0
+        self.expires_at = 0.0
+
+    def refresh_at(self, fraction: float) -> float:
+        """Get the wall-clock time at which the token should be renewed.
+
+        Args:
+            fraction: Fraction of the token's lifetime after which to renew
+
+        Returns:
+            Wall-clock refresh time
+        """
+        return self.obtained_at + (self.expires_at - self.obtained_at) * fraction
+
+    def record_refresh(self, success: bool) -> None:
+        """Count a background refresh attempt.
+
+        Args:
+            success: Whether the refresh produced a new token
+        """
+        if success:
+            self._refreshes += 1
+        else:
+            self._refresh_failures += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get token memo statistics for monitoring.
+
+        Returns:
+            Dictionary containing token state and counters
+        """
+        lookups = self._hits + self._misses
+        return {
+            "has_token": self.token is not None,
+            "expires_in_seconds": (
+                max(0.0, self.expires_at - time.time()) if self.token else 0.0
+            ),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": self._hits / lookups if lookups else 0.0,
+            "refreshes": self._refreshes,
+            "refresh_failures": self._refresh_failures,
+        }
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key.
+
+    The first caller for a key starts the work as a task; callers arriving
+    while it runs await the same task instead of starting their own. The
+    task is shielded, so a cancelled caller does not cancel it for others.
+    """
+
+    def __init__(self):
+        """Initialize the in-flight call registry."""
+        self._calls: Dict[str, "asyncio.Task[Any]"] = {}
+        self._executed_count = 0
+        self._coalesced_count = 0
+
+    async def do(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Run ``factory`` once for all concurrent callers with ``key``.
+
+        Args:
+            key: Identity of the call (e.g. endpoint plus payload)
+            factory: Zero-argument callable returning the awaitable to run
+            timeout: Maximum seconds this caller will wait; the shared work
+                keeps running for other callers when it expires
+
+        Returns:
+            The result shared by every caller of this key
+
+        Raises:
+            asyncio.TimeoutError: If ``timeout`` expires first
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._calls[key] = task
+            self._executed_count += 1
+            task.add_done_callback(lambda done, key=key: self._finish(key, done))
+        else:
+            self._coalesced_count += 1
+
+        if timeout is None:
+            return await asyncio.shield(task)
+        return await asyncio.wait_for(asyncio.shield(task), timeout=max(0.0, timeout))
+
+    def _finish(self, key: str, task: "asyncio.Task[Any]") -> None:
+        """Forget a completed call and mark its exception as retrieved."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get deduplication statistics for monitoring.
+
+        Returns:
+            Dictionary containing executed, coalesced and in-flight counts
+        """
+        return {
+            "in_flight": len(self._calls),
+            "executed": self._executed_count,
+            "coalesced": self._coalesced_count,
+        }
+
+
+class LatencyTracker:
+    """Rolling record of successful request latencies per request context.
+
+    Attributes:
+        _samples: Mapping of context to its most recent latencies in seconds
+        _max_samples: Number of recent samples kept per context
+        _min_samples: Samples required before percentiles are reported
+    """
+
+    def __init__(self, max_samples: int = 200, min_samples: int = 20):
+        """Initialize the latency tracker.
+
+        Args:
+            max_samples: Number of recent samples kept per context
+            min_samples: Samples required before percentiles are reported
+        """
+        self._samples: Dict[str, Deque[float]] = {}
+        self._max_samples = max_samples
+        self._min_samples = min_samples
+
+    def record(self, context: str, latency_seconds: float) -> None:
+        """Record the latency of a successful request.
+
+        Args:
+            context: Request context (e.g. "get_directions_api")
+            latency_seconds: Time from sending the request to the full response
+        """
+        samples = self._samples.get(context)
+        if samples is None:
+            samples = deque(maxlen=self._max_samples)
+            self._samples[context] = samples
+        samples.append(latency_seconds)
+
+    def percentile(self, context: str, percentile: float) -> Optional[float]:
+        """Get a latency percentile for a request context.
+
+        Args:
+            context: Request context
+            percentile: Percentile between 0 and 100
+
+        Returns:
+            Latency in seconds, or None if there are too few samples
+        """
+        samples = self._samples.get(context)
+        if not samples or len(samples) < self._min_samples:
+            return None
+
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[index]
+
+
+# Statuses that may succeed on retry; other 4xx responses are terminal
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Circuit breakers and retry budget shared by all service instances
+_CIRCUIT_BREAKERS: Dict[str, CircuitBreaker] = {}
+_RETRY_BUDGET = RetryBudget()
+_PREFLIGHT_CACHE = PreflightCache()
+
+# Sale IDs whose session search came back empty, shared by every instance
+_NO_SESSIONS_CACHE = NegativeCache()
+_LATENCY_TRACKER = LatencyTracker()
+
+# Validated auth token, shared so logins after the first skip the token store
+_TOKEN_MEMO = TokenMemo()
+# Concurrent logins in one process share a single attempt
+_LOGIN_FLIGHT = SingleFlight()
+
+# Adaptive timeout floor for endpoints known to be slow, overriding
+# scraping.web.min_request_timeout; large picklists take several seconds
+MIN_REQUEST_TIMEOUTS: Dict[str, float] = {
+    "get_directions_api": 15.0,
+}
+
+# Contexts whose requests may be hedged, and whether the current call wants it
+HEDGEABLE_CONTEXTS = frozenset({"get_directions_api"})
+_HEDGE_REQUESTS: ContextVar[bool] = ContextVar("skuvault_hedge_requests", default=False)
+
+# Default lane per request context; request_priority() overrides it
+CONTEXT_PRIORITIES: Dict[str, RequestPriority] = {
+    "get_login_page": RequestPriority.INTERACTIVE,
+    "submit_login": RequestPriority.INTERACTIVE,
+    "get_sessions_api": RequestPriority.INTERACTIVE,
+    "get_all_sessions_api": RequestPriority.BULK,
+}
+_REQUEST_PRIORITY: ContextVar[Optional[RequestPriority]] = ContextVar(
+    "skuvault_request_priority", default=None
+)
+
+# Monotonic time by which the current call chain must finish, if any
+_DEADLINE: ContextVar[Optional[float]] = ContextVar("skuvault_deadline", default=None)
+
+
+class DeadlineExceededError(Exception):
+    """Raised when a call's time budget runs out before its work is done."""
+
+
+class IncompleteStreamError(Exception):
+    """Raised when a streamed response fails before all of it was read."""
+
+
+def _remaining_time() -> Optional[float]:
+    """Seconds left before the current call's deadline, or None if unbounded."""
+    expires_at = _DEADLINE.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+def decode_json(content: bytes) -> Any:
+    """Decode a JSON response body, using orjson when it is installed.
+
+    Args:
+        content: Raw response bytes
+
+    Returns:
+        Decoded JSON value
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON (orjson's error
+            type is a subclass)
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def validate_response(model: type, data: Any) -> Any:
+    """Validate an API response into a Pydantic model.
+
+    Raw bytes are validated directly by pydantic-core, without first
+    building an intermediate dict tree. Already-decoded dicts and existing
+    model instances are accepted as well.
+
+    Args:
+        model: Pydantic model class, e.g. ``DirectionsResponse``
+        data: Raw response bytes/str, a decoded dict or a ``model`` instance
+
+    Returns:
+        Validated model instance
+
+    Raises:
+        pydantic.ValidationError: If the data does not match the model
+    """
+    if isinstance(data, model):
+        return data
+    if isinstance(data, (bytes, bytearray, str)):
+        return model.model_validate_json(data)
+    return model.model_validate(data)
+
+
+@functools.lru_cache(maxsize=1)
+def get_marketplace_parser() -> "MarketplaceIdParser":
+    """Get the shared MarketplaceIdParser instance.
+
+    Imported lazily to avoid circular imports, and built once because its
+    patterns are compiled on construction.
+
+    Returns:
+        The process-wide parser
+    """
+    from jerky_data_hub.services.marketplace_id_parser import MarketplaceIdParser
+
+    return MarketplaceIdParser()
+
+
+@functools.lru_cache(maxsize=16384)
+def _parse_sale_id_cached(sale_id: str) -> Any:
+    """Parse a sale ID with the shared parser; the memoized result is shared."""
+    return get_marketplace_parser().parse_sale_id(sale_id)
+
+
+def parse_sale_id(sale_id: str) -> Any:
+    """Parse a sale ID with the shared parser, memoizing the result.
+
+    Sale IDs are immutable and parsing depends on nothing else, so cached
+    results never go stale. Each caller gets its own copy of the cached
+    result, so mutating it cannot affect later parses.
+
+    Args:
+        sale_id: SkuVault sale ID, e.g. ``1-352444-5-13038-480797-JK3825-RW``
+
+    Returns:
+        The parser's result (``success``, ``order_number``, ``shipment_id``, ...)
+    """
+    return copy.deepcopy(_parse_sale_id_cached(sale_id))
+
+
+def parse_sale_ids(sale_ids: Iterable[str]) -> Dict[str, Any]:
+    """Parse many sale IDs at once, parsing each distinct ID only once.
+
+    Args:
+        sale_ids: Sale IDs to parse, e.g. every order in a persistence batch
+
+    Returns:
+        Mapping of each distinct sale ID to its parse result
+    """
+    return {sale_id: parse_sale_id(sale_id) for sale_id in dict.fromkeys(sale_ids)}
+
+
+def build_order_directions(
+    picklist_id: str, order_index: int, order: Order
+) -> List[ParsedDirection]:
+    """Flatten one picklist order into parsed directions.
+
+    Args:
+        picklist_id: The picklist the order belongs to
+        order_index: 1-based position of the order in the picklist (spot number)
+        order: The order to flatten
+
+    Returns:
+        One direction per item location, or one per item without locations
+    """
+    directions = []
+    for item in order.items or []:
+        # Extract location information
+        if item.locations:
+            for location in item.locations:
+                directions.append(
+                    ParsedDirection(
+                        picklist_id=picklist_id,
+                        sku=item.sku,
+                        sku_name=item.description,
+                        location=location.name,
+                        spot_number=order_index,
+                        bin_info=(
+                            str(location.warehouse_code)
+                            if location.warehouse_code
+                            else None
+                        ),
+                        quantity=item.quantity,
+                        order_number=order.id,
+                        warehouse=location.warehouse_code,
+                        extracted_at=time.time(),
+                    )
+                )
+        else:
+            # If no locations, still create a direction entry
+            directions.append(
+                ParsedDirection(
+                    picklist_id=picklist_id,
+                    sku=item.sku,
+                    sku_name=item.description,
+                    quantity=item.quantity,
+                    order_number=order.id,
+                    spot_number=order_index,
+                    extracted_at=time.time(),
+                )
+            )
+    return directions
+
+
+class DirectionsStreamParser:
+    """Incremental parser for directions response bodies.
+
+    Bytes are fed in as they arrive from the network. Each element of
+    ``picklist.orders`` and ``history`` is materialized on its own as soon as
+    it is complete, so memory use is bounded by the largest single order
+    rather than by the size of the whole response. Requires ``ijson``.
+    """
+
+    ORDER_PREFIX = "picklist.orders.item"
+    HISTORY_PREFIX = "history.item"
+
+    def __init__(self, picklist_id: str):
+        """Initialize the parser.
+
+        Args:
+            picklist_id: The picklist the response belongs to
+
+        Raises:
+            RuntimeError: If ijson is not installed
+        """
+        if ijson is None:
+            raise RuntimeError("ijson is required for streaming directions")
+
+        self.picklist_id = picklist_id
+        self._events = ijson.sendable_list()
+        self._parser = ijson.parse_coro(self._events, use_float=True)
+        self._builder: Optional[Any] = None
+        self._builder_prefix: Optional[str] = None
+
+        self.bytes_fed = 0
+        self.orders_parsed = 0
+        self.history_parsed = 0
+
+    def feed(self, chunk: bytes) -> List[Union[ParsedDirection, HistoryItem]]:
+        """Feed the next chunk of the response body.
+
+        Args:
+            chunk: Next chunk of response bytes
+
+        Returns:
+            Records completed by this chunk, in document order
+
+        Raises:
+            ijson.JSONError: If the body is not valid JSON
+        """
+        self.bytes_fed += len(chunk)
+        self._parser.send(chunk)
+        return self._drain()
+
+    def close(self) -> List[Union[ParsedDirection, HistoryItem]]:
+        """Signal the end of the body.
+
+        Returns:
+            Any records completed by the final bytes
+
+        Raises:
+            ijson.IncompleteJSONError: If the body was truncated
+        """
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> List[Union[ParsedDirection, HistoryItem]]:
+        """Turn buffered parse events into completed records."""
+        records: List[Union[ParsedDirection, HistoryItem]] = []
+
+        for prefix, event, value in self._events:
+            if self._builder is not None:
+                self._builder.event(event, value)
+                if prefix == self._builder_prefix and event == "end_map":
+                    records.extend(self._build(self._builder_prefix, self._builder.value))
+                    self._builder = None
+            elif event == "start_map" and prefix in (self.ORDER_PREFIX, self.HISTORY_PREFIX):
+                self._builder = ijson.ObjectBuilder()
+                self._builder.event(event, value)
+                self._builder_prefix = prefix
+
+        del self._events[:]
+        return records
+
+    def _build(
+        self, prefix: str, value: Dict[str, Any]
+    ) -> List[Union[ParsedDirection, HistoryItem]]:
+        """Validate one completed array element into records."""
+        if prefix == self.HISTORY_PREFIX:
+            self.history_parsed += 1
+            return [HistoryItem.model_validate(value)]
+
+        self.orders_parsed += 1
+        return build_order_directions(
+            self.picklist_id, self.orders_parsed, Order.model_validate(value)
+        )
+
+
+# Endpoint family for each request context, used to pick a rate limiter
+ENDPOINT_FAMILIES: Dict[str, str] = {
+    "get_login_page": "login",
+    "submit_login": "login",
+    "get_sessions_api": "sessions",
+    "get_all_sessions_api": "sessions",
+    "get_directions_api": "directions",
+}
+
+# Rate limiters shared across service instances, per event loop
+_RATE_LIMITERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, TokenBucketRateLimiter]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class SkuVaultWebService:
+    """Service for SkuVault web interface integration using discovered API endpoints."""
+
+    def __init__(self):
+        """Initialize the web service."""
+        self.settings = Settings.get()
+        self.logger = CloudLoggingService("skuvault.web")
+
+        # Warm-up state and hosts whose first request has been logged
+        self._warmed = False
+        self._first_request_hosts: set = set()
+
+        # Connection usage: responses per HTTP version and per connection
+        self._http_version_counts: Counter = Counter()
+        self._connection_stream_counts: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._requests_in_flight = 0
+        self._peak_requests_in_flight = 0
+
+        self.session = self._create_http_client()
+        self.is_authenticated = False
+        self.auth_token = None
+
+        # Initialize token cache service
+        self.token_cache = TokenCacheService()
+
+        web_settings = self.settings.skuvault.scraping.web
+
+        # Validated token memoized for the process and renewed in the
+        # background before it expires, so API calls never wait on a login
+        self.token_memo = _TOKEN_MEMO
+        self.token_lifetime_hours = self._get_setting(web_settings, "token_lifetime_hours", 24)
+        self.token_refresh_fraction = self._get_setting(
+            web_settings, "token_refresh_fraction", 0.8
+        )
+        self.token_refresh_retry_seconds = self._get_setting(
+            web_settings, "token_refresh_retry_seconds", 60
+        )
+        self._token_refresh_task: Optional["asyncio.Task[None]"] = None
+
+        # Only one worker logs in at a time; the others wait for its token.
+        # Workers in different processes coordinate through the shared cache
+        self.login_lease_seconds = self._get_setting(web_settings, "login_lease_seconds", 60)
+        self.login_lease_wait_seconds = self._get_setting(
+            web_settings, "login_lease_wait_seconds", 30
+        )
+        self.login_lease_poll_seconds = self._get_setting(
+            web_settings, "login_lease_poll_seconds", 1.0
+        )
+
+        # In-flight request deduplication for identical read requests
+        self._single_flight = SingleFlight()
+
+        # Hedged requests for interactive directions lookups
+        self.hedging_enabled = self._get_setting(web_settings, "hedge_requests", False)
+        self._hedge_budget = RetryBudget(
+            retry_ratio=self._get_setting(web_settings, "hedge_budget_percent", 5) / 100,
+            min_retries_per_second=0.0,
+            window_seconds=60.0,
+        )
+        self._hedges_sent = 0
+        self._hedge_wins = 0
+
+        # Initialize directions cache. Closed sessions never change, so by
+        # default their directions do not expire; live sessions expire fast
+        cache_settings = self.settings.skuvault.scraping.cache
+        self.directions_cache = DirectionsCache(
+            max_size=cache_settings.max_directions_cache_size,
+            ttl_seconds=cache_settings.directions_cache_ttl_seconds,
+            state_ttls={
+                SessionState.CLOSED: self._get_setting(
+                    cache_settings, "directions_cache_closed_ttl_seconds", None
+                ),
+                SessionState.READY_TO_SHIP: self._get_setting(
+                    cache_settings, "directions_cache_ready_to_ship_ttl_seconds", 300
+                ),
+                SessionState.ACTIVE: self._get_setting(
+                    cache_settings, "directions_cache_active_ttl_seconds", 60
+                ),
+            },
+            max_bytes=self._get_setting(
+                cache_settings, "directions_cache_max_bytes", 64 * 1024 * 1024
+            ),
+            compress=self._get_setting(cache_settings, "directions_cache_compress", False),
+        )
+
+        # Optional cross-process tier behind the directions cache, also used
+        # to share sessions lists between workers for a short time
+        self.shared_cache = self._create_shared_cache(cache_settings)
+        self.sessions_cache_ttl = self._get_setting(
+            cache_settings, "sessions_cache_ttl_seconds", 15
+        )
+        self.shared_cache_max_ttl = self._get_setting(
+            cache_settings, "shared_cache_max_ttl_seconds", 7 * 24 * 3600
+        )
+        self._background_tasks: set = set()
+
+        # Warm restarts: the directions cache saved at last shutdown is
+        # reloaded off the event loop by warm() or on entering the context
+        self.cache_snapshot_path = self._get_setting(cache_settings, "snapshot_path", None)
+        self._snapshot_loaded = False
+
+        # CORS preflight handling: "skip" sends no OPTIONS requests (they are
+        # only enforced by browsers); "cached" shares results across instances
+        self.cors_preflight_mode = self._get_setting(
+            web_settings, "cors_preflight_mode", "cached"
+        )
+        self.cors_preflight_cache = _PREFLIGHT_CACHE
+        self.cors_preflight_ttl = self._get_setting(
+            web_settings, "cors_preflight_ttl_seconds", 300
+        )
+
+        # Pages of the sessions list fetched at once by iter_all_sessions
+        self.sessions_page_concurrency = self._get_setting(
+            web_settings, "sessions_page_concurrency", 4
+        )
+        self.sessions_max_pages = self._get_setting(web_settings, "sessions_max_pages", 100)
+
+        # Local sale_id -> session index fed by sessions and directions sweeps
+        self.sale_index = SaleSessionIndex(
+            max_picklists=self._get_setting(cache_settings, "sale_index_max_picklists", 5000),
+            max_age_seconds=self._get_setting(
+                cache_settings, "sale_index_max_age_seconds", 120
+            ),
+        )
+
+        # Short-lived memory of sale IDs that are in no wave-picking session
+        self.no_sessions_cache = _NO_SESSIONS_CACHE
+        self.no_sessions_ttl = self._get_setting(
+            cache_settings, "no_sessions_ttl_seconds", 120
+        )
+
+        # Configure session with base headers
+        self.session.headers.update(
+            {
+                "User-Agent": self.settings.skuvault.scraping.web.user_agent,
+                "Accept": "application/json, text/plain, */*",
+                "Accept-Language": "en-US,en;q=0.9",
+                "Accept-Encoding": "gzip, deflate, br",
+                "Connection": "keep-alive",
+                "Sec-Fetch-Dest": "empty",
+                "Sec-Fetch-Mode": "cors",
+                "Sec-Fetch-Site": "same-site",
+            }
+        )
+
+    def _get_setting(self, section: Any, name: str, default: Any) -> Any:
+        """Read an optional tuning setting, falling back to a default.
+
+        Args:
+            section: Settings section object (e.g. ``scraping.web``)
+            name: Attribute name within the section
+            default: Value used when the setting is not configured
+
+        Returns:
+            The configured value, or ``default`` if unset
+        """
+        value = getattr(section, name, None)
+        return default if value is None else value
+
+    def _create_shared_cache(self, cache_settings: Any) -> Optional[SharedCache]:
+        """Create the shared cache tier configured by ``scraping.cache.shared_backend``.
+
+        ``"sqlite"`` shares a local database file (``shared_cache_path``)
+        between the workers on one host; ``"redis"`` uses the server at
+        ``shared_cache_url``. Any other value, or a backend that cannot be
+        opened, leaves the tier disabled.
+
+        Args:
+            cache_settings: The ``scraping.cache`` settings section
+
+        Returns:
+            The shared cache, or None if disabled
+        """
+        backend_name = self._get_setting(cache_settings, "shared_backend", "none")
+        try:
+            if backend_name == "sqlite":
+                backend = SQLiteCacheBackend(
+                    self._get_setting(
+                        cache_settings, "shared_cache_path", "/tmp/skuvault_web_cache.sqlite3"
+                    )
+                )
+            elif backend_name == "redis":
+                backend = RedisCacheBackend(
+                    self._get_setting(
+                        cache_settings, "shared_cache_url", "redis://localhost:6379/0"
+                    )
+                )
+            else:
+                return None
+        except Exception as e:
+            self.logger.warning(
+                LogContext(
+                    step="shared_cache",
+                    action="backend_unavailable",
+                    details={"backend": backend_name, "error": str(e)},
+                )
+            )
+            return None
+
+        return SharedCache(backend)
+
+    def _get_shared_directions_ttl(self, picklist_id: str) -> float:
+        """Get the shared cache TTL for a picklist's directions.
+
+        Uses the same session-state TTL as the in-memory cache, capped so
+        entries for closed sessions do not accumulate in the store forever.
+        """
+        ttl = self.directions_cache.get_ttl_for(picklist_id)
+        if ttl is None:
+            return self.shared_cache_max_ttl
+        return min(ttl, self.shared_cache_max_ttl)
+
+    def _run_in_background(self, coro: Awaitable[Any]) -> None:
+        """Run a coroutine without awaiting it, keeping a reference until done.
+
+        Used by synchronous methods that need to touch the shared cache. The
+        coroutine is dropped if no event loop is running.
+        """
+        try:
+            task = asyncio.get_running_loop().create_task(coro)
+        except RuntimeError:
+            coro.close()
+            return
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """Create the pooled async HTTP client used for all SkuVault calls.
+
+        Pool sizes come from ``scraping.web.max_connections`` and
+        ``scraping.web.max_keepalive_connections`` when configured. Setting
+        ``scraping.web.http2`` enables HTTP/2, which multiplexes requests over
+        one connection per host; servers that do not offer HTTP/2 during the
+        TLS handshake are used over HTTP/1.1 automatically.
+
+        Returns:
+            Configured ``httpx.AsyncClient``
+        """
+        web_settings = self.settings.skuvault.scraping.web
+        self.http2_enabled = False
+        if self._get_setting(web_settings, "http2", False):
+            if HTTP2_AVAILABLE:
+                self.http2_enabled = True
+            else:
+                self.logger.warning(
+                    LogContext(
+                        step="http_client",
+                        action="http2_unavailable",
+                        details={
+                            "reason": "h2 package not installed, using HTTP/1.1",
+                        },
+                    )
+                )
+
+        limits = httpx.Limits(
+            max_connections=self._get_setting(web_settings, "max_connections", 50),
+            max_keepalive_connections=self._get_setting(
+                web_settings, "max_keepalive_connections", 20
+            ),
+            keepalive_expiry=self._get_setting(
+                web_settings, "keepalive_expiry_seconds", 30.0
+            ),
+        )
+        # Resolve hosts through a DNS cache unless its TTL is set to 0. Behind
+        # an egress proxy the proxy resolves hosts, and httpx only applies
+        # proxy environment variables to clients built without a transport
+        self.dns_cache: Optional[CachingDNSBackend] = None
+        dns_ttl = self._get_setting(web_settings, "dns_cache_ttl_seconds", 300)
+        if dns_ttl <= 0 or urllib.request.getproxies():
+            return httpx.AsyncClient(
+                limits=limits,
+                http2=self.http2_enabled,
+                timeout=web_settings.request_timeout,
+                follow_redirects=True,
+            )
+
+        self.dns_cache = CachingDNSBackend(httpcore.AnyIOBackend(), ttl_seconds=dns_ttl)
+        return httpx.AsyncClient(
+            transport=CachingDNSTransport(self.dns_cache, limits, http2=self.http2_enabled),
+            timeout=web_settings.request_timeout,
+            follow_redirects=True,
+        )
+
+    def _record_connection_usage(self, response: httpx.Response) -> None:
+        """Record which HTTP version and connection served a response.
+
+        Args:
+            response: Completed response
+        """
+        self._http_version_counts[response.http_version] += 1
+
+        network_stream = response.extensions.get("network_stream")
+        if network_stream is None:
+            return
+
+        connection_id = id(network_stream)
+        usage = self._connection_stream_counts.get(connection_id)
+        if usage is None:
+            usage = {
+                "host": response.url.host,
+                "http_version": response.http_version,
+                "streams": 0,
+            }
+            self._connection_stream_counts[connection_id] = usage
+            # Keep only recently used connections
+            while len(self._connection_stream_counts) > 64:
+                self._connection_stream_counts.popitem(last=False)
+        else:
+            self._connection_stream_counts.move_to_end(connection_id)
+        usage["streams"] += 1
+
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """Get HTTP connection pool and multiplexing statistics.
+
+        Returns:
+            Dictionary with HTTP version counts, streams served per recent
+            connection, in-flight request counts, the pool's own
+            description of each open connection and DNS cache statistics
+        """
+        pool = getattr(getattr(self.session, "_transport", None), "_pool", None)
+        pool_connections = [
+            connection.info() for connection in getattr(pool, "connections", [])
+        ]
+
+        return {
+            "http2_enabled": self.http2_enabled,
+            "responses_by_http_version": dict(self._http_version_counts),
+            "connections": [
+                {"connection": index, **usage}
+                for index, usage in enumerate(self._connection_stream_counts.values())
+            ],
+            "requests_in_flight": self._requests_in_flight,
+            "peak_requests_in_flight": self._peak_requests_in_flight,
+            "pool_connections": pool_connections,
+            "dns_cache": self.dns_cache.get_stats() if self.dns_cache else None,
+        }
+
+    def _record_first_request(
+        self, host: str, context: str, latency_seconds: float
+    ) -> None:
+        """Log the latency of the first request this service made to a host.
+
+        Args:
+            host: Host the request was sent to
+            context: Request context
+            latency_seconds: Request latency
+        """
+        if host in self._first_request_hosts:
+            return
+
+        self._first_request_hosts.add(host)
+        self.logger.info(
+            LogContext(
+                step="http_client",
+                action="first_request",
+                details={
+                    "host": host,
+                    "context": context,
+                    "warmed": self._warmed,
+                    "latency_ms": int(latency_seconds * 1000),
+                },
+            )
+        )
+
+    async def warm(self) -> Dict[str, Any]:
+        """Pre-resolve hosts, pre-open pooled connections and load the token.
+
+        Resolves DNS for the login host and lmdb.skuvault.com, opens
+        ``scraping.web.warm_connections`` pooled connections to each (one is
+        enough with HTTP/2), checks the cached token and loads the directions
+        cache snapshot, all in parallel, so the first sync cycle does not pay
+        DNS, TCP and TLS setup.
+
+        Returns:
+            Dictionary with warm-up duration, whether a cached token was
+            loaded, snapshot entries loaded and any per-host errors
+        """
+        web_settings = self.settings.skuvault.scraping.web
+        login_url = httpx.URL(str(web_settings.login_url))
+        origins = [
+            f"{login_url.scheme}://{login_url.host}/",
+            "https://lmdb.skuvault.com/",
+        ]
+        connections_per_host = (
+            1 if self.http2_enabled
+            else self._get_setting(web_settings, "warm_connections", 2)
+        )
+
+        async def open_connection(origin: str) -> None:
+            # Any response leaves a connection in the pool; status is irrelevant
+            await self.session.head(origin, timeout=web_settings.request_timeout)
+
+        started_at = time.monotonic()
+        warm_tasks = [
+            open_connection(origin)
+            for origin in origins
+            for _ in range(connections_per_host)
+        ]
+        results = await asyncio.gather(
+            self.check_cached_token(),
+            self._load_cache_snapshot_once(),
+            *warm_tasks,
+            return_exceptions=True,
+        )
+        duration_ms = (time.monotonic() - started_at) * 1000
+        self._warmed = True
+
+        token_loaded = results[0] is True
+        snapshot_entries = results[1] if isinstance(results[1], int) else 0
+        errors = [
+            f"{type(result).__name__}: {result}"
+            for result in results[2:]
+            if isinstance(result, Exception)
+        ]
+
+        self.logger.info(
+            LogContext(
+                step="http_client",
+                action="warm_complete",
+                details={
+                    "duration_ms": int(duration_ms),
+                    "token_loaded": token_loaded,
+                    "snapshot_entries": snapshot_entries,
+                    "connections_requested": len(warm_tasks),
+                    "errors": errors,
+                },
+            )
+        )
+
+        return {
+            "duration_ms": duration_ms,
+            "token_loaded": token_loaded,
+            "snapshot_entries": snapshot_entries,
+            "errors": errors,
+        }
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool and the shared cache.
+
+        Saves a directions cache snapshot first when ``scraping.cache.snapshot_path``
+        is configured.
+        """
+        self._cancel_token_refresh()
+        if self.cache_snapshot_path:
+            await self.save_directions_cache_snapshot()
+        if not self.session.is_closed:
+            await self.session.aclose()
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        if self.shared_cache is not None:
+            await self.shared_cache.close()
+            self.shared_cache = None
+
+    def _get_all_session_states(self) -> List[str]:
+        """Get all valid session states for API requests.
+
+        Returns:
+            List of session state string values for API consumption
+        """
+        return [state.value for state in SessionState]
+
+    def get_session_states_by_names(self, state_names: List[str]) -> List[str]:
+        """Get session state values by their names or values, with validation.
+
+        This method accepts both enum names (e.g., "READY_TO_SHIP") and enum values (e.g., "readyToShip")
+        and converts them to the appropriate string values for API consumption.
+
+        Args:
+            state_names: List of state names or values to convert to API values
+
+        Returns:
+            List of validated session state string values
+
+        Raises:
+            ValueError: If any state name or value is invalid
+        """
+        valid_states = []
+        for name in state_names:
+            try:
+                # First try to find state by name (case-insensitive)
+                state = next(
+                    (s for s in SessionState if s.name.lower() == name.lower()), None
+                )
+
+                # If not found by name, try to find by value (case-insensitive)
+                if not state:
+                    state = next(
+                        (s for s in SessionState if s.value.lower() == name.lower()), None
+                    )
+
+                if state:
+                    valid_states.append(state.value)
+                else:
+                    raise ValueError(f"Invalid session state: {name}")
+            except Exception as e:
+                raise ValueError(f"Invalid session state '{name}': {e}")
+
+        return valid_states
+
+    def validate_session_state(self, state_value: str) -> bool:
+        """Validate if a session state value is valid.
+
+        Args:
+            state_value: The state value to validate
+
+        Returns:
+            True if valid, False otherwise
+        """
+        try:
+            SessionState(state_value)
+            return True
+        except ValueError:
+            return False
+
+    async def __aenter__(self):
+        """Async context manager entry; loads the directions cache snapshot."""
+        await self._load_cache_snapshot_once()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        self.logout()
+        await self.aclose()
+
+    async def login(self) -> bool:
+        """Authenticate with SkuVault web interface.
+
+        Returns:
+            True if login successful, False otherwise
+        """
+        try:
+            # First check if we have a valid cached token
+            if await self.check_cached_token():
+                self.logger.info(
                     LogContext(
                         step="login",
-                        action="login_successful",
+                        action="cached_token_used",
                         details=ServiceDetails(
                             status="success"
                         ),
                     )
                 )
-            else:
-                self.logger.error(
-                    ErrorContext(
-                        error=ErrorDetail(
-                            type="AuthenticationError",
-                            message="Login credentials rejected or unexpected response",
-                            traceback="",
-                        ),
-                        details=ErrorDetails(
-                            step="login",
-                            action="login_failed",
-                            error_type="authentication_error"
+                return True
+
+            return await self._login_exclusively()
+
+        except Exception as e:
+            self.logger.error(
+                ErrorContext(
+                    error=ErrorDetail(
+                        type=type(e).__name__, message=str(e), traceback=""
+                    ),
+                    details=ErrorDetails(
+                        step="login",
+                        action="login_exception",
+                        error_type="login_error"
+                    ),
+                )
+            )
+            return False
+
+    async def _login_exclusively(self) -> bool:
+        """Log in, letting only one worker at a time run the HTML login.
+
+        Concurrent calls in this process share one attempt, which may have
+        been started by another service; every caller then takes the token
+        from the token memo. Across processes the attempt is guarded by a
+        lease in the shared cache (``scraping.cache.shared_backend``);
+        without one, each process logs in on its own.
+
+        Returns:
+            True if this service now has a valid token, False otherwise
+        """
+        stale_token = self.auth_token
+        await _LOGIN_FLIGHT.do("login", lambda: self._login_under_lease(stale_token))
+
+        # The shared attempt may have logged in without extracting a token
+        token = self.token_memo.get()
+        if not token or token == stale_token:
+            return False
+        self._use_token(token)
+        return True
+
+    async def _login_under_lease(self, stale_token: Optional[str]) -> bool:
+        """Log in while holding the fleet-wide login lease.
+
+        Workers that find the lease taken poll ``TokenCacheService`` every
+        ``login_lease_poll_seconds`` for the token the holder stores. After
+        ``login_lease_wait_seconds`` without one, the holder is assumed to be
+        stuck and this worker logs in anyway, after a random delay of up to
+        another ``login_lease_wait_seconds`` so that workers do not all fall
+        back at the same moment. If the shared cache cannot be reached there
+        is no holder to wait for, so the worker logs in after a random delay
+        of up to ``login_lease_poll_seconds``.
+
+        Args:
+            stale_token: Token being replaced, which does not count as fresh
+
+        Returns:
+            True if login successful or a fresh token was adopted, False otherwise
+        """
+        if self.shared_cache is None:
+            return await self._login_with_credentials()
+
+        deadline = time.monotonic() + self.login_lease_wait_seconds
+        while True:
+            try:
+                owner = await self.shared_cache.acquire_lease(
+                    "login", self.login_lease_seconds
+                )
+            except LeaseUnavailableError as e:
+                self.logger.warning(
+                    LogContext(
+                        step="login",
+                        action="lease_unavailable",
+                        details={"error": str(e)},
+                    )
+                )
+                await asyncio.sleep(random.uniform(0, self.login_lease_poll_seconds))
+                if await self._adopt_fresh_cached_token(stale_token):
+                    return True
+                return await self._login_with_credentials()
+
+            if owner is not None:
+                try:
+                    # The previous holder may have finished just before we
+                    # took the lease
+                    if await self._adopt_fresh_cached_token(stale_token):
+                        return True
+                    return await self._login_with_credentials()
+                finally:
+                    await self.shared_cache.release_lease("login", owner)
+
+            if time.monotonic() >= deadline:
+                self.logger.warning(
+                    LogContext(
+                        step="login",
+                        action="lease_wait_timeout",
+                        details={"waited_seconds": self.login_lease_wait_seconds},
+                    )
+                )
+                await asyncio.sleep(random.uniform(0, self.login_lease_wait_seconds))
+                if await self._adopt_fresh_cached_token(stale_token):
+                    return True
+                return await self._login_with_credentials()
+
+            await asyncio.sleep(self.login_lease_poll_seconds)
+            if await self._adopt_fresh_cached_token(stale_token):
+                self.logger.info(
+                    LogContext(
+                        step="login",
+                        action="token_from_lease_holder",
+                        details=ServiceDetails(
+                            status="success"
                         ),
                     )
                 )
+                return True
 
-            return success
+    async def _adopt_fresh_cached_token(self, stale_token: Optional[str]) -> bool:
+        """Use the token in ``TokenCacheService`` if it is valid and not the stale one.
 
-        except Exception as e:
+        Args:
+            stale_token: Token being replaced, or None
+
+        Returns:
+            True if a fresh token was found and used, False otherwise
+        """
+        try:
+            cached_token = await self.token_cache.get_token("skuvault_web")
+        except Exception:
+            return False
+
+        if not cached_token or cached_token.is_expired or cached_token.token == stale_token:
+            return False
+
+        self._use_token(cached_token.token)
+        self._remember_token(cached_token.token, *self._get_cached_token_times(cached_token))
+        return True
+
+    async def _reauthenticate(self, context: str, rejected_token: str) -> bool:
+        """Replace a token the API rejected, sharing the work between callers.
+
+        Every request that was sent with the rejected token waits for the
+        same re-login; requests that were sent after the token had already
+        been replaced just replay with the current one.
+
+        Args:
+            context: Context of the rejected request, for logging
+            rejected_token: Token the API answered 401 to
+
+        Returns:
+            True if a different token is now in use, False otherwise
+
+        Raises:
+            DeadlineExceededError: If the caller's deadline passes while waiting
+        """
+        if self.auth_token and self.auth_token != rejected_token:
+            return True
+
+        self.logger.warning(
+            LogContext(
+                step="authentication",
+                action="token_rejected",
+                details={"context": context},
+            )
+        )
+        await self._coalesce(
+            "reauthenticate", lambda: self._replace_rejected_token(rejected_token)
+        )
+        return bool(self.auth_token) and self.auth_token != rejected_token
+
+    async def _replace_rejected_token(self, rejected_token: str) -> bool:
+        """Drop a rejected token everywhere it is cached and log in again.
+
+        A token that another service or worker has already obtained is
+        adopted instead of logging in. Runs in its own task, so the login is
+        not cut short by the deadline of the request that triggered it.
+
+        Args:
+            rejected_token: Token the API answered 401 to
+
+        Returns:
+            True if a new token is in use, False otherwise
+        """
+        _DEADLINE.set(None)
+
+        if self.token_memo.token == rejected_token:
+            self.token_memo.clear()
+        else:
+            token = self.token_memo.get()
+            if token:
+                self._use_token(token)
+                self._schedule_token_refresh()
+                return True
+
+        if await self._adopt_fresh_cached_token(rejected_token):
+            return True
+
+        await self._invalidate_cached_token()
+        return await self._login_exclusively()
+
+    async def _login_with_credentials(self) -> bool:
+        """Log in through the HTML login form and store the new token.
+
+        Used by ``login`` and by the background token refresh. The current
+        token and API headers stay in place until a new token is extracted,
+        so requests in flight during a refresh are not affected.
+
+        Returns:
+            True if login successful, False otherwise
+        """
+        self.logger.info(
+            LogContext(
+                step="login",
+                action="start_login",
+                details=ServiceDetails(
+                    status="starting"
+                ),
+            )
+        )
+
+        # Get login page to extract form data
+        login_response = await self._make_request(
+            "GET",
+            str(self.settings.skuvault.scraping.web.login_url),
+            "get_login_page",
+        )
+
+        if not login_response:
             self.logger.error(
                 ErrorContext(
                     error=ErrorDetail(
-                        type=type(e).__name__, message=str(e), traceback=""
+                        type="RequestError",
+                        message="Failed to get login page",
+                        traceback="",
                     ),
                     details=ErrorDetails(
                         step="login",
-                        action="login_exception",
-                        error_type="login_error"
+                        action="get_login_page_failed",
+                        error_type="request_error"
+                    ),
+                )
+            )
+            return False
+
+        # Parse login form
+        soup = BeautifulSoup(login_response.text, "lxml")
+        form = soup.find("form")
+
+        if not form:
+            self.logger.error(
+                ErrorContext(
+                    error=ErrorDetail(
+                        type="ParseError",
+                        message="Login form not found on page",
+                        traceback="",
+                    ),
+                    details=ErrorDetails(
+                        step="login",
+                        action="form_not_found",
+                        error_type="parse_error"
                     ),
                 )
             )
             return False
 
-    async def get_sessions_by_sale_id(self, sale_id: str) -> List[ParsedSession]:
+        self.logger.info(
+            LogContext(
+                step="login",
+                action="form_found",
+                details=ServiceDetails(
+                    status="success"
+                ),
+            )
+        )
+
+        # Prepare login data
+        login_data = {
+            "Email": self.settings.skuvault.scraping.web.username,
+            "Password": self.settings.skuvault.scraping.web.password,
+        }
+
+        # Submit login form
+        login_response = await self._make_request(
+            "POST",
+            str(self.settings.skuvault.scraping.web.login_url),
+            "submit_login",
+            data=login_data,
+        )
+
+        if not login_response:
+            return False
+
+        # Check if login was successful
+        success = self._is_login_successful(login_response)
+
+        if success:
+            self.is_authenticated = True
+            token = self._extract_auth_token()
+
+            # Store token in cache if extraction was successful
+            if token:
+                await self._store_token_in_cache()
+                now = time.time()
+                self._remember_token(token, now, now + self.token_lifetime_hours * 3600)
+
+            self.logger.info(
+                LogContext(
+                    step="login",
+                    action="login_successful",
+                    details=ServiceDetails(
+                        status="success"
+                    ),
+                )
+            )
+        else:
+            self.logger.error(
+                ErrorContext(
+                    error=ErrorDetail(
+                        type="AuthenticationError",
+                        message="Login credentials rejected or unexpected response",
+                        traceback="",
+                    ),
+                    details=ErrorDetails(
+                        step="login",
+                        action="login_failed",
+                        error_type="authentication_error"
+                    ),
+                )
+            )
+
+        return success
+
+    async def get_sessions_by_sale_id(
+        self, sale_id: str, deadline: Optional[float] = None
+    ) -> List[ParsedSession]:
         """Get sessions data for a specific sale ID using the real API endpoint.
 
+        Answered from the local sale_id index, with the same substring
+        matching as the API search, while a complete sessions sweep and the
+        directions of every swept picklist are fresher than
+        ``scraping.cache.sale_index_max_age_seconds``; otherwise the API is
+        searched.
+
         Args:
             sale_id: The sale ID to search for
+            deadline: Optional time budget in seconds for the whole lookup
 
         Returns:
             List of parsed session data
@@ -449,6 +3542,7 @@ class SkuVaultWebService:
             )
             return []
 
+        deadline_token = self._start_deadline(deadline)
         try:
             self.logger.info(
                 LogContext(
@@ -460,13 +3554,38 @@ class SkuVaultWebService:
                 )
             )
 
+            # Answer from the local index when a recent complete sweep covers
+            # every session
+            indexed = self.sale_index.lookup(sale_id)
+            if indexed is not None:
+                self.logger.debug(
+                    LogContext(
+                        step="get_sessions",
+                        action="sale_index_hit",
+                        details={"sale_id": sale_id, "sessions": len(indexed)},
+                    )
+                )
+                # Same order as the API, which sorts by creation date ascending
+                return sorted(
+                    (session for session, _ in indexed),
+                    key=lambda session: session.created_date or "",
+                )
+
+            # Most orders never enter a wave-picking session; skip the search
+            # while an earlier empty result for this sale is still fresh
+            if self.no_sessions_cache.contains(sale_id):
+                self.logger.debug(
+                    LogContext(
+                        step="get_sessions",
+                        action="negative_cache_hit",
+                        details={"sale_id": sale_id},
+                    )
+                )
+                return []
+
             # Use the discovered real API endpoint
             api_url = "https://lmdb.skuvault.com/wavepicking/get/sessions"
 
-            # Use the service's default headers (set in _set_api_headers)
-            # Only add Content-Type for this specific request
-            headers = {"Content-Type": "application/json"}
-
             # Prepare request payload with correct structure based on actual API
             payload = {
                 "limit": 100,
@@ -477,18 +3596,23 @@ class SkuVaultWebService:
                 "saleId": {"match": "contains", "value": sale_id},
             }
 
-            # Make API request
-            response = await self._make_request(
-                "POST", api_url, "get_sessions_api", json_data=payload, headers=headers
-            )
-
-            if not response:
-                return []
-
-            # Parse the JSON response
+            # Make API request, sharing it with concurrent lookups of this sale
             try:
-                data = response.json()
-                return self._parse_sessions_response(data, sale_id)
+                data = await self._post_coalesced(
+                    api_url,
+                    "get_sessions_api",
+                    payload,
+                    shared_namespace=SharedCache.SESSIONS,
+                    shared_ttl=self.sessions_cache_ttl,
+                )
+                if data is None:
+                    return []
+
+                sessions = self._parse_sessions_response(data, sale_id)
+                self._observe_sessions(sessions)
+                if not sessions:
+                    self.no_sessions_cache.add(sale_id, self.no_sessions_ttl)
+                return sessions
             except json.JSONDecodeError as e:
                 self.logger.error(
                     ErrorContext(
@@ -520,6 +3644,8 @@ class SkuVaultWebService:
                 )
             )
             return []
+        finally:
+            self._end_deadline(deadline_token)
 
     async def get_all_sessions(
         self, limit: int = 100, skip: int = 0, sort_descending: bool = True, states: Optional[List[str]] = None
@@ -577,39 +3703,11 @@ class SkuVaultWebService:
                 ),
             )
 
-            # Use the discovered real API endpoint
-            api_url = "https://lmdb.skuvault.com/wavepicking/get/sessions"
-
-            # Use the service's default headers (set in _set_api_headers)
-            # Only add Content-Type for this specific request
-            headers = {"Content-Type": "application/json"}
-
-            # Prepare request payload with correct structure based on actual API
-            payload = {
-                "limit": limit,
-                "skip": skip,
-                "userId": "-2",  # System-wide identifier for all users
-                "sort": [{"descending": sort_descending, "field": "createdDate"}],
-                "states": state_values if state_values else self._get_all_session_states(),
-            }
-
-            # Make API request
-            response = await self._make_request(
-                "POST",
-                api_url,
-                "get_all_sessions_api",
-                json_data=payload,
-                headers=headers,
-            )
-
-            if not response:
-                return []
-
-            # Parse the JSON response
             try:
-                data = response.json()
-
-                return self._parse_all_sessions_response(data)
+                sessions = await self._fetch_sessions_page(
+                    limit, skip, sort_descending, state_values
+                )
+                return sessions if sessions is not None else []
             except json.JSONDecodeError as e:
                 self.logger.error(
                     ErrorContext(
@@ -640,17 +3738,390 @@ class SkuVaultWebService:
                     ),
                 )
             )
-            return []
+            return []
+
+    async def _fetch_sessions_page(
+        self,
+        limit: int,
+        skip: int,
+        sort_descending: bool,
+        state_values: Optional[List[str]],
+    ) -> Optional[List[ParsedSession]]:
+        """Fetch and parse one page of the sessions list.
+
+        Args:
+            limit: Page size
+            skip: Number of sessions before this page
+            sort_descending: Whether to sort by creation date descending
+            state_values: Session state values to filter by, or None for all
+
+        Returns:
+            Parsed sessions on the page, or None if the request failed
+
+        Raises:
+            json.JSONDecodeError: If the response body is not valid JSON
+        """
+        # Use the discovered real API endpoint
+        api_url = "https://lmdb.skuvault.com/wavepicking/get/sessions"
+
+        # Prepare request payload with correct structure based on actual API
+        payload = {
+            "limit": limit,
+            "skip": skip,
+            "userId": "-2",  # System-wide identifier for all users
+            "sort": [{"descending": sort_descending, "field": "createdDate"}],
+            "states": state_values if state_values else self._get_all_session_states(),
+        }
+
+        # Make API request, sharing the sessions list between workers
+        data = await self._post_coalesced(
+            api_url,
+            "get_all_sessions_api",
+            payload,
+            shared_namespace=SharedCache.SESSIONS,
+            shared_ttl=self.sessions_cache_ttl,
+        )
+
+        if data is None:
+            return None
+
+        # Validate the raw body straight into the response model
+        sessions = self._parse_all_sessions_response(data)
+        self._observe_sessions(sessions)
+        return sessions
+
+    async def iter_all_sessions(
+        self,
+        page_size: int = 100,
+        sort_descending: bool = True,
+        states: Optional[List[str]] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> AsyncIterator[ParsedSession]:
+        """Iterate over every session, walking all pages of the sessions list.
+
+        Up to ``scraping.web.sessions_page_concurrency`` pages are requested
+        at once (still subject to the rate limiter) and each page's sessions
+        are yielded as soon as it arrives, so pages may arrive out of order.
+        Paging stops at the first short page, or once the sort order passes a
+        watermark: ``created_after`` when sorting descending,
+        ``created_before`` when ascending. Both watermarks also filter the
+        yielded sessions. Sessions that shift onto a later page while paging
+        are yielded once. At most ``scraping.web.sessions_max_pages`` pages
+        are read. A page that fails after retries ends paging; pages that
+        already arrived are still yielded.
+
+        Args:
+            page_size: Sessions per request (default 100)
+            sort_descending: Whether to sort by creation date descending (default True)
+            states: Optional list of state names to filter by (e.g., ["active", "new"])
+            created_after: Only sessions created at or after this time
+            created_before: Only sessions created before this time
+
+        Yields:
+            Parsed sessions, page by page in order of arrival
+        """
+        async for _, sessions in self._iter_session_pages(
+            page_size, sort_descending, states, created_after, created_before
+        ):
+            for session in sessions:
+                yield session
+
+    async def get_all_sessions_paged(
+        self,
+        page_size: int = 100,
+        sort_descending: bool = True,
+        states: Optional[List[str]] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> List[ParsedSession]:
+        """Get every session across all pages of the sessions list.
+
+        Pages are fetched concurrently as in ``iter_all_sessions`` and
+        reassembled in sort order.
+
+        Args:
+            page_size: Sessions per request (default 100)
+            sort_descending: Whether to sort by creation date descending (default True)
+            states: Optional list of state names to filter by (e.g., ["active", "new"])
+            created_after: Only sessions created at or after this time
+            created_before: Only sessions created before this time
+
+        Returns:
+            List of parsed session data
+        """
+        pages: Dict[int, List[ParsedSession]] = {}
+        async for page_index, sessions in self._iter_session_pages(
+            page_size, sort_descending, states, created_after, created_before
+        ):
+            pages[page_index] = sessions
+        return [session for index in sorted(pages) for session in pages[index]]
+
+    async def _iter_session_pages(
+        self,
+        page_size: int,
+        sort_descending: bool,
+        states: Optional[List[str]],
+        created_after: Optional[datetime],
+        created_before: Optional[datetime],
+    ) -> AsyncIterator[Tuple[int, List[ParsedSession]]]:
+        """Fetch pages of the sessions list concurrently, yielding each as it arrives.
+
+        Yields:
+            Tuples of (page index, filtered sessions on that page)
+        """
+        if not self.is_authenticated:
+            self.logger.error(
+                ErrorContext(
+                    step="iter_all_sessions",
+                    action="not_authenticated",
+                    error=ErrorDetail(
+                        type="AuthenticationError",
+                        message="Service not authenticated",
+                        traceback="",
+                    ),
+                ),
+            )
+            return
+
+        state_values = None
+        if states:
+            try:
+                state_values = self.get_session_states_by_names(states)
+            except ValueError as e:
+                self.logger.error(
+                    ErrorContext(
+                        step="iter_all_sessions",
+                        action="invalid_states",
+                        error=ErrorDetail(
+                            type="ValueError",
+                            message=f"Invalid state names: {e}",
+                            traceback="",
+                        ),
+                    ),
+                )
+                return
+
+        # The watermark the sort order moves towards ends paging early
+        stop_at_watermark = (created_after if sort_descending else created_before) is not None
+        lower = self._to_utc(created_after)
+        upper = self._to_utc(created_before)
+
+        def in_range(created: Optional[datetime]) -> bool:
+            if created is None:
+                return lower is None and upper is None
+            return (lower is None or created >= lower) and (upper is None or created < upper)
+
+        max_pages = self.sessions_max_pages
+        last_page: Optional[int] = None
+        next_page = 0
+        pending: Dict["asyncio.Task[Optional[List[ParsedSession]]]", int] = {}
+        seen: set = set()
+        pages_fetched = 0
+        sessions_yielded = 0
+        # An unfiltered sweep that reaches the last page lists every session,
+        # which lets the sale_id index answer searches on its own
+        sweep_started = time.monotonic()
+        swept_picklists: set = set()
+        page_failed = False
+
+        def schedule() -> None:
+            nonlocal next_page
+            while (
+                len(pending) < self.sessions_page_concurrency
+                and next_page < max_pages
+                and (last_page is None or next_page <= last_page)
+            ):
+                task = asyncio.ensure_future(
+                    self._fetch_sessions_page(
+                        page_size, next_page * page_size, sort_descending, state_values
+                    )
+                )
+                pending[task] = next_page
+                next_page += 1
+
+        try:
+            schedule()
+            while pending:
+                done, _ = await asyncio.wait(
+                    list(pending), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in sorted(done, key=pending.__getitem__):
+                    page_index = pending.pop(task)
+                    try:
+                        sessions = task.result()
+                    except Exception as e:
+                        self.logger.error(
+                            ErrorContext(
+                                error=ErrorDetail(
+                                    type=type(e).__name__, message=str(e), traceback=""
+                                ),
+                                details=ErrorDetails(
+                                    step="iter_all_sessions",
+                                    action="page_exception",
+                                    error_type="get_all_sessions_error"
+                                ),
+                            )
+                        )
+                        sessions = None
+
+                    if last_page is not None and page_index > last_page:
+                        continue
+
+                    if sessions is None:
+                        # Stop requesting further pages; pages that already
+                        # arrived are still valid
+                        self.logger.error(
+                            ErrorContext(
+                                error=ErrorDetail(
+                                    type="RequestError",
+                                    message=f"Failed to fetch sessions page {page_index}",
+                                    traceback="",
+                                ),
+                                details=ErrorDetails(
+                                    step="iter_all_sessions",
+                                    action="page_failed",
+                                    error_type="request_error"
+                                ),
+                            )
+                        )
+                        last_page = page_index - 1 if last_page is None else min(
+                            last_page, page_index - 1
+                        )
+                        page_failed = True
+                        continue
+
+                    pages_fetched += 1
+                    if len(sessions) < page_size:
+                        last_page = page_index if last_page is None else min(last_page, page_index)
+                    swept_picklists.update(
+                        session.picklist_id for session in sessions if session.picklist_id
+                    )
+
+                    page: List[ParsedSession] = []
+                    passed_watermark = False
+                    for session in sessions:
+                        created = self._to_utc(self._parse_created_date(session.created_date))
+                        if not in_range(created):
+                            if stop_at_watermark and created is not None:
+                                passed_watermark = passed_watermark or (
+                                    created < lower if sort_descending else created >= upper
+                                )
+                            continue
+                        key = (session.session_id, session.picklist_id)
+                        if key != (None, None):
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                        page.append(session)
+
+                    if passed_watermark:
+                        last_page = page_index if last_page is None else min(last_page, page_index)
+
+                    if page:
+                        sessions_yielded += len(page)
+                        yield page_index, page
+
+                # Pages past the end are empty or beyond the watermark
+                for task, page_index in list(pending.items()):
+                    if last_page is not None and page_index > last_page:
+                        task.cancel()
+                        del pending[task]
+                schedule()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        complete_sweep = (
+            state_values is None
+            and lower is None
+            and upper is None
+            and not page_failed
+            and last_page is not None
+        )
+        if complete_sweep:
+            self.sale_index.record_sweep(swept_picklists, sweep_started)
+
+        self.logger.info(
+            LogContext(
+                step="iter_all_sessions",
+                action="pagination_complete",
+                details={
+                    "pages": pages_fetched,
+                    "sessions": sessions_yielded,
+                    "max_pages_reached": next_page >= max_pages and last_page is None,
+                    "complete_sweep": complete_sweep,
+                },
+            )
+        )
+
+    @staticmethod
+    def _parse_created_date(value: Optional[str]) -> Optional[datetime]:
+        """Parse a session's ISO 8601 creation date, or None if missing or invalid."""
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _to_utc(value: Optional[datetime]) -> Optional[datetime]:
+        """Make a datetime timezone-aware, treating naive values as UTC."""
+        if value is None or value.tzinfo is not None:
+            return value
+        return value.replace(tzinfo=timezone.utc)
+
+    def _observe_sessions(self, sessions: List[ParsedSession]) -> None:
+        """Feed sessions seen in a sessions response to the local caches.
+
+        Cached directions whose session changed state are invalidated, and
+        the new state decides how long the next fetch is kept. The sessions
+        also refresh the sale_id index.
+
+        Args:
+            sessions: Sessions parsed from a sessions API response
+        """
+        # The sessions list does not name its sales, so it leaves the
+        # no-sessions cache alone; a sale is dropped from it when directions
+        # that contain it are indexed, and otherwise when its entry expires
+        self.sale_index.update_sessions(sessions)
+
+        invalidated = [
+            session.picklist_id
+            for session in sessions
+            if session.picklist_id
+            and session.status
+            and self.directions_cache.observe_state(session.picklist_id, session.status)
+        ]
+
+        if invalidated:
+            self.logger.info(
+                LogContext(
+                    step="cache_management",
+                    action="state_change_invalidated",
+                    details={"picklist_ids": invalidated},
+                )
+            )
+            if self.shared_cache is not None:
+                for picklist_id in invalidated:
+                    self._run_in_background(
+                        self.shared_cache.invalidate(SharedCache.DIRECTIONS, picklist_id)
+                    )
 
-    def _extract_auth_token(self):
-        """Extract authentication token from session cookies or response."""
+    def _extract_auth_token(self) -> Optional[str]:
+        """Extract authentication token from session cookies or response.
+
+        Returns:
+            The extracted token, or None if no auth cookie was found
+        """
         # Look for the auth token in the sv-t cookie
         # This cookie contains the Bearer token needed for API calls
 
         auth_token = None
 
         # Check for the sv-t cookie which contains the authentication token
-        for cookie in self.session.cookies:
+        for cookie in self.session.cookies.jar:
             if cookie.name == "sv-t" and len(cookie.value) > 100:
                 auth_token = cookie.value
                 break
@@ -679,17 +4150,19 @@ class SkuVaultWebService:
                 ),
             )
 
+        return auth_token
+
     async def _store_token_in_cache(self):
         """Store the extracted authentication token in the cache."""
         try:
             if not self.auth_token:
                 return
 
-            # Store token in cache with 24-hour expiration
+            # Store token in cache with the configured lifetime (default 24 hours)
             success = await self.token_cache.store_token(
                 token=self.auth_token,
                 source="skuvault_web",
-                expires_in_hours=24,
+                expires_in_hours=self.token_lifetime_hours,
                 metadata={
                     "username": self.settings.skuvault.scraping.web.username,
                     "login_url": str(self.settings.skuvault.scraping.web.login_url),
@@ -763,12 +4236,12 @@ class SkuVaultWebService:
             )
 
     def _parse_sessions_response(
-        self, data: Dict[str, Any], sale_id: str
+        self, data: Any, sale_id: str
     ) -> List[ParsedSession]:
         """Parse the sessions API response into structured data.
 
         Args:
-            data: The JSON response from the sessions API
+            data: The raw response body or decoded JSON from the sessions API
             sale_id: The original sale ID searched for
 
         Returns:
@@ -777,67 +4250,56 @@ class SkuVaultWebService:
         sessions = []
 
         try:
-            lists = data.get("lists", [])
+            response = validate_response(SessionsResponse, data)
 
-            for session_data in lists:
+            for session_data in response.lists or []:
                 # Convert string state to SessionState enum
-                state_str = session_data.get("state")
                 status = None
-                if state_str:
+                if session_data.state:
                     try:
-                        status = SessionState(state_str)
+                        status = SessionState(session_data.state)
                     except ValueError:
                         self.logger.warning(
                             LogContext(
                                 step="parse_sessions",
                                 action="invalid_state",
                                 details={
-                                    "state": state_str,
-                                    "session_id": session_data.get("sequenceId"),
+                                    "state": session_data.state,
+                                    "session_id": session_data.sequenceId,
                                 },
                             )
                         )
 
                 # Debug: Log the assigned data structure
-                assigned_data = session_data.get("assigned", {})
+                assigned = session_data.assigned
                 self.logger.debug(
                     LogContext(
                         step="parse_sessions",
                         action="debug_assigned_data",
                         details={
-                            "session_id": session_data.get("sequenceId"),
-                            "assigned_data": assigned_data,
-                            "assigned_keys": list(assigned_data.keys()) if assigned_data else [],
-                            "assigned_name": assigned_data.get("name") if assigned_data else None,
-                            "assigned_userId": assigned_data.get("userId") if assigned_data else None,
+                            "session_id": session_data.sequenceId,
+                            "assigned_name": assigned.name if assigned else None,
+                            "assigned_userId": assigned.userId if assigned else None,
                         },
                     )
                 )
 
                 session = ParsedSession(
-                    session_id=session_data.get("sequenceId"),
-                    picklist_id=session_data.get("picklistId"),
+                    session_id=session_data.sequenceId,
+                    picklist_id=session_data.picklistId,
                     status=status,
-                    created_date=session_data.get("date"),
-                    assigned_user=(
-                        session_data.get("assigned", {}).get("name")
-                        if session_data.get("assigned")
-                        else None
-                    ),
-                    user_id=(
-                        session_data.get("assigned", {}).get("userId")
-                        if session_data.get("assigned")
-                        else None
-                    ),
-                    sku_count=session_data.get("skuCount"),
-                    order_count=session_data.get("orderCount"),
-                    total_quantity=session_data.get("totalQuantity"),
-                    picked_quantity=session_data.get("pickedQuantity"),
-                    available_quantity=session_data.get("availableQuantity"),
-                    total_weight=session_data.get("totalItemsWeight"),
+                    created_date=session_data.date,
+                    assigned_user=assigned.name if assigned else None,
+                    user_id=assigned.userId if assigned else None,
+                    sku_count=session_data.skuCount,
+                    order_count=session_data.orderCount,
+                    total_quantity=session_data.totalQuantity,
+                    picked_quantity=session_data.pickedQuantity,
+                    available_quantity=session_data.availableQuantity,
+                    total_weight=session_data.totalItemsWeight,
                     view_url=(
-                        f"/wave-pick/sessions/{session_data.get('picklistId')}"
-                        if session_data.get("picklistId")
+                        f"/wave-pick/sessions/{session_data.picklistId}"
+                        if session_data.picklistId
                         else None
                     ),
                     extracted_at=time.time(),
@@ -860,11 +4322,11 @@ class SkuVaultWebService:
 
         return sessions
 
-    def _parse_all_sessions_response(self, data: Dict[str, Any]) -> List[ParsedSession]:
+    def _parse_all_sessions_response(self, data: Any) -> List[ParsedSession]:
         """Parse the all sessions API response into structured data.
 
         Args:
-            data: The JSON response from the all sessions API
+            data: The raw response body or decoded JSON from the all sessions API
 
         Returns:
             List of parsed session data
@@ -883,7 +4345,7 @@ class SkuVaultWebService:
             )
 
             # Parse the response using our Pydantic model
-            response = SessionsResponse(**data)
+            response = validate_response(SessionsResponse, data)
 
             if response.lists:
                 for session_data in response.lists:
@@ -961,12 +4423,12 @@ class SkuVaultWebService:
         return sessions
 
     def _parse_directions_response(
-        self, data: Dict[str, Any], picklist_id: str
+        self, data: Any, picklist_id: str
     ) -> List[ParsedDirection]:
         """Parse the directions API response into structured data.
 
         Args:
-            data: The JSON response from the directions API
+            data: The raw response body or decoded JSON from the directions API
             picklist_id: The original picklist ID
 
         Returns:
@@ -1002,8 +4464,7 @@ class SkuVaultWebService:
             )
 
             # Log the top-level keys to understand the actual API response
-            if isinstance(data, dict):
-                top_level_keys = list(data.keys())
+            if isinstance(data, (dict, bytes, bytearray, str)):
                 self.logger.info(
                     LogContext(
                         step="parse_directions",
@@ -1038,7 +4499,7 @@ class SkuVaultWebService:
                     )
                 )
 
-                response = DirectionsResponse(**data)
+                response = validate_response(DirectionsResponse, data)
 
                 self.logger.info(
                     LogContext(
@@ -1075,40 +4536,9 @@ class SkuVaultWebService:
             # Extract data from the picklist orders only
             if response.picklist and response.picklist.orders:
                 for order_index, order in enumerate(response.picklist.orders, start=1):
-                    if order.items:
-                        for item in order.items:
-                            # Extract location information
-                            if item.locations:
-                                for location in item.locations:
-                                    direction = ParsedDirection(
-                                        picklist_id=picklist_id,
-                                        sku=item.sku,
-                                        sku_name=item.description,
-                                        location=location.name,
-                                        spot_number=order_index,
-                                        bin_info=(
-                                            str(location.warehouse_code)
-                                            if location.warehouse_code
-                                            else None
-                                        ),
-                                        quantity=item.quantity,
-                                        order_number=order.id,
-                                        warehouse=location.warehouse_code,
-                                        extracted_at=time.time(),
-                                    )
-                                    directions.append(direction)
-                            else:
-                                # If no locations, still create a direction entry
-                                direction = ParsedDirection(
-                                    picklist_id=picklist_id,
-                                    sku=item.sku,
-                                    sku_name=item.description,
-                                    quantity=item.quantity,
-                                    order_number=order.id,
-                                    spot_number=order_index,
-                                    extracted_at=time.time(),
-                                )
-                                directions.append(direction)
+                    directions.extend(
+                        build_order_directions(picklist_id, order_index, order)
+                    )
 
             # Store history data for later use in calculating pick times
             if response.history:
@@ -1149,61 +4579,34 @@ class SkuVaultWebService:
         return directions
 
     def _parse_directions_response_with_history(
-        self, data: Dict[str, Any], picklist_id: str
-    ) -> tuple[List[ParsedDirection], List[ParsedDirection]]:
+        self, data: Any, picklist_id: str
+    ) -> Tuple[List[ParsedDirection], List[HistoryItem]]:
         """Parse the directions API response and return both directions and history.
 
         Args:
-            data: The JSON response from the directions API
+            data: The raw response body or decoded JSON from the directions API
             picklist_id: The original picklist ID
 
         Returns:
-            Tuple of (List of ParsedDirection, List of ParsedDirection)
+            Tuple of (List of ParsedDirection, List of HistoryItem)
+
+        Raises:
+            Exception: If the response cannot be parsed; the error is logged
+                first
         """
         directions = []
         history = []
 
         try:
             # Parse the response using our Pydantic model
-            response = DirectionsResponse(**data)
+            response = validate_response(DirectionsResponse, data)
 
             # Extract data from the picklist orders only
             if response.picklist and response.picklist.orders:
                 for order_index, order in enumerate(response.picklist.orders, start=1):
-                    if order.items:
-                        for item in order.items:
-                            # Extract location information
-                            if item.locations:
-                                for location in item.locations:
-                                    direction = ParsedDirection(
-                                        picklist_id=picklist_id,
-                                        sku=item.sku,
-                                        sku_name=item.description,
-                                        location=location.name,
-                                        spot_number=order_index,
-                                        bin_info=(
-                                            str(location.warehouse_code)
-                                            if location.warehouse_code
-                                            else None
-                                        ),
-                                        quantity=item.quantity,
-                                        order_number=order.id,
-                                        warehouse=location.warehouse_code,
-                                        extracted_at=time.time(),
-                                    )
-                                    directions.append(direction)
-                            else:
-                                # If no locations, still create a direction entry
-                                direction = ParsedDirection(
-                                    picklist_id=picklist_id,
-                                    sku=item.sku,
-                                    sku_name=item.description,
-                                    quantity=item.quantity,
-                                    order_number=order.id,
-                                    spot_number=order_index,
-                                    extracted_at=time.time(),
-                                )
-                                directions.append(direction)
+                    directions.extend(
+                        build_order_directions(picklist_id, order_index, order)
+                    )
 
             # Store history data for later use in calculating pick times
             if response.history:
@@ -1222,6 +4625,7 @@ class SkuVaultWebService:
                     ),
                 )
             )
+            raise
 
         return directions, history
 
@@ -1485,14 +4889,19 @@ class SkuVaultWebService:
             )
             raise Exception(f"Firestore query failed: {e}")
 
-    async def get_session_directions(self, picklist_id: str) -> List[ParsedDirection]:
+    async def get_session_directions(
+        self, picklist_id: str, deadline: Optional[float] = None
+    ) -> List[ParsedDirection]:
         """Get detailed directions for a specific session including SKU locations.
 
         This method first checks the cache for existing directions data.
         If not found, it fetches from the API and caches the result.
+        Concurrent calls for the same picklist share one request and parse.
 
         Args:
             picklist_id: The picklist ID from the session data
+            deadline: Optional time budget in seconds covering rate limiting,
+                preflight, retries and parsing; work stops when it runs out
 
         Returns:
             List of direction data dictionaries with SKU locations and order details
@@ -1511,6 +4920,7 @@ class SkuVaultWebService:
             )
             return []
 
+        deadline_token = self._start_deadline(deadline)
         try:
             # Check cache first
             self.logger.info(
@@ -1521,8 +4931,8 @@ class SkuVaultWebService:
                 )
             )
 
-            cached_data = self.directions_cache.get(picklist_id)
-            if cached_data:
+            cached = self._get_cached_directions(picklist_id)
+            if cached is not None:
                 self.logger.info(
                     LogContext(
                         step="get_directions",
@@ -1530,14 +4940,7 @@ class SkuVaultWebService:
                         details=ServiceDetails(status="cache_hit"),
                     )
                 )
-                self.logger.info(
-                    LogContext(
-                        step="get_directions",
-                        action="parsing_cached_data",
-                        details=ServiceDetails(status="starting_parse"),
-                    )
-                )
-                return self._parse_directions_response(cached_data, picklist_id)
+                return self._copy_directions(cached[0], [])[0]
 
             self.logger.info(
                 LogContext(
@@ -1547,110 +4950,241 @@ class SkuVaultWebService:
                 )
             )
 
-            # Use the discovered real API endpoint for directions
-            api_url = (
-                f"https://lmdb.skuvault.com/wavepicking/get/{picklist_id}/directions"
+            api_url, payload = self._get_directions_request(picklist_id)
+            directions, _ = await self._coalesce(
+                "parsed:" + self._get_request_key("POST", api_url, payload),
+                lambda: self._fetch_and_parse_directions(picklist_id),
             )
+            # Each caller gets its own copies so callers cannot affect each
+            # other or the cached entry
+            return self._copy_directions(directions, [])[0]
 
-            # Use the service's default headers (set in _set_api_headers)
-            # Only add Content-Type for this specific request
-            headers = {"Content-Type": "application/json"}
+        except Exception as e:
+            self.logger.error(
+                ErrorContext(
+                    step="get_directions",
+                    action="get_directions_exception",
+                    error=ErrorDetail(
+                        type=type(e).__name__, message=str(e), traceback=""
+                    ),
+                )
+            )
+            return []
+        finally:
+            self._end_deadline(deadline_token)
 
-            # Prepare request payload with correct structure based on actual API
-            payload = {"includeBinsInfo": True}
+    async def stream_session_directions(
+        self, picklist_id: str, deadline: Optional[float] = None
+    ) -> AsyncIterator[Union[ParsedDirection, HistoryItem]]:
+        """Stream directions and history for a picklist as they are decoded.
 
-            # Make API request
-            response = await self._make_request(
-                "POST",
-                api_url,
-                "get_directions_api",
-                json_data=payload,
-                headers=headers,
-            )
+        Unlike ``get_session_directions`` the response body is never held in
+        memory as a whole: orders and history entries are parsed one at a time
+        as bytes arrive, so peak memory stays flat for very large picklists.
+        Streamed responses are not added to the directions cache, but a cached
+        response is served from the cache. Falls back to the buffered path
+        when ``ijson`` is not installed.
 
-            if not response:
-                return []
+        Unlike the buffered methods, a failure does not end the stream
+        quietly: records already yielded may be only part of the picklist,
+        so the caller must be told.
 
-            # Parse the JSON response
-            self.logger.info(
-                LogContext(
-                    step="get_directions",
-                    action="parsing_response",
-                    details=ServiceDetails(status="json_parse_started"),
+        Args:
+            picklist_id: The picklist ID to get directions for
+            deadline: Optional time budget in seconds for the whole stream
+
+        Yields:
+            ParsedDirection for every item location of each order, in order,
+            followed by a HistoryItem for every history entry
+
+        Raises:
+            DeadlineExceededError: If the deadline passes before the stream ends
+            IncompleteStreamError: If the request fails or the response is
+                cut short or malformed
+        """
+        if ijson is None or picklist_id in self.directions_cache:
+            directions, history = await self.get_session_directions_with_history(
+                picklist_id, deadline
+            )
+            for record in [*directions, *history]:
+                yield record
+            return
+
+        if not self.is_authenticated:
+            self.logger.error(
+                ErrorContext(
+                    step="stream_directions",
+                    action="not_authenticated",
+                    error=ErrorDetail(
+                        type="AuthenticationError",
+                        message="Service not authenticated",
+                        traceback="",
+                    ),
                 )
             )
+            return
 
-            try:
-                data = response.json()
+        expires_at = time.monotonic() + deadline if deadline is not None else None
+        parser = DirectionsStreamParser(picklist_id)
+        spots: Dict[str, int] = {}
+        api_url, payload = self._get_directions_request(picklist_id)
 
-                self.logger.info(
-                    LogContext(
-                        step="get_directions",
-                        action="raw_response_received",
-                        details=ServiceDetails(status="response_parsed"),
+        try:
+            async with AsyncExitStack() as stack:
+                # The deadline is only bound while the request is opened, so it
+                # does not leak into the caller between yields; later checks
+                # use expires_at directly
+                deadline_token = self._start_deadline(deadline)
+                try:
+                    response = await stack.enter_async_context(
+                        self._stream_request(api_url, "get_directions_api", payload)
                     )
-                )
+                finally:
+                    self._end_deadline(deadline_token)
 
-                # Log the raw response structure to identify the issue
-                if isinstance(data, dict):
-                    self.logger.info(
-                        LogContext(
-                            step="get_directions",
-                            action="response_structure",
-                            details=ServiceDetails(status="structure_logged"),
-                        )
+                if response is None:
+                    raise IncompleteStreamError(
+                        f"stream_directions: request for picklist {picklist_id} failed"
                     )
-                    # Log the top-level keys
-                    top_keys = list(data.keys())
-                    self.logger.info(
-                        LogContext(
-                            step="get_directions",
-                            action="top_level_keys",
-                            details=ServiceDetails(status=f"keys: {top_keys}"),
-                        )
-                    )
-                else:
-                    self.logger.warning(
-                        LogContext(
-                            step="get_directions",
-                            action="unexpected_response_type",
-                            details=ServiceDetails(status=f"type: {type(data).__name__}"),
+
+                async for chunk in response.aiter_bytes():
+                    if expires_at is not None and time.monotonic() >= expires_at:
+                        raise DeadlineExceededError(
+                            "stream_directions: deadline exceeded mid-stream"
                         )
-                    )
+                    for record in self._collect_streamed_sales(parser.feed(chunk), spots):
+                        yield record
 
-                # Cache the raw response data
-                self.directions_cache.set(picklist_id, data)
+                for record in self._collect_streamed_sales(parser.close(), spots):
+                    yield record
 
-                self.logger.info(
-                    LogContext(
-                        step="get_directions",
-                        action="cached_response",
-                        details=ServiceDetails(status="response_cached"),
-                    )
+                # Only a complete stream describes the whole picklist
+                self.sale_index.index_directions(picklist_id, spots)
+
+            self.logger.info(
+                LogContext(
+                    step="stream_directions",
+                    action="stream_complete",
+                    details={
+                        "picklist_id": picklist_id,
+                        "bytes": parser.bytes_fed,
+                        "orders": parser.orders_parsed,
+                        "history": parser.history_parsed,
+                    },
                 )
+            )
 
-                self.logger.info(
-                    LogContext(
-                        step="get_directions",
-                        action="calling_parse_method",
-                        details=ServiceDetails(status="parse_started"),
-                    )
+        except Exception as e:
+            self.logger.error(
+                ErrorContext(
+                    step="stream_directions",
+                    action="stream_exception",
+                    error=ErrorDetail(
+                        type=type(e).__name__, message=str(e), traceback=""
+                    ),
                 )
+            )
+            if isinstance(e, (DeadlineExceededError, IncompleteStreamError)):
+                raise
+            raise IncompleteStreamError(
+                f"stream_directions: picklist {picklist_id} ended after "
+                f"{parser.bytes_fed} bytes: {e}"
+            ) from e
+
+    @staticmethod
+    def _copy_directions(
+        directions: List[ParsedDirection], history: List[HistoryItem]
+    ) -> Tuple[List[ParsedDirection], List[HistoryItem]]:
+        """Copy parsed directions and history before handing them to a caller.
+
+        The parsed models are kept on the cache entry and shared by every
+        caller of a coalesced fetch. ``ParsedDirection`` holds only scalars;
+        ``HistoryItem`` holds lists, so it is copied deeply.
 
-                return self._parse_directions_response(data, picklist_id)
-            except json.JSONDecodeError as e:
-                self.logger.error(
-                    ErrorContext(
-                        step="get_directions",
-                        action="json_parse_error",
-                        error=ErrorDetail(
-                            type="JSONDecodeError",
-                            message=f"Failed to parse directions API response: {e}",
-                            traceback="",
-                        ),
-                    )
+        Args:
+            directions: Directions from the cache or a shared fetch
+            history: History from the cache or a shared fetch
+
+        Returns:
+            Tuple of (directions, history) owned by the caller
+        """
+        return (
+            [direction.model_copy() for direction in directions],
+            [item.model_copy(deep=True) for item in history],
+        )
+
+    def _get_cached_directions(
+        self, picklist_id: str
+    ) -> Optional[Tuple[List[ParsedDirection], List[HistoryItem]]]:
+        """Get the parsed directions and history for a cached picklist.
+
+        Entries that have only been cached raw are parsed once and the
+        result is stored back on the entry.
+
+        Args:
+            picklist_id: The picklist ID to look up
+
+        Returns:
+            Tuple of (directions, history), or None on a cache miss
+        """
+        cached = self.directions_cache.lookup(picklist_id)
+        if cached is None:
+            return None
+
+        cached_data, parsed = cached
+        if parsed is not None:
+            return parsed
+
+        self.logger.info(
+            LogContext(
+                step="get_directions",
+                action="parsing_cached_data",
+                details=ServiceDetails(status="starting_parse"),
+            )
+        )
+        parsed = self._timed_parse_directions(cached_data, picklist_id)
+        self.directions_cache.set_parsed(picklist_id, parsed)
+        return parsed
+
+    async def get_session_directions_with_history(
+        self, picklist_id: str, deadline: Optional[float] = None
+    ) -> Tuple[List[ParsedDirection], List[HistoryItem]]:
+        """Get parsed directions and picking history for a picklist.
+
+        Shares the directions cache and in-flight requests with
+        ``get_session_directions``.
+
+        Args:
+            picklist_id: The picklist ID to get directions for
+            deadline: Optional time budget in seconds for the whole lookup
+
+        Returns:
+            Tuple of (directions, history), both empty on failure
+        """
+        if not self.is_authenticated:
+            self.logger.error(
+                ErrorContext(
+                    step="get_directions",
+                    action="not_authenticated",
+                    error=ErrorDetail(
+                        type="AuthenticationError",
+                        message="Service not authenticated",
+                        traceback="",
+                    ),
                 )
-                return []
+            )
+            return [], []
+
+        deadline_token = self._start_deadline(deadline)
+        try:
+            cached = self._get_cached_directions(picklist_id)
+            if cached is None:
+                api_url, payload = self._get_directions_request(picklist_id)
+                cached = await self._coalesce(
+                    "parsed:" + self._get_request_key("POST", api_url, payload),
+                    lambda: self._fetch_and_parse_directions(picklist_id),
+                )
+            return self._copy_directions(*cached)
 
         except Exception as e:
             self.logger.error(
@@ -1662,7 +5196,114 @@ class SkuVaultWebService:
                     ),
                 )
             )
-            return []
+            return [], []
+        finally:
+            self._end_deadline(deadline_token)
+
+    async def _fetch_and_parse_directions(
+        self, picklist_id: str
+    ) -> Tuple[List[ParsedDirection], List[HistoryItem]]:
+        """Fetch directions from the API, parse them and cache both forms.
+
+        Args:
+            picklist_id: The picklist ID to fetch directions for
+
+        Returns:
+            Tuple of (directions, history), both empty on failure
+        """
+        data = await self._fetch_directions_data(picklist_id)
+        if data is None:
+            return [], []
+
+        self.logger.info(
+            LogContext(
+                step="get_directions",
+                action="raw_response_received",
+                details=ServiceDetails(status=f"bytes: {len(data)}"),
+            )
+        )
+
+        self.logger.info(
+            LogContext(
+                step="get_directions",
+                action="calling_parse_method",
+                details=ServiceDetails(status="parse_started"),
+            )
+        )
+
+        self._check_deadline("parse_directions")
+        parsed = self._timed_parse_directions(data, picklist_id)
+        self.directions_cache.set_parsed(picklist_id, parsed)
+        return parsed
+
+    def _timed_parse_directions(
+        self, data: Any, picklist_id: str
+    ) -> Tuple[List[ParsedDirection], List[HistoryItem]]:
+        """Parse a directions response, recording the parse time for cache stats.
+
+        A response that fails to parse is dropped from the directions cache
+        and its picklist from the sale_id index, so neither answers from it.
+
+        Returns:
+            Tuple of (directions, history), both empty if parsing failed
+        """
+        started_at = time.perf_counter()
+        try:
+            parsed = self._parse_directions_response_with_history(data, picklist_id)
+        except Exception:
+            self.directions_cache.invalidate(picklist_id)
+            self.sale_index.remove_picklist(picklist_id)
+            return [], []
+        finally:
+            self.directions_cache.record_parse(time.perf_counter() - started_at)
+        self._index_directions(picklist_id, parsed[0])
+        return parsed
+
+    def _index_directions(self, picklist_id: str, directions: List[ParsedDirection]) -> None:
+        """Index the sales in a picklist's directions.
+
+        Updates the sale_id index and drops the sales from the no-sessions
+        negative cache.
+
+        Args:
+            picklist_id: The picklist the directions belong to
+            directions: Directions parsed for the picklist
+        """
+        spots = {
+            direction.order_number: direction.spot_number
+            for direction in directions
+            if direction.order_number
+        }
+        self.sale_index.index_directions(picklist_id, spots)
+        self._forget_empty_sales(spots)
+
+    def _forget_empty_sales(self, sale_ids: Any) -> None:
+        """Drop sales found in a session's directions from the negative cache.
+
+        Args:
+            sale_ids: Iterable of sale IDs found in one picklist
+        """
+        if not len(self.no_sessions_cache):
+            return
+        for sale_id in sale_ids:
+            self.no_sessions_cache.discard(sale_id)
+
+    def _collect_streamed_sales(
+        self, records: List[Union[ParsedDirection, HistoryItem]], spots: Dict[str, int]
+    ) -> List[Union[ParsedDirection, HistoryItem]]:
+        """Collect sale spots from streamed records and pass the records on."""
+        new_sales = [
+            record.order_number
+            for record in records
+            if isinstance(record, ParsedDirection)
+            and record.order_number
+            and record.order_number not in spots
+        ]
+        for record in records:
+            if isinstance(record, ParsedDirection) and record.order_number:
+                spots[record.order_number] = record.spot_number
+        self._forget_empty_sales(new_sales)
+        return records
 
     async def _get_raw_directions_response(
         self, picklist_id: str
@@ -1704,81 +5345,311 @@ class SkuVaultWebService:
                         details={"picklist_id": picklist_id},
                     )
                 )
-                return cached_data
+                return decode_json(cached_data)
+
+            self.logger.info(
+                LogContext(
+                    step="get_raw_directions_response",
+                    action="fetch_directions",
+                    details={"picklist_id": picklist_id},
+                )
+            )
+
+            try:
+                data = await self._fetch_directions_data(picklist_id)
+                return decode_json(data) if data is not None else None
+            except json.JSONDecodeError as e:
+                self.logger.error(
+                    ErrorContext(
+                        step="get_raw_directions_response",
+                        action="json_parse_error",
+                        error=ErrorDetail(
+                            type="JSONDecodeError",
+                            message=f"Failed to parse directions API response: {e}",
+                            traceback="",
+                        ),
+                    )
+                )
+                return None
+
+        except Exception as e:
+            self.logger.error(
+                ErrorContext(
+                    step="get_raw_directions_response",
+                    action="exception",
+                    error=ErrorDetail(
+                        type=type(e).__name__, message=str(e), traceback=""
+                    ),
+                )
+            )
+            return None
+
+    def _get_directions_request(self, picklist_id: str) -> Tuple[str, Dict[str, Any]]:
+        """Build the URL and payload for a directions API request.
+
+        Args:
+            picklist_id: The picklist ID to fetch directions for
+
+        Returns:
+            Tuple of (api_url, payload)
+        """
+        # Use the discovered real API endpoint for directions
+        api_url = f"https://lmdb.skuvault.com/wavepicking/get/{picklist_id}/directions"
+
+        # Prepare request payload with correct structure based on actual API
+        payload = {"includeBinsInfo": True}
+
+        return api_url, payload
+
+    async def _fetch_directions_data(self, picklist_id: str) -> Optional[bytes]:
+        """Fetch the raw directions response body from the API and cache it.
+
+        The body is cached as bytes so it can be validated straight into
+        ``DirectionsResponse`` without building intermediate dicts.
+
+        Args:
+            picklist_id: The picklist ID to fetch directions for
+
+        Returns:
+            Raw directions response body, or None if the request failed
+        """
+        api_url, payload = self._get_directions_request(picklist_id)
+        started_at = time.monotonic()
+        data = await self._post_coalesced(
+            api_url,
+            "get_directions_api",
+            payload,
+            shared_namespace=SharedCache.DIRECTIONS,
+            shared_key=picklist_id,
+            shared_ttl=self._get_shared_directions_ttl(picklist_id),
+        )
+
+        if data is not None:
+            self.directions_cache.record_fetch(picklist_id, time.monotonic() - started_at)
+            # Cache the raw response data
+            self.directions_cache.set(picklist_id, data)
 
-            self.logger.info(
+            self.logger.debug(
                 LogContext(
-                    step="get_raw_directions_response",
-                    action="fetch_directions",
+                    step="get_directions",
+                    action="cached_response",
                     details={"picklist_id": picklist_id},
                 )
             )
 
-            # Use the discovered real API endpoint for directions
-            api_url = (
-                f"https://lmdb.skuvault.com/wavepicking/get/{picklist_id}/directions"
-            )
+        return data
+
+    def _get_request_key(self, method: str, url: str, payload: Any) -> str:
+        """Build the in-flight deduplication key for a request.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            payload: JSON payload
+
+        Returns:
+            Key identifying the endpoint and payload
+        """
+        return f"{method} {url} {json.dumps(payload, sort_keys=True, default=str)}"
+
+    async def _post_coalesced(
+        self,
+        api_url: str,
+        context: str,
+        payload: Dict[str, Any],
+        shared_namespace: Optional[str] = None,
+        shared_key: Optional[str] = None,
+        shared_ttl: Optional[float] = None,
+    ) -> Optional[bytes]:
+        """POST a JSON read request, sharing it with identical in-flight calls.
+
+        Concurrent callers with the same endpoint and payload await a single
+        upstream request and share its raw body, which each caller can decode
+        or validate straight into a model. When a shared cache tier is
+        configured and ``shared_namespace`` is given, the body is first looked
+        up in the shared tier and successful responses are written through.
+
+        Args:
+            api_url: API endpoint URL
+            context: Context for logging and rate limiting
+            payload: JSON request payload
+            shared_namespace: Shared cache namespace, or None to bypass it
+            shared_key: Shared cache key; defaults to a hash of the request
+            shared_ttl: Shared cache TTL in seconds, or None for no expiry
+
+        Returns:
+            Raw response body, or None if the request failed
+        """
+        request_key = self._get_request_key("POST", api_url, payload)
+        # Read in this caller's context; the shared task does not inherit it
+        hedge = self.hedging_enabled and _HEDGE_REQUESTS.get() and context in HEDGEABLE_CONTEXTS
+
+        async def fetch() -> Optional[bytes]:
+            use_shared = self.shared_cache is not None and shared_namespace is not None
+            if use_shared:
+                cache_key = shared_key or hashlib.sha256(request_key.encode()).hexdigest()
+                cached = await self.shared_cache.get(shared_namespace, cache_key)
+                if cached is not None:
+                    self.logger.debug(
+                        LogContext(
+                            step="shared_cache",
+                            action="hit",
+                            details={"namespace": shared_namespace, "context": context},
+                        )
+                    )
+                    return cached
 
             # Use the service's default headers (set in _set_api_headers)
             # Only add Content-Type for this specific request
-            headers = {"Content-Type": "application/json"}
+            request = self._make_hedged_request if hedge else self._make_request
 
-            # Prepare request payload with correct structure based on actual API
-            payload = {"includeBinsInfo": True}
-
-            # Make API request
-            response = await self._make_request(
+            response = await request(
                 "POST",
                 api_url,
-                "get_directions_api",
+                context,
                 json_data=payload,
-                headers=headers,
+                headers={"Content-Type": "application/json"},
             )
-
             if not response:
                 return None
 
-            # Parse the JSON response
-            try:
-                data = response.json()
+            if use_shared:
+                await self.shared_cache.set(
+                    shared_namespace, cache_key, response.content, shared_ttl
+                )
+            return response.content
 
-                # Cache the raw response data
-                self.directions_cache.set(picklist_id, data)
+        return await self._coalesce(request_key, fetch)
 
-                self.logger.debug(
-                    LogContext(
-                        step="get_raw_directions_response",
-                        action="cached_response",
-                        details={"picklist_id": picklist_id},
-                    )
-                )
+    async def _coalesce(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Share work with identical in-flight calls, within this call's deadline.
 
-                return data
-            except json.JSONDecodeError as e:
-                self.logger.error(
-                    ErrorContext(
-                        step="get_raw_directions_response",
-                        action="json_parse_error",
-                        error=ErrorDetail(
-                            type="JSONDecodeError",
-                            message=f"Failed to parse directions API response: {e}",
-                            traceback="",
-                        ),
-                    )
-                )
-                return None
+        The shared task starts without the starting caller's deadline or
+        hedging preference, which would otherwise bind every caller that
+        joins it; each caller's deadline only limits how long it waits.
 
-        except Exception as e:
-            self.logger.error(
-                ErrorContext(
-                    step="get_raw_directions_response",
-                    action="exception",
-                    error=ErrorDetail(
-                        type=type(e).__name__, message=str(e), traceback=""
-                    ),
-                )
+        Args:
+            key: Identity of the call
+            factory: Zero-argument callable returning the awaitable to run
+
+        Returns:
+            The shared result
+
+        Raises:
+            DeadlineExceededError: If the deadline passes while waiting
+        """
+        async def detached() -> Any:
+            # Runs in the task's own copy of the context
+            _DEADLINE.set(None)
+            _HEDGE_REQUESTS.set(False)
+            return await factory()
+
+        try:
+            return await self._single_flight.do(key, detached, timeout=_remaining_time())
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(
+                "deadline passed while waiting for a shared request"
+            ) from None
+
+    async def _make_hedged_request(
+        self,
+        method: str,
+        url: str,
+        context: str,
+        data: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[httpx.Response]:
+        """Make a request, sending a backup copy if the first one is slow.
+
+        If the first request has not completed within the endpoint's observed
+        p95 latency, a second identical request is sent and whichever returns
+        a response first wins; the other is cancelled. Hedges draw from a
+        budget capped at ``scraping.web.hedge_budget_percent`` of hedge-eligible
+        requests, so they cannot amplify load by more than a few percent.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Request URL
+            context: Context for logging and latency tracking
+            data: Form data for POST requests
+            json_data: JSON data for POST requests
+            headers: Additional headers
+
+        Returns:
+            Response object if successful, None otherwise
+        """
+        hedge_after = _LATENCY_TRACKER.percentile(context, 95)
+        if hedge_after is None:
+            # Not enough samples yet to know what "slow" means
+            return await self._make_request(
+                method, url, context, data, json_data, headers
+            )
+
+        self._hedge_budget.record_request()
+        primary = asyncio.ensure_future(
+            self._make_request(method, url, context, data, json_data, headers)
+        )
+
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+
+        if done or not self._hedge_budget.try_spend():
+            return await primary
+
+        self._hedges_sent += 1
+        self.logger.info(
+            LogContext(
+                step="hedged_request",
+                action="hedge_sent",
+                details={
+                    "context": context,
+                    "hedge_after_ms": int(hedge_after * 1000),
+                },
             )
+        )
+
+        hedge = asyncio.ensure_future(
+            self._make_request(method, url, context, data, json_data, headers)
+        )
+        pending = {primary, hedge}
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None and task.result() is not None:
+                        if task is hedge:
+                            self._hedge_wins += 1
+                        return task.result()
             return None
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def get_hedging_stats(self) -> Dict[str, Any]:
+        """Get hedged request statistics.
+
+        Returns:
+            Dictionary with hedge counts, budget usage and the current
+            per-endpoint p95 latency thresholds
+        """
+        return {
+            "enabled": self.hedging_enabled,
+            "hedges_sent": self._hedges_sent,
+            "hedge_wins": self._hedge_wins,
+            "budget": self._hedge_budget.get_stats(),
+            "p95_ms": {
+                context: int(threshold * 1000)
+                for context in HEDGEABLE_CONTEXTS
+                if (threshold := _LATENCY_TRACKER.percentile(context, 95)) is not None
+            },
+        }
 
     async def _make_request(
         self,
@@ -1789,9 +5660,15 @@ class SkuVaultWebService:
         json_data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         retry_count: int = 0,
-    ) -> Optional[requests.Response]:
+    ) -> Optional[httpx.Response]:
         """Make an HTTP request with retry logic and rate limiting.
 
+        Requests to a host whose circuit breaker is open fail fast without
+        touching the network. Failures are classified by ``_handle_retry``;
+        only retryable ones are retried, with jittered backoff. An API call
+        rejected with 401 triggers one re-login and is replayed immediately
+        with the new token.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             url: Request URL
@@ -1804,10 +5681,121 @@ class SkuVaultWebService:
         Returns:
             Response object if successful, None otherwise
         """
-        try:
-            # Apply rate limiting
-            await self._apply_rate_limit()
+        breaker = self._get_circuit_breaker(url)
+        reauthenticated = False
+
+        while True:
+            self._check_deadline(context)
+
+            if not breaker.allow_request():
+                self.logger.warning(
+                    LogContext(
+                        step="circuit_breaker",
+                        action="request_rejected",
+                        details={
+                            "context": context,
+                            "host": breaker.host,
+                            "retry_in_seconds": round(breaker.seconds_until_retry(), 1),
+                        },
+                    )
+                )
+                return None
+
+            _RETRY_BUDGET.record_request()
+            response = None
+            request_error = None
+            token_used = self.auth_token
+
+            try:
+                response = await self._send_request(
+                    method, url, context, data, json_data, headers, attempt=retry_count
+                )
+            except DeadlineExceededError:
+                breaker.release_probe()
+                raise
+            except Exception as e:
+                request_error = e
+
+            if request_error is None and response.status_code < 400:
+                breaker.record_success()
+                return response
+
+            # The token was rejected: log in again once and replay without backoff
+            if (
+                response is not None
+                and response.status_code == 401
+                and not reauthenticated
+                and token_used
+                and "lmdb.skuvault.com" in url
+            ):
+                reauthenticated = True
+                if await self._reauthenticate(context, token_used):
+                    # A rejected token says nothing about the host; the
+                    # replayed request decides the breaker's state
+                    breaker.release_probe()
+                    continue
+
+            retry_delay = await self._handle_retry(
+                method,
+                url,
+                context,
+                data,
+                json_data,
+                headers,
+                retry_count,
+                response,
+                request_error,
+            )
+            if retry_delay is None:
+                return None
 
+            remaining = _remaining_time()
+            if remaining is not None and retry_delay >= remaining:
+                raise DeadlineExceededError(
+                    f"{context}: no time left to retry after {retry_count + 1} attempt(s)"
+                )
+
+            await asyncio.sleep(retry_delay)
+            retry_count += 1
+
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        context: str,
+        data: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        attempt: int = 0,
+    ) -> httpx.Response:
+        """Send a single HTTP request attempt under the rate limiter.
+
+        A timed-out attempt is recorded as a latency sample at its timeout,
+        so the adaptive timeout of a slow endpoint grows instead of cutting
+        off every attempt. If the caller's deadline ran out instead, the
+        timeout is raised as ``DeadlineExceededError``.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Request URL
+            context: Context for logging
+            data: Form data for POST requests
+            json_data: JSON data for POST requests
+            headers: Additional headers
+            attempt: Retry attempt, used to lengthen the timeout
+
+        Returns:
+            Response object, whatever its status code
+
+        Raises:
+            ValueError: If the HTTP method is not supported
+            httpx.HTTPError: If the request fails at the transport level
+            DeadlineExceededError: If the call's deadline passes first
+        """
+        # Apply rate limiting; the returned limiter holds an in-flight slot
+        limiter = await self._apply_rate_limit(context)
+
+        try:
             # Prepare request
             request_headers = self.session.headers.copy()
             if headers:
@@ -1829,6 +5817,10 @@ class SkuVaultWebService:
                         )
                     )
 
+            # Time the attempt out at the endpoint's adaptive timeout, or
+            # sooner if the caller's deadline is closer
+            timeout = self._get_request_timeout(context, attempt)
+
             # Log request
             self.logger.info(
                 LogContext(
@@ -1841,29 +5833,46 @@ class SkuVaultWebService:
             )
 
             # Make request
-            if method.upper() == "GET":
-                response = self.session.get(
-                    url,
-                    headers=request_headers,
-                    timeout=self.settings.skuvault.scraping.web.request_timeout,
-                )
-            elif method.upper() == "POST":
-                if json_data:
-                    response = self.session.post(
+            self._requests_in_flight += 1
+            self._peak_requests_in_flight = max(
+                self._peak_requests_in_flight, self._requests_in_flight
+            )
+            started_at = time.monotonic()
+            try:
+                if method.upper() == "GET":
+                    response = await self.session.get(
                         url,
-                        json=json_data,
                         headers=request_headers,
-                        timeout=self.settings.skuvault.scraping.web.request_timeout,
+                        timeout=timeout,
                     )
+                elif method.upper() == "POST":
+                    if json_data:
+                        response = await self.session.post(
+                            url,
+                            json=json_data,
+                            headers=request_headers,
+                            timeout=timeout,
+                        )
+                    else:
+                        response = await self.session.post(
+                            url,
+                            data=data,
+                            headers=request_headers,
+                            timeout=timeout,
+                        )
                 else:
-                    response = self.session.post(
-                        url,
-                        data=data,
-                        headers=request_headers,
-                        timeout=self.settings.skuvault.scraping.web.request_timeout,
-                    )
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+                    raise ValueError(f"Unsupported HTTP method: {method}")
+            except httpx.TimeoutException:
+                self._record_timeout(context, timeout)
+                raise
+            finally:
+                self._requests_in_flight -= 1
+
+            latency_seconds = time.monotonic() - started_at
+            self._record_connection_usage(response)
+            self._record_first_request(response.url.host, context, latency_seconds)
+            if response.status_code < 400:
+                _LATENCY_TRACKER.record(context, latency_seconds)
 
             # Log response
             self.logger.info(
@@ -1876,35 +5885,362 @@ class SkuVaultWebService:
                 )
             )
 
-            # Check for errors
-            if response.status_code >= 400:
-                return await self._handle_retry(
-                    method,
-                    url,
-                    context,
-                    data,
-                    json_data,
-                    headers,
-                    retry_count,
-                    response,
-                )
+            return response
+
+        finally:
+            # Release the in-flight slot before any retry backoff
+            limiter.release()
+
+    @asynccontextmanager
+    async def _stream_request(
+        self, url: str, context: str, json_data: Dict[str, Any]
+    ) -> AsyncIterator[Optional[httpx.Response]]:
+        """Open a POST request whose response body is read incrementally.
+
+        Streamed requests share the rate limiter, CORS preflight handling and
+        circuit breaker with buffered requests, but are not retried: after
+        records have been handed to the caller a replay would duplicate them.
+        The one exception is a 401, which is answered before any body is
+        read: the token is replaced and the request replayed once. The
+        in-flight slot is held until the stream is closed.
+
+        Args:
+            url: Request URL
+            context: Context for logging and rate limiting
+            json_data: JSON request payload
+
+        Yields:
+            Response with an unread body, or None if the request was
+            rejected by the circuit breaker or answered with an error status
+
+        Raises:
+            httpx.HTTPError: If the request fails at the transport level
+            DeadlineExceededError: If the call's deadline passes first
+        """
+        breaker = self._get_circuit_breaker(url)
+        self._check_deadline(context)
+
+        if not breaker.allow_request():
+            self.logger.warning(
+                LogContext(
+                    step="circuit_breaker",
+                    action="request_rejected",
+                    details={
+                        "context": context,
+                        "host": breaker.host,
+                        "retry_in_seconds": round(breaker.seconds_until_retry(), 1),
+                    },
+                )
+            )
+            yield None
+            return
+
+        _RETRY_BUDGET.record_request()
+        limiter = await self._apply_rate_limit(context)
+
+        try:
+            reauthenticated = False
+            while True:
+                request_headers = self.session.headers.copy()
+                if "lmdb.skuvault.com" in url:
+                    await self._handle_cors_preflight(url, request_headers)
+
+                token_used = self.auth_token
+                timeout = self._get_request_timeout(context)
+                self._requests_in_flight += 1
+                self._peak_requests_in_flight = max(
+                    self._peak_requests_in_flight, self._requests_in_flight
+                )
+                started_at = time.monotonic()
+                try:
+                    async with self.session.stream(
+                        "POST",
+                        url,
+                        json=json_data,
+                        headers=request_headers,
+                        timeout=timeout,
+                    ) as response:
+                        self._record_connection_usage(response)
+                        self._record_first_request(
+                            response.url.host, context, time.monotonic() - started_at
+                        )
+
+                        if response.status_code < 400:
+                            breaker.record_success()
+                            yield response
+                            return
+
+                        # Nothing has been read yet, so a rejected token can be
+                        # replaced and the request replayed once, as in _make_request
+                        can_reauthenticate = (
+                            response.status_code == 401
+                            and not reauthenticated
+                            and token_used
+                            and "lmdb.skuvault.com" in url
+                        )
+                        if can_reauthenticate:
+                            breaker.release_probe()
+                        elif self._is_retryable(response, None) and response.status_code != 429:
+                            breaker.record_failure()
+                        else:
+                            breaker.record_success()
+
+                        if not can_reauthenticate:
+                            self.logger.warning(
+                                LogContext(
+                                    step="http_request",
+                                    action=f"{context}_stream_failed",
+                                    details={"status_code": response.status_code},
+                                )
+                            )
+                            yield None
+                            return
+                except httpx.TimeoutException:
+                    self._record_timeout(context, timeout)
+                    breaker.record_failure()
+                    raise
+                except httpx.HTTPError:
+                    breaker.record_failure()
+                    raise
+                finally:
+                    self._requests_in_flight -= 1
+
+                reauthenticated = True
+                if not await self._reauthenticate(context, token_used):
+                    yield None
+                    return
+        except DeadlineExceededError:
+            breaker.release_probe()
+            raise
+        finally:
+            limiter.release()
+
+    def _get_rate_limiter(self, context: str) -> "TokenBucketRateLimiter":
+        """Get the shared rate limiter for the endpoint family of a request.
+
+        Limiters are shared by every service instance on the running event
+        loop. Each family reads ``scraping.rate_limit.<family>_requests_per_second``,
+        ``<family>_burst`` and ``<family>_max_in_flight`` when configured;
+        otherwise the rate is derived from ``request_delay``.
+
+        Args:
+            context: Request context used for logging (e.g. "get_directions_api")
+
+        Returns:
+            Rate limiter for the request's endpoint family
+        """
+        family = ENDPOINT_FAMILIES.get(context, "default")
+        loop = asyncio.get_running_loop()
+        limiters = _RATE_LIMITERS.setdefault(loop, {})
+
+        if family not in limiters:
+            rate_settings = self.settings.skuvault.scraping.rate_limit
+            delay = rate_settings.request_delay
+            default_rate = 1.0 / delay if delay > 0 else 0.0
+            limiters[family] = TokenBucketRateLimiter(
+                name=family,
+                requests_per_second=self._get_setting(
+                    rate_settings, f"{family}_requests_per_second", default_rate
+                ),
+                burst=self._get_setting(rate_settings, f"{family}_burst", 5),
+                max_in_flight=self._get_setting(
+                    rate_settings,
+                    f"{family}_max_in_flight",
+                    1 if family == "login" else 10,
+                ),
+            )
+
+        return limiters[family]
+
+    async def _apply_rate_limit(self, context: str) -> "TokenBucketRateLimiter":
+        """Wait for a rate-limit token and an in-flight slot for a request.
+
+        The caller must call ``release()`` on the returned limiter once the
+        request has completed.
+
+        The request's lane is the priority set with ``request_priority`` for
+        the current call chain, or else the default lane for its context.
+
+        Args:
+            context: Request context used to select the endpoint family
+
+        Returns:
+            The limiter whose in-flight slot is now held
+        """
+        limiter = self._get_rate_limiter(context)
+        priority = _REQUEST_PRIORITY.get() or CONTEXT_PRIORITIES.get(
+            context, RequestPriority.NORMAL
+        )
+        remaining = _remaining_time()
+        if remaining is None:
+            wait_seconds = await limiter.acquire(priority)
+        else:
+            try:
+                wait_seconds = await asyncio.wait_for(
+                    limiter.acquire(priority), timeout=max(0.0, remaining)
+                )
+            except asyncio.TimeoutError:
+                raise DeadlineExceededError(
+                    f"{context}: deadline passed while waiting for the rate limiter"
+                ) from None
+
+        if wait_seconds > 0.5:
+            self.logger.debug(
+                LogContext(
+                    step="rate_limit",
+                    action="throttled",
+                    details={
+                        "family": limiter.name,
+                        "context": context,
+                        "priority": priority.value,
+                        "wait_ms": int(wait_seconds * 1000),
+                    },
+                )
+            )
+
+        return limiter
+
+    @contextmanager
+    def request_priority(self, priority: RequestPriority) -> Iterator[None]:
+        """Run the enclosed calls in a given rate-limit priority lane.
+
+        Example:
+            ```python
+            with service.request_priority(RequestPriority.BULK):
+                for session in sessions:
+                    await service.get_session_directions(session.picklist_id)
+            ```
+
+        Args:
+            priority: Lane for every request made inside the block
+        """
+        token = _REQUEST_PRIORITY.set(priority)
+        try:
+            yield
+        finally:
+            _REQUEST_PRIORITY.reset(token)
+
+    def _start_deadline(self, deadline: Optional[float]) -> Optional[Token]:
+        """Start a time budget for the current call chain.
+
+        A nested budget can only shorten an enclosing one.
+
+        Args:
+            deadline: Seconds the call may take, or None for no budget
+
+        Returns:
+            Token to pass to ``_end_deadline``, or None if nothing was set
+        """
+        if deadline is None:
+            return None
+
+        expires_at = time.monotonic() + deadline
+        current = _DEADLINE.get()
+        if current is not None:
+            expires_at = min(expires_at, current)
+        return _DEADLINE.set(expires_at)
+
+    def _end_deadline(self, token: Optional[Token]) -> None:
+        """Restore the time budget that was active before ``_start_deadline``."""
+        if token is not None:
+            _DEADLINE.reset(token)
+
+    def _check_deadline(self, step: str) -> None:
+        """Stop work if the current call's deadline has passed.
+
+        Args:
+            step: Name of the step about to run, for the error message
+
+        Raises:
+            DeadlineExceededError: If no time is left
+        """
+        remaining = _remaining_time()
+        if remaining is not None and remaining <= 0:
+            raise DeadlineExceededError(f"{step}: deadline exceeded")
+
+    def _get_request_timeout(self, context: str, attempt: int = 0) -> float:
+        """Get the timeout for one request attempt.
+
+        The timeout adapts to the endpoint's observed p99 latency
+        (times ``scraping.web.timeout_p99_multiplier``), bounded below by
+        ``scraping.web.min_request_timeout`` (or the endpoint's entry in
+        ``MIN_REQUEST_TIMEOUTS``) and above by ``request_timeout``. Each retry
+        multiplies it by ``scraping.web.timeout_retry_multiplier``. It never
+        exceeds the time left before the current call's deadline.
+
+        Args:
+            context: Request context
+            attempt: Retry attempt, 0 for the first try
 
-            return response
+        Returns:
+            Timeout in seconds
 
-        except Exception as e:
-            return await self._handle_retry(
-                method, url, context, data, json_data, headers, retry_count, None, e
+        Raises:
+            DeadlineExceededError: If no time is left
+        """
+        web_settings = self.settings.skuvault.scraping.web
+        max_timeout = float(web_settings.request_timeout)
+        timeout = max_timeout
+
+        p99 = _LATENCY_TRACKER.percentile(context, 99)
+        if p99 is not None:
+            multiplier = self._get_setting(web_settings, "timeout_p99_multiplier", 3.0)
+            min_timeout = MIN_REQUEST_TIMEOUTS.get(
+                context, self._get_setting(web_settings, "min_request_timeout", 2.0)
+            )
+            retry_multiplier = self._get_setting(web_settings, "timeout_retry_multiplier", 2.0)
+            timeout = min(
+                max_timeout,
+                max(min_timeout, p99 * multiplier) * retry_multiplier ** attempt,
             )
 
-    async def _apply_rate_limit(self):
-        """Apply rate limiting based on configuration."""
-        delay = self.settings.skuvault.scraping.rate_limit.request_delay
-        if delay > 0:
-            await asyncio.sleep(delay)
+        remaining = _remaining_time()
+        if remaining is not None:
+            if remaining <= 0:
+                raise DeadlineExceededError(f"{context}: deadline exceeded")
+            timeout = min(timeout, remaining)
+
+        return timeout
+
+    def _record_timeout(self, context: str, timeout: float) -> None:
+        """Account for a request attempt that timed out.
+
+        Raises:
+            DeadlineExceededError: If the caller's deadline has run out, in
+                which case the timeout says nothing about the host
+        """
+        remaining = _remaining_time()
+        if remaining is not None and remaining <= 0.01:
+            raise DeadlineExceededError(f"{context}: deadline exceeded during request")
+
+        # The attempt took at least this long; without the sample a slow
+        # endpoint's timeout would never grow past its fast requests
+        _LATENCY_TRACKER.record(context, timeout)
+
+    def get_rate_limit_stats(self) -> Dict[str, Any]:
+        """Get wait-time metrics for each endpoint family's rate limiter.
+
+        Returns:
+            Dictionary mapping endpoint family to limiter statistics
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return {}
+
+        return {
+            family: limiter.get_stats()
+            for family, limiter in _RATE_LIMITERS.get(loop, {}).items()
+        }
 
     async def _handle_cors_preflight(self, url: str, headers: Dict[str, str]) -> bool:
         """Handle CORS preflight request for cross-origin API calls with caching.
 
+        In "skip" mode no OPTIONS request is sent. Otherwise results are
+        cached by origin and path in a bounded cache shared by all service
+        instances, for the shorter of ``cors_preflight_ttl`` and the server's
+        ``Access-Control-Max-Age``.
+
         Args:
             url: The target URL for the preflight request
             headers: Headers that will be used in the actual request
@@ -1912,29 +6248,27 @@ class SkuVaultWebService:
         Returns:
             True if preflight succeeds, False otherwise
         """
+        if self.cors_preflight_mode == "skip":
+            self.cors_preflight_cache.record_skip()
+            return True
+
         try:
             # Check if we have a valid cached preflight response
-            cache_key = f"{url}:{hash(frozenset(headers.items()))}"
-            current_time = time.time()
+            parsed_url = httpx.URL(url)
+            cache_key = f"{parsed_url.scheme}://{parsed_url.host}{parsed_url.path}"
 
-            if cache_key in self.cors_preflight_cache:
-                cached_result = self.cors_preflight_cache[cache_key]
-                if current_time - cached_result["timestamp"] < self.cors_preflight_ttl:
-                    self.logger.info(
-                        LogContext(
-                            step="cors_preflight",
-                            action="using_cached_preflight",
-                            details={
-                                "url": url,
-                                "cache_age_seconds": int(current_time - cached_result["timestamp"]),
-                                "ttl_remaining_seconds": int(self.cors_preflight_ttl - (current_time - cached_result["timestamp"])),
-                            },
-                        )
+            cached_success = self.cors_preflight_cache.get(cache_key)
+            if cached_success is not None:
+                self.logger.debug(
+                    LogContext(
+                        step="cors_preflight",
+                        action="using_cached_preflight",
+                        details={"cache_key": cache_key},
                     )
-                    return cached_result["success"]
-                else:
-                    # Remove expired cache entry
-                    del self.cors_preflight_cache[cache_key]
+                )
+                return cached_success
+
+            self._check_deadline("cors_preflight")
 
             # Prepare preflight headers based on the actual request headers
             preflight_headers = {
@@ -1976,11 +6310,13 @@ class SkuVaultWebService:
             )
 
             # Send OPTIONS preflight request
-            preflight_response = self.session.options(
+            started_at = time.monotonic()
+            preflight_response = await self.session.options(
                 url,
                 headers=preflight_headers,
-                timeout=self.settings.skuvault.scraping.web.request_timeout,
+                timeout=self._get_request_timeout("cors_preflight"),
             )
+            latency_seconds = time.monotonic() - started_at
 
             self.logger.info(
                 LogContext(
@@ -1995,14 +6331,14 @@ class SkuVaultWebService:
             # Check if preflight was successful
             success = preflight_response.status_code == 200
 
-            # Cache the result
-            self.cors_preflight_cache[cache_key] = {
-                "success": success,
-                "timestamp": current_time,
-            }
-
-            # Clean up old cache entries to prevent memory leaks
-            self._cleanup_cors_preflight_cache()
+            # Cache the result, honouring the server's max-age if it is shorter
+            ttl_seconds = self.cors_preflight_ttl
+            max_age = preflight_response.headers.get("Access-Control-Max-Age", "")
+            if max_age.isdigit():
+                ttl_seconds = min(ttl_seconds, int(max_age))
+            self.cors_preflight_cache.set(
+                cache_key, success, ttl_seconds, latency_seconds
+            )
 
             if success:
                 self.logger.info(
@@ -2013,6 +6349,7 @@ class SkuVaultWebService:
                             "url": url,
                             "cache_key": cache_key,
                             "cache_size": len(self.cors_preflight_cache),
+                            "latency_ms": int(latency_seconds * 1000),
                         },
                     )
                 )
@@ -2031,6 +6368,8 @@ class SkuVaultWebService:
                 )
                 return False
 
+        except DeadlineExceededError:
+            raise
         except Exception as e:
             self.logger.error(
                 ErrorContext(
@@ -2047,44 +6386,101 @@ class SkuVaultWebService:
             return False
 
     def _cleanup_cors_preflight_cache(self) -> None:
-        """Clean up expired CORS preflight cache entries to prevent memory leaks."""
-        try:
-            current_time = time.time()
-            expired_keys = []
-
-            for cache_key, cache_data in self.cors_preflight_cache.items():
-                if current_time - cache_data["timestamp"] >= self.cors_preflight_ttl:
-                    expired_keys.append(cache_key)
-
-            # Remove expired entries
-            for key in expired_keys:
-                del self.cors_preflight_cache[key]
-
-            if expired_keys:
-                self.logger.info(
-                    LogContext(
-                        step="cors_preflight",
-                        action="cache_cleanup",
-                        details={
-                            "expired_entries": len(expired_keys),
-                            "remaining_entries": len(self.cors_preflight_cache),
-                            "cache_size": len(self.cors_preflight_cache),
-                        },
-                    )
-                )
-
-        except Exception as e:
-            self.logger.warning(
+        """Clean up expired CORS preflight cache entries."""
+        expired_count = self.cors_preflight_cache.purge_expired()
+        if expired_count:
+            self.logger.info(
                 LogContext(
                     step="cors_preflight",
-                    action="cache_cleanup_failed",
+                    action="cache_cleanup",
                     details={
-                        "error": str(e),
-                        "cache_size": len(self.cors_preflight_cache),
+                        "expired_entries": expired_count,
+                        "remaining_entries": len(self.cors_preflight_cache),
                     },
                 )
             )
 
+    def get_cors_preflight_stats(self) -> Dict[str, Any]:
+        """Get statistics about the shared CORS preflight cache.
+
+        Returns:
+            Dictionary containing preflight cache statistics
+        """
+        stats = self.cors_preflight_cache.get_stats()
+        stats["mode"] = self.cors_preflight_mode
+        return stats
+
+    def _get_circuit_breaker(self, url: str) -> "CircuitBreaker":
+        """Get the process-wide circuit breaker for a request's host.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Circuit breaker for the URL's host
+        """
+        host = httpx.URL(url).host
+        if host not in _CIRCUIT_BREAKERS:
+            error_settings = self.settings.skuvault.scraping.error
+            _CIRCUIT_BREAKERS[host] = CircuitBreaker(
+                host=host,
+                failure_threshold=self._get_setting(
+                    error_settings, "circuit_failure_threshold", 5
+                ),
+                reset_timeout_seconds=self._get_setting(
+                    error_settings, "circuit_reset_timeout_seconds", 30.0
+                ),
+            )
+        return _CIRCUIT_BREAKERS[host]
+
+    def _is_retryable(
+        self,
+        response: Optional[httpx.Response],
+        exception: Optional[Exception],
+    ) -> bool:
+        """Classify a failed attempt as retryable or terminal.
+
+        Transport errors and timeouts are retryable, as are 408, 425, 429 and
+        5xx responses. Other 4xx responses (e.g. 401, 404) and programming
+        errors are terminal.
+
+        Args:
+            response: Failed response, if one was received
+            exception: Exception raised by the attempt, if any
+
+        Returns:
+            True if the request may succeed when retried
+        """
+        if exception is not None:
+            return isinstance(exception, httpx.TransportError)
+        return response is not None and response.status_code in RETRYABLE_STATUS_CODES
+
+    def _get_retry_after(self, response: Optional[httpx.Response]) -> Optional[float]:
+        """Parse the Retry-After header of a response.
+
+        Args:
+            response: Response that may carry a Retry-After header
+
+        Returns:
+            Seconds to wait, or None if the header is missing or invalid
+        """
+        if response is None:
+            return None
+
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return None
+
+        retry_after = retry_after.strip()
+        if retry_after.isdigit():
+            return float(retry_after)
+
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
     async def _handle_retry(
         self,
         method: str,
@@ -2094,35 +6490,79 @@ class SkuVaultWebService:
         json_data: Optional[Dict[str, Any]],
         headers: Optional[Dict[str, str]],
         retry_count: int,
-        response: Optional[requests.Response] = None,
+        response: Optional[httpx.Response] = None,
         exception: Optional[Exception] = None,
-    ) -> Optional[requests.Response]:
-        """Handle retry logic for failed requests."""
-        max_retries = self.settings.skuvault.scraping.error.max_retries
+    ) -> Optional[float]:
+        """Decide whether and when a failed request should be retried.
 
-        if retry_count < max_retries:
-            retry_delay = self.settings.skuvault.scraping.error.retry_delay * (
-                2**retry_count
+        Server-side failures are recorded against the host's circuit breaker.
+        Retries draw from a process-wide retry budget so an outage cannot
+        multiply load. The delay uses full-jitter exponential backoff, or the
+        server's Retry-After value when one is sent.
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        error_settings = self.settings.skuvault.scraping.error
+        max_retries = error_settings.max_retries
+        breaker = self._get_circuit_breaker(url)
+        retryable = self._is_retryable(response, exception)
+        status_code = response.status_code if response is not None else None
+
+        # Throttling says nothing about host health, so 429 does not trip the breaker
+        if retryable and status_code != 429:
+            breaker.record_failure()
+        elif response is not None:
+            # The host answered, so it is reachable even if the request failed
+            breaker.record_success()
+        else:
+            breaker.release_probe()
+
+        give_up_reason = None
+        if not retryable:
+            give_up_reason = "terminal_error"
+        elif retry_count >= max_retries:
+            give_up_reason = "max_retries_exceeded"
+        elif breaker.is_open:
+            give_up_reason = "circuit_open"
+        elif not _RETRY_BUDGET.try_spend():
+            give_up_reason = "retry_budget_exhausted"
+
+        if give_up_reason is None:
+            base_delay = error_settings.retry_delay
+            max_delay = self._get_setting(error_settings, "max_retry_delay", 30.0)
+            retry_delay = random.uniform(
+                base_delay, min(max_delay, base_delay * (2 ** (retry_count + 1)))
             )
 
+            retry_after = self._get_retry_after(response)
+            if retry_after is not None:
+                max_retry_after = self._get_setting(
+                    error_settings, "max_retry_after", 60.0
+                )
+                if retry_after > max_retry_after:
+                    give_up_reason = "retry_after_too_long"
+                else:
+                    retry_delay = retry_after
+
+        if give_up_reason is None:
             self.logger.warning(
                 LogContext(
                     step="retry",
                     action="retrying_request",
-                    details=ServiceDetails(
-                        status="retrying"
-                    ),
+                    details={
+                        "context": context,
+                        "attempt": retry_count + 1,
+                        "status_code": status_code,
+                        "error": type(exception).__name__ if exception else None,
+                        "delay_seconds": round(retry_delay, 2),
+                    },
                 )
             )
+            return retry_delay
 
-            await asyncio.sleep(retry_delay)
-            return await self._make_request(
-                method, url, context, data, json_data, headers, retry_count + 1
-            )
-
-        # Max retries exceeded
-        error_msg = f"Max retries exceeded for {context}"
-        if response:
+        error_msg = f"Giving up on {context} ({give_up_reason})"
+        if response is not None:
             error_msg += f" (Status: {response.status_code})"
         if exception:
             error_msg += f" (Error: {exception})"
@@ -2130,23 +6570,43 @@ class SkuVaultWebService:
         self.logger.error(
             ErrorContext(
                 error=ErrorDetail(
-                    type="MaxRetriesExceeded", message=error_msg, traceback=""
+                    type="MaxRetriesExceeded"
+                    if give_up_reason == "max_retries_exceeded"
+                    else "RequestFailed",
+                    message=error_msg,
+                    traceback="",
                 ),
                 details=ErrorDetails(
                     step="retry",
-                    action="max_retries_exceeded",
+                    action=give_up_reason,
                     error_type="max_retries_error"
+                    if give_up_reason == "max_retries_exceeded"
+                    else "request_error",
                 ),
             )
         )
 
         return None
 
-    def _is_login_successful(self, response: requests.Response) -> bool:
+    def get_resilience_stats(self) -> Dict[str, Any]:
+        """Get circuit breaker and retry budget statistics.
+
+        Returns:
+            Dictionary with per-host breaker state and retry budget usage
+        """
+        return {
+            "circuit_breakers": {
+                host: breaker.get_stats() for host, breaker in _CIRCUIT_BREAKERS.items()
+            },
+            "retry_budget": _RETRY_BUDGET.get_stats(),
+        }
+
+    def _is_login_successful(self, response: httpx.Response) -> bool:
         """Check if login was successful based on response."""
         # Check for redirect to dashboard or main page
         if response.status_code in [200, 302]:
-            if "dashboard" in response.url.lower() or "main" in response.url.lower():
+            final_url = str(response.url).lower()
+            if "dashboard" in final_url or "main" in final_url:
                 return True
 
         # Fallback: check for specific HTML elements that indicate successful login
@@ -2168,6 +6628,8 @@ class SkuVaultWebService:
             self.session.cookies.clear()
             self.is_authenticated = False
             self.auth_token = None
+            self._cancel_token_refresh()
+            self.token_memo.clear()
 
             # Invalidate cached token
             asyncio.create_task(self._invalidate_cached_token())
@@ -2229,18 +6691,29 @@ class SkuVaultWebService:
     async def check_cached_token(self) -> bool:
         """Check if there's a valid cached token and use it if available.
 
+        The in-process token memo is consulted first; ``TokenCacheService``
+        is only asked when no unexpired token is memoized. Either way a
+        background refresh is scheduled for the token.
+
         Returns:
             True if cached token was found and used, False otherwise
         """
         try:
+            token = self.token_memo.get()
+            if token:
+                self._use_token(token)
+                self._schedule_token_refresh()
+                return True
+
             # Try to get cached token
             cached_token = await self.token_cache.get_token("skuvault_web")
 
             if cached_token and not cached_token.is_expired:
                 # Use cached token
-                self.auth_token = cached_token.token
-                self.is_authenticated = True
-                self._set_api_headers()
+                self._use_token(cached_token.token)
+                self._remember_token(
+                    cached_token.token, *self._get_cached_token_times(cached_token)
+                )
 
                 self.logger.info(
                     LogContext(
@@ -2283,13 +6756,376 @@ class SkuVaultWebService:
             )
             return False
 
+    def _use_token(self, token: str) -> None:
+        """Authenticate API requests with a token, updating headers only if it changed.
+
+        Args:
+            token: The auth token to use
+        """
+        self.is_authenticated = True
+        if token != self.auth_token:
+            self.auth_token = token
+            self._set_api_headers()
+
+    def _remember_token(self, token: str, obtained_at: float, expires_at: float) -> None:
+        """Memoize a validated token and schedule its background refresh.
+
+        Args:
+            token: The auth token
+            obtained_at: Wall-clock time the token was issued
+            expires_at: Wall-clock time the token expires
+        """
+        self.token_memo.set(token, obtained_at, expires_at)
+        self._schedule_token_refresh()
+
+    def _get_cached_token_times(self, cached_token: Any) -> Tuple[float, float]:
+        """Work out when a token from ``TokenCacheService`` was issued and expires.
+
+        Uses the cached token's ``expires_at`` and the ``extracted_at``
+        metadata written by ``_store_token_in_cache`` when present, and the
+        configured token lifetime for whichever is missing.
+
+        Args:
+            cached_token: Token object returned by ``TokenCacheService``
+
+        Returns:
+            Tuple of (obtained_at, expires_at) wall-clock times
+        """
+
+        def to_timestamp(value: Any) -> Optional[float]:
+            if hasattr(value, "timestamp"):
+                return value.timestamp()
+            if isinstance(value, (int, float)):
+                return float(value)
+            return None
+
+        lifetime = self.token_lifetime_hours * 3600
+        metadata = getattr(cached_token, "metadata", None) or {}
+        obtained_at = to_timestamp(metadata.get("extracted_at"))
+        expires_at = to_timestamp(getattr(cached_token, "expires_at", None))
+
+        if obtained_at is None:
+            obtained_at = expires_at - lifetime if expires_at is not None else time.time()
+        if expires_at is None:
+            expires_at = obtained_at + lifetime
+        return obtained_at, expires_at
+
+    def _schedule_token_refresh(self) -> None:
+        """Start the background token refresh task if it is not already running.
+
+        Disabled when ``scraping.web.token_refresh_fraction`` is not between
+        0 and 1. Does nothing if no event loop is running.
+        """
+        if not 0 < self.token_refresh_fraction < 1:
+            return
+        if self._token_refresh_task is not None and not self._token_refresh_task.done():
+            return
+        try:
+            self._token_refresh_task = asyncio.get_running_loop().create_task(
+                self._refresh_token_when_due()
+            )
+        except RuntimeError:
+            return
+
+    def _cancel_token_refresh(self) -> None:
+        """Stop the background token refresh task."""
+        if self._token_refresh_task is not None:
+            self._token_refresh_task.cancel()
+            self._token_refresh_task = None
+
+    async def _refresh_token_when_due(self) -> None:
+        """Renew the token each time it reaches its refresh point.
+
+        Sleeps until ``token_refresh_fraction`` of the memoized token's
+        lifetime has passed, then logs in again while the current token keeps
+        serving requests. If another service in the process refreshed the
+        token in the meantime, its token is adopted instead. Failed refreshes
+        are retried every ``token_refresh_retry_seconds`` until the token
+        expires, after which the next ``login`` call takes over.
+        """
+        memo = self.token_memo
+        while memo.token is not None:
+            generation = memo.generation
+            delay = memo.refresh_at(self.token_refresh_fraction) - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if memo.generation != generation:
+                token = memo.get()
+                if token:
+                    self._use_token(token)
+                continue
+
+            if await self._refresh_token():
+                continue
+            if memo.expires_at <= time.time():
+                return
+            await asyncio.sleep(self.token_refresh_retry_seconds)
+
+    async def _refresh_token(self) -> bool:
+        """Log in again to replace the memoized token before it expires.
+
+        Returns:
+            True if a new token was obtained, False otherwise
+        """
+        generation = self.token_memo.generation
+        self.logger.info(
+            LogContext(
+                step="token_refresh",
+                action="start_refresh",
+                details={
+                    "expires_in_seconds": max(0.0, self.token_memo.expires_at - time.time()),
+                },
+            )
+        )
+
+        try:
+            await self._login_exclusively()
+        except Exception as e:
+            self.logger.error(
+                ErrorContext(
+                    error=ErrorDetail(
+                        type=type(e).__name__,
+                        message=f"Failed to refresh token: {e}",
+                        traceback="",
+                    ),
+                    details=ErrorDetails(
+                        step="token_refresh",
+                        action="refresh_exception",
+                        error_type="token_refresh_error"
+                    ),
+                )
+            )
+
+        refreshed = self.token_memo.generation != generation
+        self.token_memo.record_refresh(refreshed)
+        if not refreshed:
+            self.logger.warning(
+                LogContext(
+                    step="token_refresh",
+                    action="refresh_failed",
+                    details={"retry_in_seconds": self.token_refresh_retry_seconds},
+                )
+            )
+        return refreshed
+
+    def get_token_stats(self) -> Dict[str, Any]:
+        """Get token memo and background refresh statistics.
+
+        Returns:
+            Dictionary containing token memo counters and the next refresh time
+        """
+        refresh_scheduled = (
+            self._token_refresh_task is not None and not self._token_refresh_task.done()
+        )
+        return {
+            **self.token_memo.get_stats(),
+            "refresh_scheduled": refresh_scheduled,
+            "refresh_in_seconds": (
+                max(0.0, self.token_memo.refresh_at(self.token_refresh_fraction) - time.time())
+                if refresh_scheduled and self.token_memo.token
+                else None
+            ),
+            "token_lifetime_hours": self.token_lifetime_hours,
+            "token_refresh_fraction": self.token_refresh_fraction,
+            "login_attempts": _LOGIN_FLIGHT.get_stats(),
+        }
+
+    async def save_directions_cache_snapshot(self, path: Optional[str] = None) -> int:
+        """Save the directions cache to a local file for a warm restart.
+
+        Entries keep their original timestamps and session states, so
+        their TTLs keep running across the restart. The file is replaced
+        atomically.
+
+        Args:
+            path: Snapshot file path, defaults to ``scraping.cache.snapshot_path``
+
+        Returns:
+            Number of entries saved, 0 on failure
+        """
+        path = path or self.cache_snapshot_path
+        if not path:
+            return 0
+
+        entries = self.directions_cache.export_entries()
+        snapshot = {
+            "version": 1,
+            "saved_at": time.time(),
+            "entries": [
+                {
+                    "picklist_id": entry["picklist_id"],
+                    "timestamp": entry["timestamp"],
+                    "state": entry["state"].value if entry["state"] else None,
+                    "data": entry["data"].decode("utf-8"),
+                }
+                for entry in entries
+            ],
+        }
+
+        def write() -> None:
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with gzip.open(temp_path, "wt", encoding="utf-8", compresslevel=1) as f:
+                json.dump(snapshot, f)
+            os.replace(temp_path, path)
+
+        try:
+            await asyncio.to_thread(write)
+        except Exception as e:
+            self.logger.error(
+                ErrorContext(
+                    step="cache_snapshot",
+                    action="save_failed",
+                    error=ErrorDetail(
+                        type=type(e).__name__, message=str(e), traceback=""
+                    ),
+                )
+            )
+            return 0
+
+        self.logger.info(
+            LogContext(
+                step="cache_snapshot",
+                action="saved",
+                details={"path": path, "entries": len(entries)},
+            )
+        )
+        return len(entries)
+
+    async def _load_cache_snapshot_once(self) -> int:
+        """Load the configured directions cache snapshot on first use.
+
+        Returns:
+            Number of entries loaded, 0 if none is configured or it was
+            already loaded
+        """
+        if self._snapshot_loaded or not self.cache_snapshot_path:
+            return 0
+        self._snapshot_loaded = True
+        return await self.load_directions_cache_snapshot()
+
+    async def load_directions_cache_snapshot(self, path: Optional[str] = None) -> int:
+        """Load a directions cache snapshot saved at the last shutdown.
+
+        The file is read and decoded in a worker thread. Entries whose TTL
+        ran out in the meantime are dropped. A missing or unreadable snapshot
+        leaves the cache empty.
+
+        Args:
+            path: Snapshot file path, defaults to ``scraping.cache.snapshot_path``
+
+        Returns:
+            Number of entries loaded
+        """
+        path = path or self.cache_snapshot_path
+        if not path:
+            return 0
+
+        def read() -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+            if not os.path.exists(path):
+                return None
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            entries = [
+                {
+                    "picklist_id": entry["picklist_id"],
+                    "timestamp": entry["timestamp"],
+                    "state": SessionState(entry["state"]) if entry["state"] else None,
+                    "data": entry["data"].encode("utf-8"),
+                }
+                for entry in snapshot["entries"]
+            ]
+            return snapshot, entries
+
+        try:
+            result = await asyncio.to_thread(read)
+            if result is None:
+                return 0
+            snapshot, entries = result
+            loaded, dropped = self.directions_cache.import_entries(entries)
+        except Exception as e:
+            self.logger.error(
+                ErrorContext(
+                    step="cache_snapshot",
+                    action="load_failed",
+                    error=ErrorDetail(
+                        type=type(e).__name__, message=str(e), traceback=""
+                    ),
+                )
+            )
+            return 0
+
+        self.logger.info(
+            LogContext(
+                step="cache_snapshot",
+                action="loaded",
+                details={
+                    "path": path,
+                    "loaded": loaded,
+                    "dropped_expired": dropped,
+                    "snapshot_age_seconds": round(time.time() - snapshot["saved_at"], 1),
+                },
+            )
+        )
+        return loaded
+
     def get_directions_cache_stats(self) -> Dict[str, Any]:
-        """Get statistics about the directions cache.
+        """Get statistics about the directions cache and related caches.
+
+        Includes hit/miss counters, evictions by reason, per-picklist fetch
+        counts and an estimate of the time saved by hits, plus the shared
+        tier, CORS preflight cache, no-sessions negative cache, sale_id
+        index and sale ID parse cache statistics.
 
         Returns:
             Dictionary containing cache statistics for monitoring
         """
-        return self.directions_cache.get_stats()
+        stats = self.directions_cache.get_stats()
+        stats["shared_tier"] = self.get_shared_cache_stats()
+        stats["preflight_cache"] = self.get_cors_preflight_stats()
+        stats["no_sessions_cache"] = self.no_sessions_cache.get_stats()
+        stats["sale_index"] = self.sale_index.get_stats()
+        stats["sale_id_parse_cache"] = _parse_sale_id_cached.cache_info()._asdict()
+        return stats
+
+    def lookup_sale_sessions(self, sale_id: str) -> Optional[List[Tuple[int, str, int]]]:
+        """Look up a sale in the local sale_id index without calling SkuVault.
+
+        Matches sale IDs the way the API search does (substring, ignoring
+        case), and only answers once a complete sessions sweep and the
+        directions of every swept picklist are indexed.
+
+        Args:
+            sale_id: Sale ID, or part of one, to look up
+
+        Returns:
+            List of (session_id, picklist_id, spot_number) tuples (empty when
+            no session holds the sale), or None if the index is not complete
+        """
+        indexed = self.sale_index.lookup(sale_id)
+        if indexed is None:
+            return None
+        return [
+            (session.session_id, session.picklist_id, spot_number)
+            for session, spot_number in indexed
+        ]
+
+    def get_shared_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get hit rates of the cross-process cache tier.
+
+        Returns:
+            Per-namespace lookups, hits, and the cross-worker hit rate (hits
+            on entries fetched by another worker), or None if the tier is
+            disabled
+        """
+        if self.shared_cache is None:
+            return None
+        return self.shared_cache.get_stats()
+
+    async def invalidate_sessions_cache(self) -> None:
+        """Invalidate every shared sessions list, in all workers."""
+        if self.shared_cache is not None:
+            await self.shared_cache.invalidate(SharedCache.SESSIONS)
 
     def invalidate_directions_cache(self, picklist_id: Optional[str] = None) -> None:
         """Invalidate directions cache entries.
@@ -2297,6 +7133,11 @@ class SkuVaultWebService:
         Args:
             picklist_id: Specific picklist ID to invalidate, or None to clear all
         """
+        if self.shared_cache is not None:
+            self._run_in_background(
+                self.shared_cache.invalidate(SharedCache.DIRECTIONS, picklist_id or None)
+            )
+
         if picklist_id:
             self.directions_cache.invalidate(picklist_id)
             self.logger.info(
@@ -2316,27 +7157,31 @@ class SkuVaultWebService:
                 )
             )
 
-    def set_directions_cache_ttl(self, ttl_seconds: int) -> None:
+    def set_directions_cache_ttl(
+        self, ttl_seconds: Optional[int], state: Optional[SessionState] = None
+    ) -> None:
         """Set the time-to-live for directions cache entries.
 
+        The new TTL applies to entries already in the cache as well.
+
         Args:
-            ttl_seconds: New TTL value in seconds
+            ttl_seconds: New TTL value in seconds; None never expires (state TTLs only)
+            state: Session state to set the TTL for, or None for the default TTL
         """
-        # Note: This would require modifying the DirectionsCache class
-        # to support dynamic TTL changes. For now, we'll log the request.
+        self.directions_cache.set_ttl(ttl_seconds, state)
         self.logger.info(
             LogContext(
                 step="cache_management",
-                action="ttl_change_requested",
+                action="ttl_changed",
                 details={
-                    "requested_ttl": ttl_seconds,
-                    "message": "TTL change requires cache reinitialization",
+                    "ttl_seconds": ttl_seconds,
+                    "state": state.value if state else "default",
                 },
             )
         )
 
     async def get_latest_session_order_state(
-        self, session_order: SessionOrder
+        self, session_order: SessionOrder, deadline: Optional[float] = None
     ) -> Optional[SessionOrder]:
         """Get the latest state of a SessionOrder from SkuVault.
 
@@ -2348,6 +7193,8 @@ class SkuVaultWebService:
 
         Args:
             session_order: The SessionOrder to get latest state for
+            deadline: Optional time budget in seconds for the whole lookup,
+                including session search, directions and parsing
 
         Returns:
             Updated SessionOrder with latest data, or None if not found
@@ -2392,6 +7239,11 @@ class SkuVaultWebService:
             )
             return None
 
+        # Packer-facing lookup: jump the queue and hedge slow directions fetches
+        hedge_token = _HEDGE_REQUESTS.set(True)
+        priority_token = _REQUEST_PRIORITY.set(RequestPriority.INTERACTIVE)
+        deadline_token = self._start_deadline(deadline)
+
         try:
             self.logger.info(
                 LogContext(
@@ -2469,6 +7321,7 @@ class SkuVaultWebService:
                 return None
 
             # Use the same method as session sync service to get orders
+            self._check_deadline("get_session_orders")
             latest_orders = await self.get_session_orders(matching_session)
             if not latest_orders:
                 self.logger.warning(
@@ -2507,13 +7360,11 @@ class SkuVaultWebService:
                 return None
 
             # Step 5: Create updated SessionOrder using the same pattern as session sync service
+            self._check_deadline("build_session_order")
 
             # Parse sale_id to extract order_number and shipment_id using marketplace parser
             # This follows the exact same pattern as _persist_session_orders_batch
-            from jerky_data_hub.services.marketplace_id_parser import MarketplaceIdParser
-
-            marketplace_parser = MarketplaceIdParser()
-            parsed_components = marketplace_parser.parse_sale_id(matching_order.sale_id or "")
+            parsed_components = parse_sale_id(matching_order.sale_id or "")
 
             # Create updated SessionOrder with latest data
             updated_session_order = SessionOrder(
@@ -2575,3 +7426,7 @@ class SkuVaultWebService:
                 )
             )
             return None
+        finally:
+            self._end_deadline(deadline_token)
+            _REQUEST_PRIORITY.reset(priority_token)
+            _HEDGE_REQUESTS.reset(hedge_token)
@@ -0,0 +1,756 @@
+#!/usr/bin/env python3
+"""Offline benchmarks for the SkuVault web service.
+
+Nothing here calls SkuVault. Directions response bodies come from a
+directions cache snapshot (``scraping.cache.snapshot_path``) saved by a
+running service, or are generated in the shape of ``DirectionsResponse``
+when no snapshot is given. The request benchmarks run the service's own
+transport stack (``CachingDNSTransport`` and its connection pool) against
+a local TLS server, with a resolver stub and a network backend that add
+the simulated DNS, TCP and TLS latency; the certificate is generated with
+the ``openssl`` command. Every benchmark builds its own service instances and
+its own CORS preflight cache, so no process-wide cache of a running
+service is touched.
+
+Usage:
+    python skuvault_web_service_bench.py decoding [--snapshot PATH]
+    python skuvault_web_service_bench.py preflight [--rtt-ms 50] [--server-ms 100]
+    python skuvault_web_service_bench.py warmup [--rtt-ms 50] [--dns-ms 20]
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import random
+import ssl
+import subprocess
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpcore
+import httpx
+
+from jerky_data_hub.models.skuvault.directions import DirectionsResponse
+from jerky_data_hub.services.skuvault_web_service import (CachingDNSBackend,
+                                                          CachingDNSTransport,
+                                                          PreflightCache,
+                                                          SkuVaultWebService,
+                                                          orjson)
+
+
+def load_snapshot_payloads(path: str) -> List[Tuple[str, bytes]]:
+    """Load recorded directions response bodies from a cache snapshot.
+
+    Args:
+        path: Snapshot written by ``save_directions_cache_snapshot``
+
+    Returns:
+        List of (picklist_id, raw response body) pairs
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        snapshot = json.load(f)
+    return [
+        (entry["picklist_id"], entry["data"].encode("utf-8"))
+        for entry in snapshot["entries"]
+    ]
+
+
+def generate_directions_payload(
+    picklist_id: str, order_count: int, items_per_order: int, rng: random.Random
+) -> bytes:
+    """Build a directions response body shaped like the real API's.
+
+    Besides the orders and history, the body carries one ``directions`` step
+    per item location, as the picking route does. ``DirectionItem`` declares
+    no fields, so the step fields follow ``HistoryItem``.
+
+    Args:
+        picklist_id: Picklist ID to put in the body
+        order_count: Number of orders on the picklist
+        items_per_order: Items per order, each with two locations
+        rng: Random source, seeded for repeatable bodies
+
+    Returns:
+        Raw JSON response body
+    """
+    orders = []
+    history = []
+    steps = []
+    for order_index in range(order_count):
+        sale_id = f"1-352444-5-13038-{rng.randrange(10**6)}-JK{rng.randrange(10**9)}"
+        items = []
+        for _ in range(items_per_order):
+            sku = f"JCB-{rng.choice(['BEJ', 'VEJ', 'TKJ'])}-{rng.randrange(100)}"
+            items.append({
+                "productId": rng.randrange(10**5),
+                "quantity": rng.randrange(1, 5),
+                "sku": sku,
+                "partNumber": sku,
+                "code": str(rng.randrange(10**11, 10**12)),
+                "description": "Jerky.com - Original Beef Jerky - 1.75 oz.",
+                "productPictures": ["https://cdn.shopify.com/s/files/1/1866/5947/files/pouch.jpg"],
+                "weightPound": 0.11,
+                "locations": [
+                    {
+                        "warehouseId": 1,
+                        "warehouseCode": "OKC",
+                        "name": f"BS{rng.randrange(9)}-{rng.randrange(20):02d}-A-01",
+                        "quantity": rng.randrange(2000),
+                        "missing": False,
+                        "createDate": "2025-11-18T17:25:52.820Z",
+                    }
+                    for _ in range(2)
+                ],
+                "location": "BS3-16-A-01",
+                "available": 1000,
+                "picked": 0,
+                "completed": False,
+                "isSerialized": False,
+                "stockStatus": "inStock",
+            })
+        orders.append({"id": sale_id, "items": items})
+        for item in items:
+            for location in item["locations"]:
+                steps.append({
+                    "productSku": item["sku"],
+                    "productDescription": item["description"],
+                    "code": item["code"],
+                    "quantity": item["quantity"],
+                    "locationCode": location["name"],
+                    "warehouseId": location["warehouseId"],
+                    "saleId": sale_id,
+                    "spotId": order_index + 1,
+                })
+        history.append({
+            "date": "2025-11-18T17:25:52.820Z",
+            "type": "pick",
+            "quantity": 1,
+            "productSku": items[0]["sku"] if items else None,
+            "saleId": sale_id,
+            "spotId": order_index + 1,
+            "locationCode": "BS3-16-A-01",
+        })
+
+    body = {
+        "picklist": {
+            "orders": orders,
+            "picklistId": picklist_id,
+            "date": "2025-11-18T17:25:52.820Z",
+            "sequenceId": 12902,
+            "state": "active",
+            "orderCount": order_count,
+            "skuCount": order_count * items_per_order,
+        },
+        "directions": steps,
+        "history": history,
+    }
+    return json.dumps(body).encode("utf-8")
+
+
+def fixture_payloads(snapshot: Optional[str]) -> List[Tuple[str, bytes]]:
+    """Get the directions bodies the benchmarks run on.
+
+    Args:
+        snapshot: Directions cache snapshot path, or None to generate bodies
+
+    Returns:
+        List of (picklist_id, raw response body) pairs
+    """
+    if snapshot:
+        return load_snapshot_payloads(snapshot)
+
+    # Small, typical and large picklists
+    rng = random.Random(7)
+    return [
+        (f"picklist-{order_count}", generate_directions_payload(
+            f"picklist-{order_count}", order_count, 3, rng
+        ))
+        for order_count in (10, 60, 400)
+    ]
+
+
+def sessions_payload(picklist_ids: List[str]) -> bytes:
+    """Build a sessions response body listing the given picklists."""
+    return json.dumps({
+        "lists": [
+            {
+                "sequenceId": 12900 + index,
+                "picklistId": picklist_id,
+                "state": "active",
+                "date": "2025-11-18T17:25:52.820Z",
+                "orderCount": 10,
+            }
+            for index, picklist_id in enumerate(picklist_ids)
+        ]
+    }).encode("utf-8")
+
+
+def _handle_fixture_request(
+    directions: Dict[str, bytes], sessions: bytes, method: str, path: str
+) -> Tuple[int, Dict[str, str], bytes]:
+    """Answer a request from the fixtures.
+
+    Returns:
+        Tuple of (status code, extra headers, body)
+    """
+    if method in ("OPTIONS", "HEAD"):
+        return 200, {
+            "Access-Control-Allow-Origin": "https://v2.skuvault.com",
+            "Access-Control-Allow-Headers": "authorization,content-type,dataread",
+        }, b""
+    if path.endswith("/directions"):
+        body = directions.get(path.split("/")[-2])
+        if body is not None:
+            return 200, {}, body
+    if path.endswith("/get/sessions"):
+        return 200, {}, sessions
+    return 404, {}, b""
+
+
+def create_certificate(directory: str) -> Tuple[str, str]:
+    """Create a self-signed certificate valid for ``*.skuvault.com``.
+
+    Args:
+        directory: Directory to write the certificate and key to
+
+    Returns:
+        Tuple of (certificate path, key path)
+    """
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "ec",
+            "-pkeyopt", "ec_paramgen_curve:prime256v1", "-nodes", "-days", "1",
+            "-subj", "/CN=skuvault-bench",
+            "-addext", "subjectAltName=DNS:*.skuvault.com",
+            "-keyout", key_path, "-out", cert_path,
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert_path, key_path
+
+
+class LocalSkuVaultServer:
+    """HTTP/1.1 keep-alive TLS server on 127.0.0.1 serving the fixtures.
+
+    Each request is answered after one round trip, plus the server time
+    for requests other than OPTIONS and HEAD. Connection setup latency is
+    added on the client side by ``SimulatedNetworkBackend``.
+
+    Attributes:
+        port: Port the server listens on
+        requests: Requests served per HTTP method
+        connections: Connections accepted so far
+    """
+
+    def __init__(
+        self,
+        directions: Dict[str, bytes],
+        sessions: bytes,
+        ssl_context: ssl.SSLContext,
+        rtt_ms: float,
+        server_ms: float,
+    ):
+        """Initialize the server.
+
+        Args:
+            directions: Directions response body per picklist ID
+            sessions: Sessions response body
+            ssl_context: Server TLS context
+            rtt_ms: Network round-trip time
+            server_ms: Server time per request
+        """
+        self._directions = directions
+        self._sessions = sessions
+        self._ssl_context = ssl_context
+        self._rtt = rtt_ms / 1000
+        self._server_time = server_ms / 1000
+        self._server: Optional[asyncio.AbstractServer] = None
+        self.port = 0
+        self.requests: Counter = Counter()
+        self.connections = 0
+
+    async def start(self) -> None:
+        """Start listening on a free local port."""
+        self._server = await asyncio.start_server(
+            self._serve, "127.0.0.1", 0, ssl=self._ssl_context
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Stop accepting connections."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until the client closes it."""
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                lines = head.decode("latin-1").split("\r\n")
+                method, path, _ = lines[0].split(" ", 2)
+                headers = {
+                    name.strip().lower(): value.strip()
+                    for name, _, value in (line.partition(":") for line in lines[1:] if line)
+                }
+                length = int(headers.get("content-length", 0))
+                if length:
+                    await reader.readexactly(length)
+
+                delay = self._rtt
+                if method not in ("OPTIONS", "HEAD"):
+                    delay += self._server_time
+                await asyncio.sleep(delay)
+                self.requests[method] += 1
+
+                status, extra_headers, body = _handle_fixture_request(
+                    self._directions, self._sessions, method, path
+                )
+                response_headers = {
+                    "Content-Type": "application/json",
+                    "Content-Length": str(len(body)),
+                    **extra_headers,
+                }
+                writer.write(
+                    f"HTTP/1.1 {status} OK\r\n".encode("latin-1")
+                    + "".join(
+                        f"{name}: {value}\r\n" for name, value in response_headers.items()
+                    ).encode("latin-1")
+                    + b"\r\n"
+                    + (b"" if method == "HEAD" else body)
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ssl.SSLError):
+            pass
+        finally:
+            writer.close()
+
+
+class SimulatedNetworkStream(httpcore.AsyncNetworkStream):
+    """Network stream that adds handshake latency to the TLS upgrade."""
+
+    def __init__(self, stream: httpcore.AsyncNetworkStream, rtt: float, tls_rtts: int):
+        self._stream = stream
+        self._rtt = rtt
+        self._tls_rtts = tls_rtts
+
+    async def read(self, max_bytes: int, timeout: Optional[float] = None) -> bytes:
+        return await self._stream.read(max_bytes, timeout=timeout)
+
+    async def write(self, buffer: bytes, timeout: Optional[float] = None) -> None:
+        await self._stream.write(buffer, timeout=timeout)
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+    async def start_tls(
+        self,
+        ssl_context: ssl.SSLContext,
+        server_hostname: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        await asyncio.sleep(self._tls_rtts * self._rtt)
+        return await self._stream.start_tls(
+            ssl_context, server_hostname=server_hostname, timeout=timeout
+        )
+
+    def get_extra_info(self, info: str) -> Any:
+        return self._stream.get_extra_info(info)
+
+
+class SimulatedNetworkBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that sends every connection to the local server.
+
+    Opening a connection costs one round trip for the TCP handshake and
+    ``tls_rtts`` more for the TLS handshake (one with TLS 1.3) on top of
+    the real local handshake.
+    """
+
+    def __init__(self, port: int, rtt_ms: float, tls_rtts: int = 1):
+        """Initialize the backend.
+
+        Args:
+            port: Port of the local server
+            rtt_ms: Network round-trip time
+            tls_rtts: Round trips of the TLS handshake
+        """
+        self._backend = httpcore.AnyIOBackend()
+        self._port = port
+        self._rtt = rtt_ms / 1000
+        self._tls_rtts = tls_rtts
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Any] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        await asyncio.sleep(self._rtt)
+        stream = await self._backend.connect_tcp(
+            host,
+            self._port,
+            timeout=timeout,
+            local_address=local_address,
+            socket_options=socket_options,
+        )
+        return SimulatedNetworkStream(stream, self._rtt, self._tls_rtts)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class StubResolver(CachingDNSBackend):
+    """``CachingDNSBackend`` whose uncached lookups resolve to 127.0.0.1.
+
+    Attributes:
+        lookups: Uncached lookups made so far
+    """
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend, dns_ms: float):
+        """Initialize the resolver.
+
+        Args:
+            backend: Backend that opens the connections
+            dns_ms: Time of an uncached lookup
+        """
+        super().__init__(backend)
+        self._dns = dns_ms / 1000
+        self.lookups = 0
+
+    async def lookup(self, host: str, port: int) -> List[str]:
+        self.lookups += 1
+        await asyncio.sleep(self._dns)
+        return ["127.0.0.1"]
+
+
+class LocalNetwork:
+    """Local TLS server plus the client-side pieces that reach it.
+
+    Use as an async context manager; ``transport()`` builds a fresh
+    ``CachingDNSTransport`` (empty pool, empty DNS cache) per service.
+    """
+
+    def __init__(self, directions: Dict[str, bytes], args: argparse.Namespace):
+        """Initialize the network.
+
+        Args:
+            directions: Directions response body per picklist ID
+            args: Parsed command line arguments
+        """
+        self._directory = tempfile.TemporaryDirectory()
+        cert_path, key_path = create_certificate(self._directory.name)
+        server_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        server_context.load_cert_chain(cert_path, key_path)
+        self._client_context = ssl.create_default_context(cafile=cert_path)
+        self._args = args
+        self.server = LocalSkuVaultServer(
+            directions,
+            sessions_payload(list(directions)),
+            server_context,
+            args.rtt_ms,
+            args.server_ms,
+        )
+
+    async def __aenter__(self) -> "LocalNetwork":
+        await self.server.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.server.close()
+        self._directory.cleanup()
+
+    def transport(self, service: SkuVaultWebService) -> Tuple[CachingDNSTransport, StubResolver]:
+        """Build the service's transport stack pointed at the local server.
+
+        Args:
+            service: Service whose pool limits and HTTP/2 setting are used
+
+        Returns:
+            Tuple of (transport, resolver)
+        """
+        web_settings = service.settings.skuvault.scraping.web
+        limits = httpx.Limits(
+            max_connections=service._get_setting(web_settings, "max_connections", 50),
+            max_keepalive_connections=service._get_setting(
+                web_settings, "max_keepalive_connections", 20
+            ),
+            keepalive_expiry=service._get_setting(
+                web_settings, "keepalive_expiry_seconds", 30.0
+            ),
+        )
+        resolver = StubResolver(
+            SimulatedNetworkBackend(self.server.port, self._args.rtt_ms),
+            self._args.dns_ms,
+        )
+        transport = CachingDNSTransport(
+            resolver, limits, http2=service.http2_enabled, verify=self._client_context
+        )
+        return transport, resolver
+
+
+class OfflineTokenCache:
+    """Token cache that never has a token, so no token store is contacted."""
+
+    async def get_token(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+
+async def create_service(network: LocalNetwork) -> SkuVaultWebService:
+    """Create an authenticated service that sends every request to ``network``.
+
+    Args:
+        network: Local network to build the service's transport stack against
+
+    Returns:
+        Service with a private preflight cache and no shared cache tier
+    """
+    service = SkuVaultWebService()
+    await service.session.aclose()
+    transport, service.dns_cache = network.transport(service)
+    service.session = httpx.AsyncClient(
+        transport=transport,
+        timeout=service.settings.skuvault.scraping.web.request_timeout,
+        follow_redirects=True,
+    )
+    if service.shared_cache is not None:
+        await service.shared_cache.close()
+        service.shared_cache = None
+    service.cors_preflight_cache = PreflightCache()
+    service.token_cache = OfflineTokenCache()
+    service.is_authenticated = True
+    service.auth_token = "bench"
+    return service
+
+
+async def timed(call: Callable[[], Any]) -> float:
+    """Await ``call()`` and return how long it took in milliseconds."""
+    started_at = time.perf_counter()
+    await call()
+    return (time.perf_counter() - started_at) * 1000
+
+
+def bench_decoding(
+    payloads: List[Tuple[str, bytes]], iterations: int, fixtures: str
+) -> Dict[str, Any]:
+    """Compare decoding throughput for directions response bodies.
+
+    Times the stdlib ``json`` module followed by dict validation, ``orjson``
+    followed by dict validation (when installed), and direct
+    ``model_validate_json``, the path ``validate_response`` takes for bytes.
+
+    Args:
+        payloads: Directions response bodies
+        iterations: Number of passes over all payloads per strategy
+        fixtures: Where the bodies came from, reported with the results
+
+    Returns:
+        Milliseconds per pass and megabytes per second for each strategy
+    """
+    strategies: Dict[str, Callable[[bytes], Any]] = {
+        "json_then_model": lambda body: DirectionsResponse.model_validate(json.loads(body)),
+        "validate_json": lambda body: DirectionsResponse.model_validate_json(body),
+    }
+    if orjson is not None:
+        strategies["orjson_then_model"] = lambda body: DirectionsResponse.model_validate(
+            orjson.loads(body)
+        )
+
+    total_bytes = sum(len(body) for _, body in payloads)
+    results: Dict[str, Dict[str, float]] = {}
+    for name, decode in strategies.items():
+        # One untimed pass so lazy schema building is not measured
+        for _, body in payloads:
+            decode(body)
+        started_at = time.perf_counter()
+        for _ in range(iterations):
+            for _, body in payloads:
+                decode(body)
+        elapsed = time.perf_counter() - started_at
+        results[name] = {
+            "ms_per_pass": elapsed / iterations * 1000,
+            "mb_per_second": total_bytes * iterations / elapsed / 1_000_000,
+        }
+
+    return {
+        "fixtures": fixtures,
+        "payloads": len(payloads),
+        "total_bytes": total_bytes,
+        "iterations": iterations,
+        "results": results,
+    }
+
+
+async def bench_preflight(
+    payloads: List[Tuple[str, bytes]], args: argparse.Namespace
+) -> Dict[str, Any]:
+    """Measure the latency saved by caching or skipping CORS preflight.
+
+    Runs on the service's own transport stack against the local server.
+    Times ``get_all_sessions`` and ``get_session_directions`` with a
+    preflight before every call (empty preflight cache), with a warm
+    preflight cache, and with preflight skipped. The directions cache is
+    invalidated before each call so every call reaches the server.
+
+    Args:
+        payloads: Directions response bodies
+        args: Parsed command line arguments
+
+    Returns:
+        Average milliseconds per call for each mode, the savings relative
+        to the cold baseline, and the OPTIONS requests each mode sent
+    """
+    directions = dict(payloads)
+    picklist_id = payloads[0][0]
+    results: Dict[str, Dict[str, float]] = {}
+    options_sent: Dict[str, int] = {}
+
+    async with LocalNetwork(directions, args) as network:
+        for mode in ("cold", "cached", "skip"):
+            service = await create_service(network)
+            service.cors_preflight_mode = "skip" if mode == "skip" else "cached"
+            timings: Dict[str, List[float]] = {
+                "get_all_sessions": [], "get_session_directions": []
+            }
+
+            try:
+                # Untimed calls so every mode starts with open connections
+                await service.get_all_sessions(limit=10)
+                await service.get_session_directions(picklist_id)
+                options_before = network.server.requests["OPTIONS"]
+                for _ in range(args.iterations):
+                    if mode == "cold":
+                        service.cors_preflight_cache = PreflightCache()
+                    timings["get_all_sessions"].append(
+                        await timed(lambda: service.get_all_sessions(limit=10))
+                    )
+
+                    if mode == "cold":
+                        service.cors_preflight_cache = PreflightCache()
+                    service.directions_cache.invalidate(picklist_id)
+                    timings["get_session_directions"].append(
+                        await timed(lambda: service.get_session_directions(picklist_id))
+                    )
+                options_sent[mode] = network.server.requests["OPTIONS"] - options_before
+            finally:
+                await service.aclose()
+
+            results[mode] = {
+                name: sum(values) / len(values) for name, values in timings.items()
+            }
+
+    savings = {
+        mode: {name: results["cold"][name] - results[mode][name] for name in results["cold"]}
+        for mode in ("cached", "skip")
+    }
+    return {
+        "rtt_ms": args.rtt_ms,
+        "server_ms": args.server_ms,
+        "iterations": args.iterations,
+        "avg_ms": results,
+        "saved_ms": savings,
+        "options_sent": options_sent,
+    }
+
+
+async def bench_warmup(
+    payloads: List[Tuple[str, bytes]], args: argparse.Namespace
+) -> Dict[str, Any]:
+    """Measure first-request latency with and without ``warm()``.
+
+    Runs on the service's own transport stack against the local server.
+    Each round starts a fresh service (empty pool, empty DNS cache),
+    optionally warms it, then times its first ``get_all_sessions`` and
+    first ``get_session_directions`` calls. Both calls run concurrently, as
+    they do in the first sync cycle.
+
+    Args:
+        payloads: Directions response bodies
+        args: Parsed command line arguments
+
+    Returns:
+        Average first-call milliseconds, warm-up duration, connections
+        opened and uncached DNS lookups per variant
+    """
+    directions = dict(payloads)
+    picklist_id = payloads[0][0]
+    results: Dict[str, Dict[str, float]] = {}
+
+    async with LocalNetwork(directions, args) as network:
+        for warmed in (False, True):
+            sessions_ms: List[float] = []
+            directions_ms: List[float] = []
+            warm_ms: List[float] = []
+            lookups = 0
+            connections_before = network.server.connections
+            for _ in range(args.iterations):
+                service = await create_service(network)
+                try:
+                    if warmed:
+                        warm = await service.warm()
+                        if warm["errors"]:
+                            raise RuntimeError(f"warm-up failed: {warm['errors']}")
+                        warm_ms.append(warm["duration_ms"])
+                    first_sessions, first_directions = await asyncio.gather(
+                        timed(lambda: service.get_all_sessions(limit=10)),
+                        timed(lambda: service.get_session_directions(picklist_id)),
+                    )
+                    lookups += service.dns_cache.lookups
+                finally:
+                    await service.aclose()
+                sessions_ms.append(first_sessions)
+                directions_ms.append(first_directions)
+
+            results["warmed" if warmed else "cold"] = {
+                "first_get_all_sessions_ms": sum(sessions_ms) / len(sessions_ms),
+                "first_get_session_directions_ms": sum(directions_ms) / len(directions_ms),
+                "warm_duration_ms": sum(warm_ms) / len(warm_ms) if warm_ms else 0.0,
+                "connections_per_round": (
+                    (network.server.connections - connections_before) / args.iterations
+                ),
+                "dns_lookups_per_round": lookups / args.iterations,
+            }
+
+    return {
+        "rtt_ms": args.rtt_ms,
+        "dns_ms": args.dns_ms,
+        "server_ms": args.server_ms,
+        "iterations": args.iterations,
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Run the benchmark named on the command line and print its results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("benchmark", choices=("decoding", "preflight", "warmup"))
+    parser.add_argument("--snapshot", help="directions cache snapshot to take payloads from")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--rtt-ms", type=float, default=50.0, help="simulated round-trip time")
+    parser.add_argument("--server-ms", type=float, default=100.0, help="simulated server time")
+    parser.add_argument("--dns-ms", type=float, default=20.0, help="simulated DNS lookup time")
+    args = parser.parse_args()
+
+    payloads = fixture_payloads(args.snapshot)
+    if args.benchmark == "decoding":
+        result = bench_decoding(
+            payloads, args.iterations, args.snapshot or "generated"
+        )
+    elif args.benchmark == "preflight":
+        result = asyncio.run(bench_preflight(payloads, args))
+    else:
+        result = asyncio.run(bench_warmup(payloads, args))
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()